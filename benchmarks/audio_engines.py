@@ -0,0 +1,119 @@
+"""
+Compare the pydub and NumPy engines of AudioNormalizer and AudioTrimmer.
+
+Synthetic speech-like audio (noise bursts separated by short pauses, with
+leading and trailing silence) is generated in memory for each duration, so
+no fixtures or ffmpeg are needed. For every input the script reports the
+runtime of each engine and the largest sample difference between them.
+
+Usage (from the repository root):
+    python -m benchmarks.audio_engines
+    python -m benchmarks.audio_engines --durations 60 3600 --engines numpy
+
+The pydub trimmer scans the audio one millisecond at a time and takes a
+very long time on multi-hour inputs; pass `--engines numpy` to skip it.
+"""
+
+import argparse
+import time
+
+import numpy as np
+from pydub import AudioSegment, effects
+
+from src.app.pipelines.audio_processing.audio_analysis import (
+    array_to_segment,
+    peak_normalize,
+    segment_to_array,
+    trim_edge_silence,
+)
+
+DEFAULT_DURATIONS = (60, 3600, 6 * 3600)
+SAMPLE_RATE = 16000
+SILENCE_THRESH = -40
+
+
+def synthetic_audio(duration_s: int, seed: int = 0) -> AudioSegment:
+    """Mono 16-bit audio with 2 s of silence at each end and 300 ms pauses."""
+    rng = np.random.default_rng(seed)
+    samples = (rng.standard_normal(duration_s * SAMPLE_RATE) * 2000).astype(np.int16)
+    pause = int(0.3 * SAMPLE_RATE)
+    period = 5 * SAMPLE_RATE
+    for start in range(period, samples.size, period):
+        samples[start : start + pause] = 0
+    edge = min(2 * SAMPLE_RATE, samples.size // 4)
+    samples[:edge] = 0
+    samples[-edge:] = 0
+    return AudioSegment(
+        data=samples.tobytes(), sample_width=2, frame_rate=SAMPLE_RATE, channels=1
+    )
+
+
+def _normalize(audio: AudioSegment, engine: str) -> AudioSegment:
+    if engine == "numpy":
+        return array_to_segment(
+            peak_normalize(segment_to_array(audio), audio.sample_width), audio
+        )
+    return effects.normalize(audio)
+
+
+def _trim(audio: AudioSegment, engine: str) -> AudioSegment:
+    if engine == "numpy":
+        return trim_edge_silence(audio, silence_thresh=SILENCE_THRESH)
+    return audio.strip_silence(silence_thresh=SILENCE_THRESH)
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def _max_difference(left: AudioSegment, right: AudioSegment) -> str:
+    if len(left) != len(right):
+        return f"length {len(left)} vs {len(right)} ms"
+    a = segment_to_array(left).astype(np.int32)
+    b = segment_to_array(right).astype(np.int32)
+    size = min(len(a), len(b))
+    return str(int(np.abs(a[:size] - b[:size]).max())) if size else "0"
+
+
+def run(durations, engines):
+    header = " ".join(f"{engine:>10}" for engine in engines)
+    print(f"{'input':>8} {'operation':>10} {header}  max diff")
+    for duration in durations:
+        audio = synthetic_audio(duration)
+        for name, operation in (("normalize", _normalize), ("trim", _trim)):
+            results, timings = {}, []
+            for engine in engines:
+                results[engine], elapsed = _timed(operation, audio, engine)
+                timings.append(f"{elapsed:>9.2f}s")
+            difference = (
+                _max_difference(results["pydub"], results["numpy"])
+                if len(results) == 2
+                else "-"
+            )
+            row = " ".join(timings)
+            print(f"{duration:>7}s {name:>10} {row}  {difference}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--durations",
+        type=int,
+        nargs="+",
+        default=DEFAULT_DURATIONS,
+        help="Input durations in seconds.",
+    )
+    parser.add_argument(
+        "--engines",
+        nargs="+",
+        choices=("pydub", "numpy"),
+        default=("pydub", "numpy"),
+    )
+    args = parser.parse_args()
+    run(args.durations, args.engines)
+
+
+if __name__ == "__main__":
+    main()
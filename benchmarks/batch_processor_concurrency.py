@@ -0,0 +1,99 @@
+"""
+Measure BatchProcessor speedup from threads on I/O- and CPU-bound items.
+
+Each workload is run three ways: sequentially, on a thread pool with
+`serialize_items=True` (one lock around every item, as BatchProcessor used
+to do), and on a thread pool with items running concurrently.
+
+- io: each item sleeps, standing in for a download or an ffmpeg subprocess.
+- cpu: each item hashes a buffer with SHA-256, which releases the GIL the
+  way audio codecs and NumPy kernels do. Pure-Python work holds the GIL and
+  will not speed up on threads.
+
+Usage (from the repository root):
+    python -m benchmarks.batch_processor_concurrency
+    python -m benchmarks.batch_processor_concurrency --items 64 --threads 16
+"""
+
+import argparse
+import hashlib
+import logging
+import os
+import time
+
+from src.app.core.batch_processor import BatchProcessor
+from src.app.utils.performance_and_progress_tracking import PerformanceTracker
+
+BUFFER = os.urandom(4 * 1024 * 1024)
+
+
+class SleepingProcessor(BatchProcessor):
+    def __init__(self, seconds: float, **kwargs):
+        super().__init__(**kwargs)
+        self.seconds = seconds
+
+    def process_item(self, item):
+        time.sleep(self.seconds)
+
+
+class HashingProcessor(BatchProcessor):
+    def __init__(self, rounds: int, **kwargs):
+        super().__init__(**kwargs)
+        self.rounds = rounds
+
+    def process_item(self, item):
+        for _ in range(self.rounds):
+            hashlib.sha256(BUFFER).digest()
+
+
+def measure(processor: BatchProcessor, items: int) -> float:
+    start = time.perf_counter()
+    processor.process_batch(list(range(items)))
+    return time.perf_counter() - start
+
+
+def run(items: int, threads: int, sleep_seconds: float, hash_rounds: int):
+    logger = logging.getLogger("benchmarks.batch_processor_concurrency")
+    logger.setLevel(logging.WARNING)
+    tracker = PerformanceTracker(logger=logger)
+    modes = (
+        ("sequential", {"use_threads": False}),
+        ("threads, serialized", {"use_threads": True, "serialize_items": True}),
+        ("threads, concurrent", {"use_threads": True}),
+    )
+    workloads = (
+        ("io", SleepingProcessor, {"seconds": sleep_seconds}),
+        ("cpu", HashingProcessor, {"rounds": hash_rounds}),
+    )
+
+    print(f"{items} items, {threads} threads")
+    for name, processor_class, params in workloads:
+        baseline = None
+        for label, options in modes:
+            processor = processor_class(
+                batch_size=threads,
+                logger=logger,
+                perf_tracker=tracker,
+                **params,
+                **options,
+            )
+            elapsed = measure(processor, items)
+            baseline = baseline or elapsed
+            print(
+                f"{name:>4} {label:>20}: {elapsed:>7.2f}s "
+                f"({baseline / elapsed:>5.2f}x)"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=32)
+    parser.add_argument("--threads", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--sleep-seconds", type=float, default=0.1)
+    parser.add_argument("--hash-rounds", type=int, default=8)
+    args = parser.parse_args()
+    run(args.items, args.threads, args.sleep_seconds, args.hash_rounds)
+
+
+if __name__ == "__main__":
+    main()
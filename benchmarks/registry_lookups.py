@@ -0,0 +1,101 @@
+"""
+Measure registry lookup throughput under concurrent readers.
+
+Compares GenericRegistry.get, which reads a copy-on-write snapshot without
+locking, logging or tracking, against the previous lookup path that took the
+registry lock, opened a PerformanceTracker context and logged every call.
+Each thread repeatedly looks up names from a registry of `--items` entries.
+
+Usage (from the repository root):
+    python -m benchmarks.registry_lookups
+    python -m benchmarks.registry_lookups --threads 16 --lookups 200000
+"""
+
+import argparse
+import logging
+import threading
+import time
+
+from src.app.utils.performance_and_progress_tracking import PerformanceTracker
+from src.infrastructure.registries.generic_registry import GenericRegistry
+
+
+class SnapshotRegistry(GenericRegistry[object]):
+    def validate_item(self, item: object) -> bool:
+        return True
+
+
+class LockedRegistry(SnapshotRegistry):
+    """The lookup path before copy-on-write snapshots."""
+
+    def get(self, name: str) -> object:
+        with self._lock, self.tracker.track_execution("Get Item"):
+            if name not in self._registry:
+                raise ValueError(f"Item '{name}' is not registered.")
+            self.logger.info(f"Retrieved item with name: '{name}'.")
+            return self._registry[name]
+
+
+def _make_logger() -> logging.Logger:
+    # INFO with a handler that discards records, so message formatting and
+    # handler dispatch are paid as in production but nothing is printed.
+    logger = logging.getLogger("benchmarks.registry_lookups")
+    logger.setLevel(logging.INFO)
+    logger.handlers = [logging.NullHandler()]
+    logger.propagate = False
+    return logger
+
+
+def _build(registry_class, items: int):
+    logger = _make_logger()
+    registry = registry_class(logger=logger, tracker=PerformanceTracker(logger=logger))
+    for index in range(items):
+        registry.register(f"item-{index}", object())
+    return registry
+
+
+def _lookups_per_second(registry, threads: int, lookups: int, items: int) -> float:
+    names = [f"item-{index}" for index in range(items)]
+    barrier = threading.Barrier(threads + 1)
+
+    def reader():
+        get = registry.get
+        barrier.wait()
+        for index in range(lookups):
+            get(names[index % items])
+
+    workers = [threading.Thread(target=reader) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return threads * lookups / (time.perf_counter() - start)
+
+
+def run(threads: int, lookups: int, items: int):
+    print(f"{threads} threads x {lookups} lookups over {items} items")
+    results = {}
+    for label, registry_class in (
+        ("locked (before)", LockedRegistry),
+        ("snapshot (after)", SnapshotRegistry),
+    ):
+        registry = _build(registry_class, items)
+        results[label] = _lookups_per_second(registry, threads, lookups, items)
+        print(f"{label:>18}: {results[label]:>14,.0f} lookups/s")
+    before, after = results.values()
+    print(f"{'speedup':>18}: {after / before:>14.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--lookups", type=int, default=100_000)
+    parser.add_argument("--items", type=int, default=32)
+    args = parser.parse_args()
+    run(args.threads, args.lookups, args.items)
+
+
+if __name__ == "__main__":
+    main()
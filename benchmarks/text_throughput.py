@@ -0,0 +1,102 @@
+"""
+Measure sentence segmentation and tokenization throughput.
+
+A synthetic transcript corpus (random sentences from a fixed vocabulary,
+~64 KB per document) is generated lazily and fed to TextSegmenter and
+TextTokenizer in bounded batches, so the corpus never sits in memory at
+once. Each stage is run on one core and on a process pool, and the
+throughput of each is reported in MB/s.
+
+Usage (from the repository root):
+    python -m benchmarks.text_throughput
+    python -m benchmarks.text_throughput --size-mb 100 --workers 8
+"""
+
+import argparse
+import logging
+import os
+import random
+import time
+from itertools import islice
+
+from src.app.pipelines.text_processing.text_segmenter import TextSegmenter
+from src.app.pipelines.text_processing.text_tokenizer import TextTokenizer
+from src.app.utils.performance_and_progress_tracking import PerformanceTracker
+
+DOCUMENT_BYTES = 64 * 1024
+WORDS = (
+    "the we so and um I think that was really you know what it is model audio "
+    "transcript meeting next week okay right data because when they said "
+    "Dr. Smith at 3 p.m. going to be fine yeah well actually maybe"
+).split()
+
+
+def synthetic_documents(size_mb: int, seed: int = 0):
+    """Yield ~64 KB documents until `size_mb` megabytes have been produced."""
+    rng = random.Random(seed)
+    remaining = size_mb * 1024 * 1024
+    while remaining > 0:
+        sentences, length = [], 0
+        while length < min(DOCUMENT_BYTES, remaining):
+            words = rng.choices(WORDS, k=rng.randint(4, 25))
+            sentence = " ".join(words).capitalize() + rng.choice(".?!")
+            sentences.append(sentence)
+            length += len(sentence) + 1
+        remaining -= length
+        yield " ".join(sentences)
+
+
+def _batches(documents, size):
+    while True:
+        batch = list(islice(documents, size))
+        if not batch:
+            return
+        yield batch
+
+
+def measure(processor, size_mb: int, workers: int, batch_docs: int) -> float:
+    processed = 0
+    start = time.perf_counter()
+    for batch in _batches(synthetic_documents(size_mb), batch_docs):
+        processor.process_many(batch, workers=workers)
+        processed += sum(len(document) for document in batch)
+    elapsed = time.perf_counter() - start
+    processor.close()
+    return processed / (1024 * 1024) / elapsed
+
+
+def run(size_mb: int, workers: int, batch_docs: int, skip_single: bool):
+    logger = logging.getLogger("benchmarks.text_throughput")
+    logger.setLevel(logging.WARNING)
+    tracker = PerformanceTracker(logger=logger)
+    modes = [(f"{workers} processes", workers)]
+    if not skip_single:
+        modes.insert(0, ("1 core", 1))
+
+    print(f"{size_mb} MB corpus, {batch_docs} documents per batch")
+    for name, processor_class in (
+        ("segmentation", TextSegmenter),
+        ("tokenization", TextTokenizer),
+    ):
+        for label, count in modes:
+            processor = processor_class(logger=logger, tracker=tracker)
+            throughput = measure(processor, size_mb, count, batch_docs)
+            print(f"{name:>13} {label:>14}: {throughput:>8.2f} MB/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-mb", type=int, default=1024)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--batch-docs", type=int, default=256)
+    parser.add_argument(
+        "--skip-single",
+        action="store_true",
+        help="Skip the single-core baseline, which is slow on large corpora.",
+    )
+    args = parser.parse_args()
+    run(args.size_mb, args.workers, args.batch_docs, args.skip_single)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""
+Compare transcription speed and memory across CPU compute types.
+
+Each compute type runs in a fresh subprocess so peak memory is not shared
+between modes. The subprocess loads the model through the same factories
+ModelLoader uses, transcribes the fixture once to warm up and then
+`--repeats` more times, and reports:
+
+    load     model load time in seconds
+    rtf      real-time factor: transcription time / audio duration
+    peak     peak resident memory of the process
+
+Usage (from the repository root):
+    python -m benchmarks.transcription_compute_types --audio path/to/clip.wav
+    python -m benchmarks.transcription_compute_types --backend whisper \\
+        --compute-types int8 float32 --size small
+
+The fixture defaults to benchmarks/fixtures/transcription_sample.wav, which
+is synthesized on first run when missing: 60 seconds of seeded, speech-like
+voiced bursts and pauses, identical on every machine. It gives comparable
+numbers across modes; pass a real speech recording of a minute or more with
+`--audio` for numbers closer to production.
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+import wave
+
+import numpy as np
+
+from src.app.modules.transcription_models import TRANSCRIPTION_MODEL_FACTORIES
+from src.app.pipelines.audio_processing.audio_stream import (
+    MODEL_SAMPLE_RATE,
+    decode_to_array,
+)
+from src.infrastructure.registries.model_registry import COMPUTE_TYPES
+
+DEFAULT_AUDIO = os.path.join(
+    os.path.dirname(__file__), "fixtures", "transcription_sample.wav"
+)
+FIXTURE_SECONDS = 60
+FIXTURE_SEED = 20240501
+
+
+def synthesize_fixture(path: str, seconds: int = FIXTURE_SECONDS):
+    """
+    Write a deterministic 16 kHz mono 16-bit WAV of speech-like audio:
+    syllable-length bursts of a harmonic voice with shifting pitch and
+    formant weights, separated by short gaps and longer phrase pauses.
+    """
+    rng = np.random.default_rng(FIXTURE_SEED)
+    total = seconds * MODEL_SAMPLE_RATE
+    audio = np.zeros(total, dtype=np.float32)
+    position = 0
+    while position < total:
+        for _ in range(rng.integers(4, 10)):  # One phrase
+            if position >= total:
+                break
+            length = int(rng.uniform(0.12, 0.3) * MODEL_SAMPLE_RATE)
+            t = np.arange(length) / MODEL_SAMPLE_RATE
+            pitch = rng.uniform(100, 220) * (1 + 0.1 * t / t[-1])
+            weights = rng.uniform(0.1, 1.0, size=8)
+            burst = sum(
+                w * np.sin(2 * np.pi * pitch * (k + 1) * t)
+                for k, w in enumerate(weights)
+            )
+            burst *= np.hanning(length) / weights.sum()
+            end = min(position + length, total)
+            audio[position:end] = burst[: end - position]
+            position = end + int(rng.uniform(0.04, 0.12) * MODEL_SAMPLE_RATE)
+        position += int(rng.uniform(0.4, 0.9) * MODEL_SAMPLE_RATE)
+
+    audio += rng.normal(0, 0.003, size=total).astype(np.float32)  # Room noise
+    pcm = (np.clip(audio * 0.5, -1, 1) * 32767).astype("<i2")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with wave.open(path, "wb") as file:
+        file.setnchannels(1)
+        file.setsampwidth(2)
+        file.setframerate(MODEL_SAMPLE_RATE)
+        file.writeframes(pcm.tobytes())
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024**2) if sys.platform == "darwin" else peak / 1024
+
+
+def measure(backend: str, size: str, compute_type: str, audio_path: str, repeats):
+    """Runs inside the subprocess; returns the measurements for one mode."""
+    audio = decode_to_array(audio_path)
+    duration = len(audio) / MODEL_SAMPLE_RATE
+
+    started = time.perf_counter()
+    model = TRANSCRIPTION_MODEL_FACTORIES[backend](size, "cpu", compute_type)
+    load_seconds = time.perf_counter() - started
+
+    model.transcribe(audio)  # Warm-up.
+    started = time.perf_counter()
+    for _ in range(repeats):
+        model.transcribe(audio)
+    elapsed = (time.perf_counter() - started) / repeats
+
+    return {
+        "compute_type": compute_type,
+        "load": load_seconds,
+        "rtf": elapsed / duration,
+        "peak_mb": _peak_rss_mb(),
+    }
+
+
+def run(backend, size, compute_types, audio_path, repeats):
+    if not os.path.exists(audio_path):
+        if audio_path != DEFAULT_AUDIO:
+            sys.exit(f"Audio fixture not found: {audio_path}")
+        print(f"Synthesizing {FIXTURE_SECONDS}s fixture at {audio_path}")
+        synthesize_fixture(audio_path)
+    print(f"{backend} '{size}' on {os.path.basename(audio_path)}")
+    print(f"{'compute type':>14} {'load':>8} {'rtf':>8} {'peak':>10}")
+    for compute_type in compute_types:
+        command = [
+            sys.executable,
+            "-m",
+            "benchmarks.transcription_compute_types",
+            "--worker",
+            "--backend",
+            backend,
+            "--size",
+            size,
+            "--compute-types",
+            compute_type,
+            "--audio",
+            audio_path,
+            "--repeats",
+            str(repeats),
+        ]
+        result = subprocess.run(command, capture_output=True, text=True)
+        if result.returncode != 0:
+            print(f"{compute_type:>14} failed: {result.stderr.strip()[-200:]}")
+            continue
+        row = json.loads(result.stdout.strip().splitlines()[-1])
+        print(
+            f"{compute_type:>14} {row['load']:>7.2f}s {row['rtf']:>8.3f} "
+            f"{row['peak_mb']:>8.0f}MB"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--backend", choices=sorted(TRANSCRIPTION_MODEL_FACTORIES), default="whisperx"
+    )
+    parser.add_argument("--size", default="base")
+    parser.add_argument(
+        "--compute-types", nargs="+", choices=COMPUTE_TYPES, default=COMPUTE_TYPES
+    )
+    parser.add_argument("--audio", default=DEFAULT_AUDIO)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        row = measure(
+            args.backend, args.size, args.compute_types[0], args.audio, args.repeats
+        )
+        print(json.dumps(row))
+        return
+    run(args.backend, args.size, args.compute_types, args.audio, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
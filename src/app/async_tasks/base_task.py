@@ -3,6 +3,7 @@ from abc import ABC, abstractmethod
 from dependency_injector.wiring import Provide, inject
 
 from src.app.async_tasks.observers.logger_observer import LoggerObserver
+from src.app.core.memory_monitor import task_scope
 from src.infrastructure.app.app_container import AppContainer
 
 
@@ -36,7 +37,8 @@ class BaseTask(ABC):
             self.logger.info(f"Task started: {func.__name__}")
             self.tracker.track_execution_start(func.__name__, **kwargs)
 
-            result = func(*args, **kwargs)
+            with task_scope(self.task_label(func, args, kwargs)):
+                result = func(*args, **kwargs)
 
             self.notify_observers(
                 "task_completed", {"function": func.__name__, "result": result}
@@ -49,6 +51,15 @@ class BaseTask(ABC):
         except Exception as e:
             self.handle_critical_error(func.__name__, e)
 
+    def task_label(self, func, args: tuple, kwargs: dict) -> str:
+        """
+        Label MemoryMonitor attributes this task's memory to. Tasks take the
+        file or URL they work on as their first argument, so it is included.
+        """
+        if args:
+            return f"{func.__name__}:{args[0]}"
+        return func.__name__
+
     def handle_recoverable_error(self, function_name: str, error: Exception):
         self.logger.error(f"Recoverable error in {function_name}: {error}")
         self.tracker.track_execution_error(function_name, error=str(error))
@@ -1,6 +1,8 @@
 from celery import Celery
+from celery.signals import worker_process_init
 from dependency_injector.wiring import Provide, inject
 
+from src.app.modules.transcription_model_loader import warm_up_worker_models
 from src.infrastructure.app.app_container import AppContainer
 from src.infrastructure.app.configuration_registry import ConfigurationRegistry
 
@@ -55,5 +57,14 @@ def create_celery_app(
     return celery_app
 
 
+@worker_process_init.connect
+def warm_up_models(**kwargs):
+    """
+    Start loading transcription models in the background as soon as a
+    worker process forks, instead of inside its first task.
+    """
+    warm_up_worker_models()
+
+
 # Create and expose the Celery app instance
 celery_app = create_celery_app()
@@ -0,0 +1,24 @@
+from dask.distributed import WorkerPlugin
+
+from src.app.modules.transcription_model_loader import (
+    DEFAULT_WARMUP_MODELS,
+    warm_up_worker_models,
+)
+
+
+class ModelWarmupPlugin(WorkerPlugin):
+    """
+    Starts loading transcription models in the background when a Dask worker
+    starts, so the first task does not pay the cold-start cost.
+
+    Usage:
+        client.register_plugin(ModelWarmupPlugin())
+    """
+
+    name = "model-warmup"
+
+    def __init__(self, model_names=DEFAULT_WARMUP_MODELS):
+        self.model_names = tuple(model_names)
+
+    def setup(self, worker):
+        warm_up_worker_models(self.model_names)
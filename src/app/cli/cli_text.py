@@ -3,15 +3,26 @@ import click
 from src.app.cli.commands.base_command import BaseCommand
 
 
-@click.group()
+@click.group(chain=True)
 def cli():
-    """CLI for the Text Processing Pipeline."""
+    """
+    CLI for the Text Processing Pipeline.
+
+    Commands can be chained in one invocation, e.g.
+    `load --input-dir raw --stream process --async_tasks all save --output-dir out`.
+    """
     pass
 
 
 @cli.command(cls=BaseCommand)
 @click.option("--input-dir", required=True, help="Directory containing raw text files.")
-def load(ctx, input_dir):
+@click.option(
+    "--stream",
+    is_flag=True,
+    help="Read files lazily during save instead of loading them all into memory.",
+)
+@click.pass_context
+def load(ctx, input_dir, stream):
     """
     Load text files for processing.
     """
@@ -19,6 +30,11 @@ def load(ctx, input_dir):
     text_handler = ctx.command.text_handler
 
     files = file_utility.list_files(input_dir, extensions=(".txt",))
+    if stream:
+        text_handler.open_stream(files)
+        click.echo(f"Opened stream over {len(files)} files in {input_dir}.")
+        return
+
     for file in files:
         text_handler.load(file)
 
@@ -27,13 +43,23 @@ def load(ctx, input_dir):
 
 @cli.command(cls=BaseCommand)
 @click.option(
-    "--async_tasks", default="all", help="Tasks to run: tokenization, segmentation, ner."
+    "--async_tasks",
+    "tasks",
+    default="all",
+    help="Tasks to run: tokenization, segmentation, ner.",
 )
+@click.pass_context
 def process(ctx, tasks):
     """
     Process text with the specified async_tasks.
     """
     text_handler = ctx.command.text_handler
+    if text_handler.streaming:
+        # Runs lazily, one batch at a time, when save pulls the stream.
+        text_handler.set_stream_tasks(tasks)
+        click.echo(f"Streaming async_tasks: {tasks}.")
+        return
+
     text_handler.process_tasks(tasks)
 
     click.echo(f"Processed async_tasks: {tasks}.")
@@ -41,14 +67,34 @@ def process(ctx, tasks):
 
 @cli.command(cls=BaseCommand)
 @click.option("--output-dir", required=True, help="Directory to save processed files.")
-@click.option("--format", default="csv", help="Output format (csv, json).")
-def save(ctx, output_dir, format):
+@click.option(
+    "--format",
+    default="csv",
+    help="Output format: csv, json, or parquet (streaming only).",
+)
+@click.option(
+    "--batch-size", default=8, help="Documents processed together when streaming."
+)
+@click.pass_context
+def save(ctx, output_dir, format, batch_size):
     """
     Save processed text files.
     """
     file_utility = ctx.command.file_utility
     text_handler = ctx.command.text_handler
 
+    if text_handler.streaming:
+        saved = sum(1 for _ in text_handler.save_stream(output_dir, format, batch_size))
+        click.echo(f"Streamed {saved} files to {output_dir} in {format} format.")
+        return
+
+    if format == "parquet":
+        # Only the streaming path produces the sentences and entities the
+        # Parquet schemas describe; in-memory data is plain text.
+        raise click.BadParameter(
+            "parquet output requires 'load --stream'.", param_hint="--format"
+        )
+
     processed_data = text_handler.get_processed_data()
     for index, data in enumerate(processed_data):
         file_path = f"{output_dir}/processed_file_{index}.{format}"
@@ -3,7 +3,7 @@ import click
 from src.app.cli.commands.base_command import BaseCommand
 
 
-@click.group(cls=BaseCommand)
+@click.group()
 def cli():
     """CLI for Transcription Tasks."""
     pass
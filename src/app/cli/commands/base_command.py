@@ -19,6 +19,8 @@ class BaseCommand(click.Command):
         audio_processor=Provide[AppContainer.audio_processor],
         downloader=Provide[AppContainer.downloader],
         transcription_pipeline=Provide[AppContainer.transcription_pipeline],
+        text_handler=Provide[AppContainer.text_handler],
+        file_utility=Provide[AppContainer.file_utility],
         **kwargs,
     ):
         super().__init__(*args, **kwargs)
@@ -27,6 +29,8 @@ class BaseCommand(click.Command):
         self.audio_processor = audio_processor
         self.downloader = downloader
         self.transcription_pipeline = transcription_pipeline
+        self.text_handler = text_handler
+        self.file_utility = file_utility
 
     def invoke(self, ctx):
         """Override Click's invoke to include performance tracking."""
@@ -1,4 +1,12 @@
-from .batch_processor import BatchProcessor
-from .memory_monitor import MemoryMonitor
+from .batch_processor import BatchProcessor, FunctionBatchProcessor
+from .concurrency_controller import ConcurrencyController
+from .memory_monitor import MemoryMonitor, TaskMemoryPeak, task_scope
 
-__all__ = ["BatchProcessor", "MemoryMonitor"]
+__all__ = [
+    "BatchProcessor",
+    "ConcurrencyController",
+    "FunctionBatchProcessor",
+    "MemoryMonitor",
+    "TaskMemoryPeak",
+    "task_scope",
+]
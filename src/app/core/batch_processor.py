@@ -1,22 +1,121 @@
+import logging
+import os
+import pickle
 import traceback
 from abc import ABC, abstractmethod
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import contextmanager
+from itertools import islice
 from threading import Lock
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 from dependency_injector.wiring import Provide, inject
 
-from src.infrastructure.app.app_container import AppContainer
+from src.app.utils.performance_and_progress_tracking import PerformanceTracker
+
+EXECUTORS = ("sequential", "threads", "processes", "hybrid")
+
+# The processor copy owned by a pool process, set once by `_init_worker`.
+_worker_processor = None
+
+
+def _init_worker(processor):
+    """Pool initializer: keep this process's processor and load its resources."""
+    global _worker_processor
+    _worker_processor = processor
+    processor.init_worker()
+
+
+def _run_in_worker(item):
+    try:
+        with _worker_processor._item_lock(item):
+            return _worker_processor.process_item(item), None
+    except Exception as e:
+        # Tracebacks do not survive pickling; send the worker's as text.
+        remote_traceback = traceback.format_exc()
+        try:
+            e.remote_traceback = remote_traceback
+            pickle.dumps(e)
+        except Exception:
+            e = RuntimeError(f"{type(e).__name__}: {e}")
+            e.remote_traceback = remote_traceback
+        return None, e
+
+
+def _process_chunk(chunk: list, threads: int) -> list:
+    """
+    Process a chunk of items in a pool process, on `threads` threads, and
+    return one (result, exception) pair per item so a failure does not
+    discard the rest of the chunk.
+    """
+    if threads <= 1:
+        return [_run_in_worker(item) for item in chunk]
+    with ThreadPoolExecutor(max_workers=min(threads, len(chunk))) as executor:
+        return list(executor.map(_run_in_worker, chunk))
+
+
+def _chunks(items: Iterator, size: int) -> Iterator[list]:
+    while True:
+        chunk = list(islice(items, size))
+        if not chunk:
+            return
+        yield chunk
 
 
 class BatchProcessor(ABC):
+    """
+    Runs `process_item` over a batch of items on one of the EXECUTORS:
+
+    - "sequential": one item at a time in the calling thread.
+    - "threads": a thread pool of `batch_size` threads, for I/O-bound items.
+    - "processes": up to `batch_size` processes, for CPU-bound items that
+      hold the GIL (NLTK/spaCy, pure-Python encoding).
+    - "hybrid": a process pool where each process also runs
+      `threads_per_process` threads, for items that mix both.
+
+    The backend is chosen per call (`process_batch(items, executor=...)`),
+    per instance (`executor=`), or per subclass (the `executor` class
+    attribute), in that order; `use_threads=True` selects "threads".
+
+    `process_batch` takes a list and returns every result. `process_stream`
+    takes any iterable, keeps a bounded number of items in flight and yields
+    results as they finish, so unbounded backlogs run in constant memory.
+
+    With threads, items run concurrently: `process_item` must be thread-safe.
+    Subclasses that are not can opt into locking instead of giving up threads:
+
+    - `serialize_items=True` runs one item at a time (the old behaviour).
+    - Overriding `item_lock_key` serializes only items that share a key
+      (e.g. the same output file), while items with different keys, or with
+      the key None, still run in parallel.
+
+    Locks only cover the threads of one process. Process backends pickle the
+    processor into each worker once, without its logger, tracker or locks,
+    and send items in chunks of `chunksize`; heavy resources (models) should
+    be loaded in `init_worker`, which runs once per worker process. Items,
+    results and exceptions must be picklable.
+    """
+
+    executor = "sequential"
+
     @inject
     def __init__(
         self,
         batch_size: int = 10,
         use_threads: bool = False,
         timeout: int = None,
-        logger=Provide[AppContainer.logger],
-        perf_tracker=Provide[AppContainer.performance_tracker],
+        serialize_items: bool = False,
+        executor: Optional[str] = None,
+        chunksize: int = 16,
+        threads_per_process: int = 4,
+        concurrency_controller=None,
+        logger=Provide["logger"],
+        perf_tracker=Provide["performance_tracker"],
     ):
         """
         Initialize BatchProcessor.
@@ -25,11 +124,29 @@ class BatchProcessor(ABC):
             batch_size (int): Number of workers/threads in the pool.
             use_threads (bool): Whether to process items using threading.
             timeout (int): Timeout for each thread (in seconds).
+            serialize_items (bool): Hold one lock around every `process_item`
+                call, for subclasses that are not thread-safe.
+            executor (str): One of EXECUTORS; overrides `use_threads` and the
+                class default.
+            chunksize (int): Items sent to a worker process per submission.
+            threads_per_process (int): Threads in each process for "hybrid".
+            concurrency_controller (ConcurrencyController): Caps the tasks
+                in flight at its current `limit` and is told about every
+                completed item, so it can adapt the limit at run time.
         """
+        if executor is None and use_threads:
+            executor = "threads"
         self.batch_size = batch_size
         self.use_threads = use_threads
         self.timeout = timeout
-        self._lock = Lock()  # Thread-safe lock
+        self.serialize_items = serialize_items
+        self.executor = self._validate_executor(executor or self.executor)
+        self.chunksize = max(chunksize, 1)
+        self.threads_per_process = max(threads_per_process, 1)
+        self.concurrency_controller = concurrency_controller
+        self._lock = Lock()  # Guards _item_locks; held per item only if serializing
+        self._item_locks = {}  # key -> [lock, holders and waiters]
+        self._process_pool: Optional[ProcessPoolExecutor] = None
         self.logger = logger
         self.perf_tracker = perf_tracker
 
@@ -41,18 +158,73 @@ class BatchProcessor(ABC):
         """
         pass
 
-    def process_batch(self, items):
+    def init_worker(self):
+        """
+        Called once in each worker process before it processes any item.
+        Override to load heavy resources (models, tokenizers) per process.
+        """
+        return None
+
+    def item_lock_key(self, item):
+        """
+        Return a key for items that must not be processed at the same time,
+        or None (the default) to let the item run concurrently with any other.
+        """
+        return None
+
+    @contextmanager
+    def _item_lock(self, item):
+        """
+        Hold the lock for `item`'s key while the block runs. Per-key locks are
+        reference-counted and dropped once no item holds or waits for them,
+        so an unbounded stream of distinct keys does not accumulate locks.
+        """
+        if self.serialize_items:
+            with self._lock:
+                yield
+            return
+        key = self.item_lock_key(item)
+        if key is None:
+            yield
+            return
+        with self._lock:
+            entry = self._item_locks.setdefault(key, [Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._item_locks[key]
+
+    @staticmethod
+    def _validate_executor(executor: str) -> str:
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor '{executor}'. Expected {EXECUTORS}.")
+        return executor
+
+    def process_batch(self, items, executor: Optional[str] = None) -> List:
         """
-        Process a batch of items either sequentially or using threads.
+        Process a batch of items on the configured executor backend.
 
         Args:
             items (list): List of items to process.
+            executor (str): Backend for this call only; one of EXECUTORS.
+
+        Returns:
+            list: The result of `process_item` for each item, in input order;
+            None for items that failed.
         """
+        executor = self._validate_executor(executor or self.executor)
+        items = list(items)
         with self.perf_tracker.track_execution("Batch Processing"):
-            if self.use_threads:
-                self._process_with_threads(items)
-            else:
-                self._process_sequentially(items)
+            if not items:
+                return []
+            if executor == "sequential":
+                return self._process_sequentially(items)
+            return self._process_concurrently(items, executor)
 
     def _process_sequentially(self, items):
         """
@@ -62,43 +234,188 @@ class BatchProcessor(ABC):
             items (list): List of items to process.
         """
         total_items = len(items)
+        results = [None] * total_items
         for idx, item in enumerate(items, start=1):
             try:
-                with self._lock, self.perf_tracker.track_execution(f"Processing Item: {item}"):
-                    self.process_item(item)
+                with self._item_lock(item), self.perf_tracker.track_execution(
+                    f"Processing Item: {item}"
+                ):
+                    results[idx - 1] = self.process_item(item)
                 self.logger.info(f"Item {idx}/{total_items} processed successfully: {item}")
             except Exception as e:
                 self._handle_processing_exception(item, e)
+        return results
 
-    def _process_with_threads(self, items):
+    def process_stream(
+        self,
+        items: Iterable,
+        max_in_flight: Optional[int] = None,
+        ordered: bool = False,
+        executor: Optional[str] = None,
+    ) -> Iterator[Tuple]:
         """
-        Process items using a thread pool.
+        Process any iterable, including generators too large to hold in
+        memory, pulling items only as capacity frees up.
+
+        Args:
+            items (iterable): Items to process; consumed lazily.
+            max_in_flight (int): Most items submitted but not yet yielded
+                (default: two per worker thread, or two chunks per worker
+                process), which bounds memory however long the stream is.
+            ordered (bool): Yield in input order instead of completion order.
+                A slow item then holds back later ones, still within
+                `max_in_flight`.
+            executor (str): Backend for this call only; one of EXECUTORS.
+
+        Yields:
+            tuple: (item, result) as items complete. Failed items are logged
+            and yield (item, None).
+        """
+        executor = self._validate_executor(executor or self.executor)
+        completed = 0
+        for item, result, error in self._stream(
+            items, executor, max_in_flight, ordered
+        ):
+            if error is not None:
+                self._handle_processing_exception(item, error)
+            else:
+                completed += 1
+                self.logger.info(f"Item {completed} processed successfully: {item}")
+            yield item, result
+
+    def _process_concurrently(self, items, executor: str):
+        """
+        Process a batch on a pool backend, collecting results in input order.
 
         Args:
             items (list): List of items to process.
+            executor (str): "threads", "processes" or "hybrid".
         """
         total_items = len(items)
-        with ThreadPoolExecutor(max_workers=min(self.batch_size, total_items)) as executor:
-            futures = {
-                executor.submit(self._threaded_process_item, item): item
-                for item in items
-            }
-
-            completed = 0
-            for future in as_completed(futures, timeout=self.timeout):
-                item = futures[future]
-                try:
-                    future.result()  # Raises exception if the task failed
-                    completed += 1
-                    self.logger.info(f"Item {completed}/{total_items} processed successfully: {item}")
-                except Exception as e:
-                    self._handle_processing_exception(item, e)
-
+        results = []
+        completed = 0
+        for item, result, error in self._stream(items, executor, None, ordered=True):
+            results.append(result)
+            if error is not None:
+                self._handle_processing_exception(item, error)
+                continue
+            completed += 1
             self.logger.info(
-                f"Batch processing completed: "
-                f"{completed}/{total_items} items processed."
+                f"Item {completed}/{total_items} processed successfully: {item}"
             )
 
+        self.logger.info(
+            f"Batch processing completed: "
+            f"{completed}/{total_items} items processed."
+        )
+        return results
+
+    def _stream(
+        self,
+        items: Iterable,
+        executor: str,
+        max_in_flight: Optional[int],
+        ordered: bool,
+    ) -> Iterator[Tuple]:
+        """
+        Keep at most `max_in_flight` items submitted to the backend and yield
+        (item, result, exception) for each as its chunk finishes. Threads
+        take one item per task; processes take `chunksize` items. With a
+        concurrency controller, tasks in flight are also capped at its limit,
+        re-read every time a task finishes.
+        """
+        items = iter(items)
+        if executor == "sequential":
+            for item in items:
+                ((result, error),) = self._run_chunk([item])
+                yield item, result, error
+            return
+
+        if executor == "threads":
+            chunksize = 1
+            pool = ThreadPoolExecutor(max_workers=self.batch_size)
+
+            def submit(chunk):
+                return pool.submit(self._run_chunk, chunk)
+
+        else:
+            chunksize = self.chunksize
+            threads = self.threads_per_process if executor == "hybrid" else 1
+            process_pool = self._get_process_pool()
+
+            def submit(chunk):
+                return process_pool.submit(_process_chunk, chunk, threads)
+
+        if max_in_flight is None:
+            max_in_flight = 2 * self.batch_size * chunksize
+        max_tasks = max(max_in_flight // chunksize, 1)
+        chunks = _chunks(items, chunksize)
+        pending = {}  # future -> (sequence, chunk)
+        finished = {}  # sequence -> (chunk, outcomes), not yet yielded
+        submitted = yielded = 0  # Chunks; their difference is tasks in flight
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and (
+                    submitted - yielded < self._task_limit(max_tasks)
+                ):
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        exhausted = True
+                        break
+                    pending[submit(chunk)] = (submitted, chunk)
+                    submitted += 1
+                if not pending:
+                    return
+
+                done, _ = wait(
+                    pending, timeout=self.timeout, return_when=FIRST_COMPLETED
+                )
+                if not done:
+                    raise TimeoutError(f"No item finished within {self.timeout}s.")
+                for future in done:
+                    sequence, chunk = pending.pop(future)
+                    try:
+                        outcomes = future.result()
+                    except Exception as e:  # Worker died or chunk failed to pickle
+                        outcomes = [(None, e)] * len(chunk)
+                    finished[sequence] = (chunk, outcomes)
+
+                if ordered:
+                    ready = []
+                    while yielded in finished:
+                        ready.append(finished.pop(yielded))
+                        yielded += 1
+                else:
+                    ready = list(finished.values())
+                    yielded += len(ready)
+                    finished.clear()
+                for chunk, outcomes in ready:
+                    if self.concurrency_controller is not None:
+                        self.concurrency_controller.record_completion(len(chunk))
+                    for item, (result, error) in zip(chunk, outcomes, strict=True):
+                        yield item, result, error
+        finally:
+            for future in pending:
+                future.cancel()
+            if executor == "threads":
+                pool.shutdown(wait=False, cancel_futures=True)
+
+    def _task_limit(self, max_tasks: int) -> int:
+        if self.concurrency_controller is None:
+            return max_tasks
+        return max(min(max_tasks, self.concurrency_controller.limit), 1)
+
+    def _run_chunk(self, chunk: list) -> list:
+        """Process a chunk in this process; one (result, exception) per item."""
+        outcomes = []
+        for item in chunk:
+            try:
+                outcomes.append((self._threaded_process_item(item), None))
+            except Exception as e:
+                outcomes.append((None, e))
+        return outcomes
+
     def _threaded_process_item(self, item):
         """
         Process a single item in a thread.
@@ -106,8 +423,48 @@ class BatchProcessor(ABC):
         Args:
             item: Item to process.
         """
-        with self._lock, self.perf_tracker.track_execution(f"Threaded Processing Item: {item}"):
-            self.process_item(item)
+        with self._item_lock(item), self.perf_tracker.track_execution(
+            f"Threaded Processing Item: {item}"
+        ):
+            return self.process_item(item)
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Start the worker pool on first use and keep it for later batches."""
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=min(self.batch_size, os.cpu_count() or 1),
+                initializer=_init_worker,
+                initargs=(self,),
+            )
+        return self._process_pool
+
+    def close(self):
+        """Shut down the worker process pool, if one was started."""
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for name in (
+            "logger",
+            "perf_tracker",
+            "concurrency_controller",
+            "_lock",
+            "_item_locks",
+            "_process_pool",
+        ):
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.logger = logging.getLogger(type(self).__module__)
+        self.perf_tracker = PerformanceTracker(logger=self.logger)
+        self.concurrency_controller = None
+        self._lock = Lock()
+        self._item_locks = {}
+        self._process_pool = None
 
     def _handle_processing_exception(self, item, exception):
         """
@@ -118,4 +475,24 @@ class BatchProcessor(ABC):
             exception (Exception): The exception that occurred.
         """
         self.logger.error(f"Error processing item {item}: {exception}")
-        self.logger.debug(traceback.format_exc())
+        # Failures are handled after the fact, outside any except block, so
+        # format the exception's own traceback rather than format_exc().
+        details = getattr(exception, "remote_traceback", None)
+        if details is None:
+            details = "".join(traceback.format_exception(exception))
+        self.logger.debug(details)
+
+
+class FunctionBatchProcessor(BatchProcessor):
+    """
+    BatchProcessor that applies `func` to each item, for callers with a plain
+    function rather than a subclass. Process backends pickle `func`, so it
+    must then be a module-level function.
+    """
+
+    def __init__(self, func, **kwargs):
+        super().__init__(**kwargs)
+        self.func = func
+
+    def process_item(self, item):
+        return self.func(item)
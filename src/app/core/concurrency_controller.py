@@ -0,0 +1,141 @@
+import threading
+import time
+
+from dependency_injector.wiring import Provide, inject
+
+
+class ConcurrencyController:
+    """
+    AIMD (additive-increase, multiplicative-decrease) controller for how
+    many tasks a BatchProcessor keeps in flight.
+
+    It is driven by MemoryMonitor samples (see `attach`):
+
+    - High memory usage multiplies the limit by `decrease_factor`.
+    - Otherwise, if throughput fell by more than `throughput_tolerance`
+      since the previous sample and the last change was an increase, the
+      extra concurrency is not paying off and the limit is cut as well.
+    - Otherwise, while items are completing, the limit grows by
+      `increase_step`, up to `max_limit`.
+
+    Throughput is measured from `record_completion`, which BatchProcessor
+    calls as items finish. Every decision is exported through the
+    performance tracker as "Concurrency limit", "Concurrency throughput"
+    and "Concurrency decision" (+1 increase, 0 hold, -1 decrease) metrics.
+    """
+
+    @inject
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        initial_limit: int = None,
+        increase_step: int = 1,
+        decrease_factor: float = 0.5,
+        throughput_tolerance: float = 0.1,
+        logger=Provide["logger"],
+        perf_tracker=Provide["performance_tracker"],
+    ):
+        """
+        Initialize the ConcurrencyController.
+
+        Args:
+            max_limit (int): Upper bound on tasks in flight (e.g. pool size).
+            min_limit (int): Lower bound on tasks in flight (must be > 0).
+            initial_limit (int): Starting limit; defaults to `max_limit`.
+            increase_step (int): Tasks added per healthy sample.
+            decrease_factor (float): Multiplier applied on backoff (0-1).
+            throughput_tolerance (float): Relative throughput drop, after an
+                increase, treated as degradation.
+        """
+        if not (0 < min_limit <= max_limit):
+            raise ValueError("Limits must satisfy 0 < min_limit <= max_limit.")
+        if not (0 < decrease_factor < 1):
+            raise ValueError("Decrease factor must be between 0 and 1.")
+
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.increase_step = max(increase_step, 1)
+        self.decrease_factor = decrease_factor
+        self.throughput_tolerance = throughput_tolerance
+        self.logger = logger
+        self.perf_tracker = perf_tracker
+        self._limit = min(max(initial_limit or max_limit, min_limit), max_limit)
+        self._lock = threading.Lock()
+        self._completed = 0
+        self._sampled_at = time.monotonic()
+        self._last_throughput = None
+        self._last_decision = 0
+
+    @property
+    def limit(self) -> int:
+        """Current number of tasks allowed in flight."""
+        return self._limit
+
+    def attach(self, memory_monitor):
+        """Drive this controller from `memory_monitor`'s samples."""
+        memory_monitor.action_on_high_usage = self.on_high_usage
+        memory_monitor.action_on_normal_usage = self.on_normal_usage
+
+    def record_completion(self, count: int = 1):
+        """Count finished items towards the throughput estimate."""
+        with self._lock:
+            self._completed += count
+
+    def on_high_usage(self, memory_info):
+        """MemoryMonitor callback: back off under memory pressure."""
+        throughput = self._sample_throughput()
+        self._decrease(f"memory usage at {memory_info.percent}%", throughput)
+
+    def on_normal_usage(self, memory_info):
+        """MemoryMonitor callback: probe for more concurrency if it helps."""
+        previous = self._last_throughput
+        throughput = self._sample_throughput()
+        degraded = (
+            self._last_decision > 0
+            and previous
+            and throughput < previous * (1 - self.throughput_tolerance)
+        )
+        if degraded:
+            self._decrease(
+                f"throughput fell from {previous:.2f} to {throughput:.2f} items/s",
+                throughput,
+            )
+        elif throughput > 0:
+            self._increase(throughput)
+        else:
+            self._export(0, throughput)
+
+    def _sample_throughput(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._sampled_at
+            throughput = self._completed / elapsed if elapsed > 0 else 0.0
+            self._completed = 0
+            self._sampled_at = now
+        self._last_throughput = throughput
+        return throughput
+
+    def _increase(self, throughput: float):
+        limit = min(self._limit + self.increase_step, self.max_limit)
+        decision = 1 if limit > self._limit else 0
+        if decision:
+            self.logger.info(f"Raising concurrency limit {self._limit} -> {limit}")
+        self._limit = limit
+        self._export(decision, throughput)
+
+    def _decrease(self, reason: str, throughput: float):
+        limit = max(int(self._limit * self.decrease_factor), self.min_limit)
+        decision = -1 if limit < self._limit else 0
+        if decision:
+            self.logger.warning(
+                f"Lowering concurrency limit {self._limit} -> {limit}: {reason}"
+            )
+        self._limit = limit
+        self._export(decision, throughput)
+
+    def _export(self, decision: int, throughput: float):
+        self._last_decision = decision
+        self.perf_tracker.log_metric("Concurrency limit", self._limit)
+        self.perf_tracker.log_metric("Concurrency throughput", round(throughput, 3))
+        self.perf_tracker.log_metric("Concurrency decision", decision)
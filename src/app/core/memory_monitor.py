@@ -1,22 +1,160 @@
+import os
+import tempfile
 import threading
 import time
 import traceback
+from contextlib import contextmanager, suppress
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 import psutil
+from dependency_injector.wiring import Provide, inject
 
-from src.infrastructure.app.app_container import AppContainer
-from src.infrastructure.app.dependency_injector import Provide, inject
+# Where workers publish the tasks they are running: one file per pid holding
+# one task label per line, so a monitor in the parent process can attribute
+# samples.
+DEFAULT_TASK_LABEL_DIR = os.path.join(tempfile.gettempdir(), "memory_monitor_tasks")
+
+
+class ProcessMemorySample(NamedTuple):
+    pid: int
+    rss: int
+    uss: Optional[int]  # None where the platform or permissions hide it
+    tasks: Tuple[str, ...]  # Empty when the process is idle
+
+
+class TaskMemoryPeak(NamedTuple):
+    task: str
+    peak_rss: int
+    peak_uss: Optional[int]
+    pid: int
+    samples: int
+
+
+def _label_path(label_dir: str, pid: int) -> str:
+    return os.path.join(label_dir, str(pid))
+
+
+def read_task_labels(pid: int, label_dir: str = DEFAULT_TASK_LABEL_DIR):
+    """Return the task labels published by `pid`; empty if it runs none."""
+    try:
+        with open(_label_path(label_dir, pid), encoding="utf-8") as file:
+            return tuple(file.read().splitlines())
+    except OSError:
+        return ()
+
+
+# Labels of the task scopes open in this process, one entry per scope, so
+# concurrent threads each keep their label until their own task ends.
+_active_labels: List[str] = []
+_active_labels_lock = threading.Lock()
+
+
+def _reset_active_labels():
+    global _active_labels_lock
+    _active_labels.clear()
+    _active_labels_lock = threading.Lock()
+
+
+# A forked worker starts with no tasks of its own, whatever its parent runs.
+os.register_at_fork(after_in_child=_reset_active_labels)
+
+
+def _publish_labels(label_dir: str):
+    """Write this process's active labels to its label file, or remove it."""
+    path = _label_path(label_dir, os.getpid())
+    labels = list(dict.fromkeys(_active_labels))  # Unique, in start order
+    if not labels:
+        with suppress(FileNotFoundError):
+            os.remove(path)
+        return
+    os.makedirs(label_dir, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(
+        prefix=f".{os.getpid()}.", suffix=".tmp", dir=label_dir
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            for label in labels:  # One per line, so labels must not span lines
+                file.write(" ".join(label.splitlines()) + "\n")
+        os.replace(temp_path, path)  # Readers never see a partial label
+    except OSError:
+        with suppress(OSError):
+            os.remove(temp_path)
+        raise
+
+
+def _update_labels(change, label: str, label_dir: str):
+    with _active_labels_lock:
+        change(label)
+        with suppress(OSError):  # Telemetry must never fail the task it describes
+            _publish_labels(label_dir)
+
+
+@contextmanager
+def task_scope(label: str, label_dir: str = DEFAULT_TASK_LABEL_DIR):
+    """
+    Publish `label` (e.g. the file or URL being processed) as a current
+    task of this process while the block runs, so MemoryMonitor attributes
+    this process's memory to it. Memory is per process: when several
+    threads run tasks in one process, each of their labels is credited
+    with the whole process's memory.
+    Failures to publish are ignored rather than raised into the task.
+    """
+    _update_labels(_active_labels.append, label, label_dir)
+    try:
+        yield
+    finally:
+        _update_labels(_active_labels.remove, label, label_dir)
+
+
+def _label_file_pid(name: str) -> Optional[int]:
+    """The pid a label (`<pid>`) or temp (`.<pid>.*.tmp`) file belongs to."""
+    candidate = name.split(".")[1] if name.startswith(".") else name
+    return int(candidate) if candidate.isdigit() else None
+
+
+def remove_stale_task_labels(label_dir: str = DEFAULT_TASK_LABEL_DIR):
+    """
+    Delete label files left by processes that died inside a task scope
+    (crashed, OOM-killed), so a reused pid does not inherit their label.
+    """
+    try:
+        names = os.listdir(label_dir)
+    except OSError:
+        return
+    for name in names:
+        pid = _label_file_pid(name)
+        if pid is None or psutil.pid_exists(pid):
+            continue
+        with suppress(OSError):
+            os.remove(os.path.join(label_dir, name))
 
 
 class MemoryMonitor:
+    """
+    Samples host memory every `interval` seconds and, with
+    `track_processes`, the RSS and USS of every process in the tree rooted
+    at `root_pid` (this process and its workers by default).
+
+    Each process sample carries the labels its process published with
+    `task_scope`, and the highest sample seen per label is kept, so
+    `top_offenders` names the inputs that use the most memory. Peaks are
+    only as fine-grained as `interval`: a spike between two samples is
+    missed.
+    """
+
     @inject
     def __init__(
         self,
         interval: int = 5,
         high_usage_threshold: int = 90,
         action_on_high_usage: callable = None,
-        logger=Provide[AppContainer.logger],
-        perf_tracker=Provide[AppContainer.performance_tracker],
+        action_on_normal_usage: callable = None,
+        track_processes: bool = True,
+        root_pid: int = None,
+        task_label_dir: str = DEFAULT_TASK_LABEL_DIR,
+        max_tracked_tasks: int = 10000,
+        logger=Provide["logger"],
+        perf_tracker=Provide["performance_tracker"],
     ):
         """
         Initialize the MemoryMonitor.
@@ -25,6 +163,12 @@ class MemoryMonitor:
             interval (int): Monitoring interval in seconds (must be > 0).
             high_usage_threshold (int): Memory usage percentage to trigger alerts (0-100).
             action_on_high_usage (callable): Callback for high memory usage events.
+            action_on_normal_usage (callable): Callback for every sample below
+                the threshold, e.g. to let a ConcurrencyController scale back up.
+            track_processes (bool): Also sample each process in the tree.
+            root_pid (int): Root of the process tree; defaults to this process.
+            task_label_dir (str): Directory that `task_scope` publishes to.
+            max_tracked_tasks (int): Task peaks kept; the smallest are dropped.
             logger: Logger instance for logging.
             perf_tracker: PerformanceTracker instance for tracking performance.
         """
@@ -36,6 +180,14 @@ class MemoryMonitor:
         self.interval = interval
         self.high_usage_threshold = high_usage_threshold
         self.action_on_high_usage = action_on_high_usage or self._default_high_usage_action
+        self.action_on_normal_usage = action_on_normal_usage
+        self.track_processes = track_processes
+        self.root_pid = root_pid or os.getpid()
+        self.task_label_dir = task_label_dir
+        self.max_tracked_tasks = max_tracked_tasks
+        self.process_samples: List[ProcessMemorySample] = []
+        self._task_peaks: Dict[str, TaskMemoryPeak] = {}
+        self._peaks_lock = threading.Lock()
         self.logger = logger
         self.perf_tracker = perf_tracker
         self._stop_event = threading.Event()
@@ -73,6 +225,11 @@ class MemoryMonitor:
                             f"High memory usage detected: {memory_info.percent}%"
                         )
                         self.action_on_high_usage(memory_info)
+                    elif self.action_on_normal_usage is not None:
+                        self.action_on_normal_usage(memory_info)
+
+                    if self.track_processes:
+                        self.sample_processes()
 
                 time.sleep(self.interval)
         except Exception as e:
@@ -81,6 +238,103 @@ class MemoryMonitor:
         finally:
             self.logger.info("Memory monitoring thread exiting...")
 
+    def sample_processes(self) -> List[ProcessMemorySample]:
+        """
+        Sample RSS and USS of every process in the tree and update the
+        per-task peaks. USS (memory only that process holds) is the better
+        measure for forked workers, whose RSS counts pages shared with the
+        parent.
+        """
+        remove_stale_task_labels(self.task_label_dir)
+        try:
+            root = psutil.Process(self.root_pid)
+            processes = [root] + root.children(recursive=True)
+        except psutil.NoSuchProcess:
+            return []
+
+        samples = []
+        for process in processes:
+            try:
+                try:
+                    info = process.memory_full_info()
+                except psutil.AccessDenied:
+                    info = process.memory_info()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue  # Exited, or not ours to inspect
+            samples.append(
+                ProcessMemorySample(
+                    pid=process.pid,
+                    rss=info.rss,
+                    uss=getattr(info, "uss", None),
+                    tasks=read_task_labels(process.pid, self.task_label_dir),
+                )
+            )
+
+        self.process_samples = samples
+        self._record_peaks(samples)
+        self.perf_tracker.log_metric(
+            "Process tree RSS MB", sum(s.rss for s in samples) // (1024**2)
+        )
+        for sample in samples:
+            self.logger.debug(
+                f"Process {sample.pid} ({', '.join(sample.tasks) or 'idle'}): "
+                f"RSS {sample.rss // (1024 ** 2)}MB, "
+                f"USS {self._megabytes(sample.uss)}"
+            )
+        return samples
+
+    def _record_peaks(self, samples: List[ProcessMemorySample]):
+        with self._peaks_lock:
+            for sample in samples:
+                for task in sample.tasks:
+                    self._record_peak(task, sample)
+            if len(self._task_peaks) > self.max_tracked_tasks:
+                kept = sorted(
+                    self._task_peaks.values(), key=self._peak_size, reverse=True
+                )[: self.max_tracked_tasks // 2]
+                self._task_peaks = {peak.task: peak for peak in kept}
+
+    def _record_peak(self, task: str, sample: ProcessMemorySample):
+        peak = self._task_peaks.get(task)
+        if peak is None:
+            peak = TaskMemoryPeak(task, 0, None, sample.pid, 0)
+        self._task_peaks[task] = TaskMemoryPeak(
+            task=task,
+            peak_rss=max(peak.peak_rss, sample.rss),
+            peak_uss=max(
+                (v for v in (peak.peak_uss, sample.uss) if v is not None),
+                default=None,
+            ),
+            pid=sample.pid if sample.rss >= peak.peak_rss else peak.pid,
+            samples=peak.samples + 1,
+        )
+
+    @staticmethod
+    def _peak_size(peak: TaskMemoryPeak) -> int:
+        return peak.peak_uss if peak.peak_uss is not None else peak.peak_rss
+
+    @staticmethod
+    def _megabytes(value: Optional[int]) -> str:
+        return "n/a" if value is None else f"{value // (1024 ** 2)}MB"
+
+    def top_offenders(self, n: int = 10) -> List[TaskMemoryPeak]:
+        """Return the `n` tasks with the highest peak memory (USS, else RSS)."""
+        with self._peaks_lock:
+            peaks = list(self._task_peaks.values())
+        return sorted(peaks, key=self._peak_size, reverse=True)[:n]
+
+    def report_top_offenders(self, n: int = 10) -> List[TaskMemoryPeak]:
+        """Log the `n` tasks with the highest peak memory and return them."""
+        offenders = self.top_offenders(n)
+        self.logger.info(f"Top {len(offenders)} tasks by peak memory:")
+        for rank, peak in enumerate(offenders, start=1):
+            self.logger.info(
+                f"{rank}. {peak.task}: peak USS {self._megabytes(peak.peak_uss)}, "
+                f"peak RSS {self._megabytes(peak.peak_rss)} "
+                f"(pid {peak.pid}, {peak.samples} samples)"
+            )
+        return offenders
+
     def _default_high_usage_action(self, memory_info):
         """Default action triggered on high memory usage."""
         self.logger.warning(
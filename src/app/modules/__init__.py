@@ -1,6 +1,7 @@
 from .audio_command_handler import AudioHandler
 from .configuration_manager import ConfigManager
 from .download_command import DownloadCommand
+from .model_size_router import ModelSizeRouter, broker_queue_depth
 from .pipeline_manager import PipelineManager
 from .text_handler import TextHandler
 from .transcription_model_loader import ModelLoader
@@ -12,4 +13,6 @@ __all__ = [
     "DownloadCommand",
     "PipelineManager",
     "ModelLoader",
+    "ModelSizeRouter",
+    "broker_queue_depth",
 ]
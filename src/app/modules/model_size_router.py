@@ -0,0 +1,98 @@
+from typing import Dict, Optional, Sequence
+
+# Rough CPU real-time factors (processing seconds per audio second) for
+# Whisper sizes; override with measurements from
+# benchmarks/transcription_compute_types.py for the deployed hardware.
+DEFAULT_REAL_TIME_FACTORS = {
+    "tiny": 0.03,
+    "base": 0.06,
+    "small": 0.15,
+    "medium": 0.4,
+    "large-v2": 0.8,
+    "large-v3": 0.8,
+}
+
+PRIORITIES = ("low", "normal", "high")
+
+
+def broker_queue_depth(celery_app, queue: str = "celery") -> int:
+    """
+    Number of messages waiting in `queue` on the Celery broker, for use as
+    TranscriptionManager's `queue_depth`.
+    """
+    with celery_app.connection_or_acquire() as connection:
+        declared = connection.default_channel.queue_declare(queue=queue, passive=True)
+    return declared.message_count
+
+
+class ModelSizeRouter:
+    """
+    Chooses a model size per job from the audio duration, the number of jobs
+    waiting behind it and a latency budget.
+
+    A job's latency is estimated as its own processing time plus the backlog
+    that has to drain through the same workers:
+
+        duration * rtf(size) * (1 + queue_depth / workers)
+
+    The largest available size whose estimate fits the budget wins; when
+    none fits, the smallest is used. Low-priority jobs get a tighter budget
+    so they step down to a smaller model first under backlog, and
+    high-priority jobs a looser one. Only `available_sizes` are considered,
+    which should be the sizes the ModelLoader has preloaded.
+    """
+
+    def __init__(
+        self,
+        available_sizes: Sequence[str],
+        latency_budget_seconds: float,
+        logger,
+        workers: int = 1,
+        real_time_factors: Optional[Dict[str, float]] = None,
+        priority_budget_factors: Optional[Dict[str, float]] = None,
+    ):
+        if not available_sizes:
+            raise ValueError("ModelSizeRouter needs at least one model size.")
+        factors = {**DEFAULT_REAL_TIME_FACTORS, **(real_time_factors or {})}
+        unknown = [size for size in available_sizes if size not in factors]
+        if unknown:
+            raise ValueError(f"No real-time factor configured for sizes {unknown}.")
+        if latency_budget_seconds <= 0:
+            raise ValueError("Latency budget must be greater than 0.")
+        # Slowest (largest) first, so the first size that fits is the best.
+        self.sizes = sorted(available_sizes, key=factors.get, reverse=True)
+        self.real_time_factors = factors
+        self.latency_budget_seconds = latency_budget_seconds
+        self.workers = max(workers, 1)
+        self.priority_budget_factors = {
+            "low": 0.5,
+            "normal": 1.0,
+            "high": 2.0,
+            **(priority_budget_factors or {}),
+        }
+        self.logger = logger
+
+    def estimate_latency(self, size: str, duration: float, queue_depth: int) -> float:
+        backlog = 1 + queue_depth / self.workers
+        return duration * self.real_time_factors[size] * backlog
+
+    def choose(
+        self, duration: float, queue_depth: int = 0, priority: str = "normal"
+    ) -> str:
+        """
+        Returns the model size for a job of `duration` seconds with
+        `queue_depth` jobs waiting.
+        """
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority '{priority}'. Expected {PRIORITIES}.")
+        budget = self.latency_budget_seconds * self.priority_budget_factors[priority]
+        for size in self.sizes:
+            if self.estimate_latency(size, duration, queue_depth) <= budget:
+                break
+        else:
+            size = self.sizes[-1]
+        self.logger.info(
+            f"Routed {duration:.0f}s job (queue depth {queue_depth}, "
+            f"{priority} priority) to model size '{size}'"
+        )
+        return size
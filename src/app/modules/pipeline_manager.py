@@ -1,5 +1,8 @@
+from typing import Iterable, Iterator, List, Optional, Tuple
+
 from dependency_injector.wiring import Provide, inject
 
+from src.app.core.concurrency_controller import ConcurrencyController
 from src.infrastructure.app.app_container import AppContainer
 
 
@@ -11,28 +14,81 @@ class PipelineManager:
         logger=Provide[AppContainer.logger],
         performance_tracker=Provide[AppContainer.performance_tracker],
         memory_monitor=Provide[AppContainer.memory_monitor],
-        batch_processor_factory=Provide[AppContainer.batch_processor],
+        batch_processor_factory=Provide[AppContainer.batch_processor.provider],
     ):
+        """
+        Args:
+            batch_processor_factory (callable): Builds a BatchProcessor that
+                applies `func` to each item, e.g. FunctionBatchProcessor.
+        """
         self.config_manager = config_manager
         self.logger = logger
         self.performance_tracker = performance_tracker
         self.memory_monitor = memory_monitor
+        self.batch_processor_factory = batch_processor_factory
 
-        batch_size = self.config_manager.get("batch_size", 5)  # Default batch size
-        self.batch_processor = batch_processor_factory(batch_size=batch_size)
+        self.batch_size = self._setting("batch_size", 5)
+        self.executor = self._setting("executor", "threads")
+        # batch_size is the ceiling; the controller lowers the tasks actually
+        # in flight under memory pressure or when throughput stops improving.
+        self.concurrency_controller = ConcurrencyController(
+            max_limit=self.batch_size, logger=logger, perf_tracker=performance_tracker
+        )
+        self.concurrency_controller.attach(self.memory_monitor)
+        self.memory_monitor.start()
 
         self.logger.info(
-            "PipelineManager initialized with batch size and memory monitoring."
+            "PipelineManager initialized with batch size, memory monitoring "
+            "and adaptive concurrency."
         )
 
-    def process_batch(self, func, items):
+    def _setting(self, name: str, default):
+        try:
+            return self.config_manager.get(name)
+        except ValueError:  # Not registered
+            return default
+
+    def _batch_processor(self, func):
+        return self.batch_processor_factory(
+            func=func,
+            batch_size=self.batch_size,
+            executor=self.executor,
+            concurrency_controller=self.concurrency_controller,
+        )
+
+    def process_batch(self, func, items, executor: Optional[str] = None) -> List:
         """
         Processes a batch of items using the provided function.
 
         Args:
             func (callable): Function to process each item.
             items (iterable): Items to process in batches.
+            executor (str): BatchProcessor backend for this call only.
+
+        Returns:
+            list: The result for each item, in input order; None for items
+            that failed.
+        """
+        batch_processor = self._batch_processor(func)
+        try:
+            with self.performance_tracker.track_execution("Batch Processing"):
+                results = batch_processor.process_batch(items, executor=executor)
+                self.logger.info("Batch processing completed.")
+            return results
+        finally:
+            batch_processor.close()
+
+    def process_stream(self, func, items: Iterable, **kwargs) -> Iterator[Tuple]:
+        """
+        Processes an iterable of any length, yielding (item, result) as items
+        finish. Keyword arguments go to `BatchProcessor.process_stream`.
         """
-        with self.performance_tracker.track_execution("Batch Processing"):
-            self.batch_processor.process(func, items)
-            self.logger.info("Batch processing completed.")
+        batch_processor = self._batch_processor(func)
+        try:
+            yield from batch_processor.process_stream(items, **kwargs)
+        finally:
+            batch_processor.close()
+
+    def close(self):
+        """Stop the memory monitor."""
+        self.memory_monitor.stop()
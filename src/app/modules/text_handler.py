@@ -1,17 +1,59 @@
+import os
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
+
 from dependency_injector.wiring import Provide, inject
 
+from src.app.utils.columnar_writer import (
+    ENTITY_SCHEMA,
+    SEGMENT_SCHEMA,
+    ColumnarWriter,
+    entity_rows,
+    sentence_rows,
+)
 from src.infrastructure.app.app_container import AppContainer
 
+TASKS = ("tokenization", "segmentation", "ner")
+
 
 class TextHandler:
     """
     Handles text processing async_tasks such as tokenization, segmentation, and NER.
+
+    `load`/`process_tasks` keep every document in memory. The streaming mode
+    (`open_stream`, `set_stream_tasks`, `save_stream`) instead pulls one batch
+    of documents at a time through load -> segment -> tokenize -> NER -> save,
+    so memory stays flat however large the corpus is.
     """
 
     @inject
-    def __init__(self, logger=Provide[AppContainer.logger]):
+    def __init__(
+        self,
+        logger=Provide[AppContainer.logger],
+        segmenter=Provide[AppContainer.text_segmenter],
+        tokenizer=Provide[AppContainer.text_tokenizer],
+        ner_processor=Provide[AppContainer.ner_processor],
+        saver=Provide[AppContainer.text_saver],
+    ):
         self.logger = logger
+        self.segmenter = segmenter
+        self.tokenizer = tokenizer
+        self.ner_processor = ner_processor
+        self.saver = saver
         self.processed_data = []
+        self.stream_files: Optional[List[str]] = None
+        self.stream_tasks: List[str] = list(TASKS)
+
+    @staticmethod
+    def parse_tasks(tasks: str) -> List[str]:
+        """Turn "all" or a comma-separated task list into task names."""
+        if tasks == "all":
+            return list(TASKS)
+        names = [task.strip() for task in tasks.split(",") if task.strip()]
+        unknown = [name for name in names if name not in TASKS]
+        if unknown:
+            raise ValueError(f"Unknown text tasks {unknown}; expected {TASKS}.")
+        return names
 
     def load(self, file_path: str):
         """
@@ -31,15 +73,11 @@ class TextHandler:
             tasks (str): Comma-separated list of async_tasks to execute, or "all".
         """
         self.logger.info(f"Processing async_tasks: {tasks}")
-        # Example task logic
-        if tasks == "all":
-            tasks = ["tokenization", "segmentation", "ner"]
-
-        for task in tasks.split(","):
-            self.logger.info(f"Executing task: {task.strip()}")
+        for task in self.parse_tasks(tasks):
+            self.logger.info(f"Executing task: {task}")
             # Mock task execution
             for i, data in enumerate(self.processed_data):
-                self.processed_data[i] = f"{data} [{task.strip()}]"
+                self.processed_data[i] = f"{data} [{task}]"
 
     def get_processed_data(self):
         """
@@ -50,3 +88,110 @@ class TextHandler:
         """
         self.logger.info("Retrieving processed data.")
         return self.processed_data
+
+    def open_stream(self, file_paths: Iterable[str]):
+        """
+        Start a streaming run over `file_paths`. Only the paths are kept;
+        files are read one batch at a time by `save_stream`.
+        """
+        self.stream_files = list(file_paths)
+        self.logger.info(f"Streaming {len(self.stream_files)} files.")
+
+    def set_stream_tasks(self, tasks: str):
+        self.stream_tasks = self.parse_tasks(tasks)
+        self.logger.info(f"Streaming tasks: {self.stream_tasks}")
+
+    @property
+    def streaming(self) -> bool:
+        return self.stream_files is not None
+
+    def iter_documents(self, file_paths: Iterable[str]) -> Iterator[tuple]:
+        """Yield (path, content) one file at a time."""
+        for file_path in file_paths:
+            with open(file_path, encoding="utf-8") as file:
+                yield file_path, file.read()
+
+    def iter_processed(
+        self, documents: Iterable[tuple], batch_size: int = 8
+    ) -> Iterator[dict]:
+        """
+        Run the stream tasks over `documents` in batches of `batch_size`,
+        yielding one result per document. NER for a batch goes through
+        `NERProcessor.process_many`, so spaCy sees all of its sentences at once.
+        """
+        documents = iter(documents)
+        while True:
+            batch = list(islice(documents, batch_size))
+            if not batch:
+                return
+            results = [self._segment_and_tokenize(path, text) for path, text in batch]
+            if "ner" in self.stream_tasks:
+                sentences = [s for result in results for s in result["sentences"]]
+                entities = iter(self.ner_processor.process_many(sentences))
+                for result in results:
+                    result["entities"] = [
+                        next(entities) for _ in result["sentences"]
+                    ]
+            yield from results
+
+    def _segment_and_tokenize(self, source: str, text: str) -> dict:
+        if "segmentation" in self.stream_tasks:
+            sentences = self.segmenter.process(text)
+        else:
+            sentences = [text]
+        result = {"source": source, "sentences": sentences}
+        if "tokenization" in self.stream_tasks:
+            result["tokens"] = [self.tokenizer.process(s) for s in sentences]
+        return result
+
+    def save_stream(
+        self, output_dir: str, format: str = "json", batch_size: int = 8
+    ) -> Iterator[str]:
+        """
+        Drive the streaming run: load, process and save each document, then
+        drop it before reading the next batch. Yields each saved file path.
+
+        The "parquet" format appends every document to one pair of tables,
+        `segments.parquet` and `entities.parquet`, one row group per batch.
+        """
+        if not self.streaming:
+            raise ValueError("No stream opened; call open_stream first.")
+        if format not in ("json", "csv", "parquet"):
+            raise ValueError(f"Unsupported format for streaming: {format}")
+        os.makedirs(output_dir, exist_ok=True)
+        documents = self.iter_documents(self.stream_files)
+        if format == "parquet":
+            yield from self._save_stream_parquet(documents, output_dir, batch_size)
+            return
+        for result in self.iter_processed(documents, batch_size):
+            name = os.path.splitext(os.path.basename(result["source"]))[0]
+            file_path = os.path.join(output_dir, f"{name}.{format}")
+            if format == "csv":
+                entities = result.get("entities", [[] for _ in result["sentences"]])
+                self.saver.save_to_csv(result["sentences"], entities, file_path)
+            else:
+                self.saver.save_to_json(result, file_path)
+            yield file_path
+
+    def _save_stream_parquet(
+        self, documents: Iterable[tuple], output_dir: str, batch_size: int
+    ) -> Iterator[str]:
+        segments_path = os.path.join(output_dir, "segments.parquet")
+        entities_path = os.path.join(output_dir, "entities.parquet")
+        with ColumnarWriter(segments_path, SEGMENT_SCHEMA) as segments, ColumnarWriter(
+            entities_path, ENTITY_SCHEMA
+        ) as entities:
+            pending_segments, pending_entities, sources = [], [], []
+            for result in self.iter_processed(documents, batch_size):
+                source = result["source"]
+                pending_segments += sentence_rows(source, result["sentences"])
+                pending_entities += entity_rows(source, result.get("entities", []))
+                sources.append(source)
+                if len(sources) == batch_size:
+                    segments.write_rows(pending_segments)
+                    entities.write_rows(pending_entities)
+                    yield from sources
+                    pending_segments, pending_entities, sources = [], [], []
+            segments.write_rows(pending_segments)
+            entities.write_rows(pending_entities)
+            yield from sources
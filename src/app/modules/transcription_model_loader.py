@@ -1,7 +1,27 @@
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
 from dependency_injector.wiring import Provide, inject
+from django.conf import settings
 
+from src.app.modules.transcription_models import TRANSCRIPTION_MODEL_FACTORIES
+from src.app.pipelines.audio_processing.audio_stream import (
+    MODEL_SAMPLE_RATE,
+    decode_to_array,
+)
 from src.infrastructure.app.app_container import AppContainer
 
+# Whisper models decode at most 30 seconds at a time; VAD chunks are merged
+# up to this length, as WhisperX's own transcribe does.
+VAD_CHUNK_SECONDS = 30
+
+# Models warmed at worker start. Only the preferred WhisperX model is warmed;
+# the Whisper fallback is loaded on first use, so workers don't hold both.
+DEFAULT_WARMUP_MODELS = ("whisperx",)
+
 
 class ModelLoader:
     @inject
@@ -11,6 +31,10 @@ class ModelLoader:
         perf_tracker=Provide[AppContainer.performance_tracker],
         model_registry=Provide[AppContainer.model_registry],
         config_registry=Provide[AppContainer.configuration_registry],
+        model_size: str = "base",
+        device: str = "cpu",
+        compute_type: str = "float32",
+        routed_model_sizes: Sequence[str] = (),
     ):
         """
         Initialize the ModelLoader.
@@ -20,99 +44,400 @@ class ModelLoader:
             perf_tracker: The performance tracker from the AppContainer.
             model_registry: The model registry for managing model instances.
             config_registry: Configuration registry for retrieving configurations.
+            model_size: Whisper model size to load and lease from the pool.
+            device: Device the models run on.
+            compute_type: Precision mode, one of "int8", "int8_float32" or
+                "float32". The int8 modes cut memory and CPU time at a small
+                accuracy cost.
+            routed_model_sizes: Additional sizes to preload so a
+                ModelSizeRouter can pick between them per job. Sizes that
+                were not preloaded are never loaded on demand.
         """
         self.logger = logger
         self.perf_tracker = perf_tracker
         self.model_registry = model_registry
         self.config_registry = config_registry
+        self.model_size = model_size
+        self.model_sizes = list(dict.fromkeys([model_size, *routed_model_sizes]))
+        self.device = device
+        self.compute_type = compute_type
+        self.loaded_models: set[str] = set()
+        self._ready: Dict[str, threading.Event] = {}
+        self._warmup_lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, **kwargs) -> "ModelLoader":
+        """
+        Build a ModelLoader for the deployment's WHISPER_MODEL_SIZE, DEVICE,
+        WHISPER_COMPUTE_TYPE and WHISPER_ROUTED_MODEL_SIZES settings;
+        `kwargs` override them.
+        """
+        options = {
+            "model_size": settings.WHISPER_MODEL_SIZE,
+            "device": settings.DEVICE,
+            "compute_type": settings.WHISPER_COMPUTE_TYPE,
+            "routed_model_sizes": settings.WHISPER_ROUTED_MODEL_SIZES,
+        }
+        return cls(**{**options, **kwargs})
 
-    @inject
-    @perf_tracker.track
     def load_models(self):
         """
         Attempts to load WhisperX model first, with fallback to standard Whisper model.
+        Models are preloaded into the registry's warm pool, so later calls in
+        this process lease the same instance instead of loading it again.
 
         Raises:
             ValueError: If both models fail to load.
         """
-        try:
-            # Load WhisperX model
-            whisperx_model = self.model_registry.create_model("whisperx", "base")
-            self.model_registry.register_model("whisperx", whisperx_model)
-            self.logger.info("WhisperX model loaded successfully.")
-        except Exception as e:
-            self.logger.error(f"Failed to load WhisperX model: {e}")
-            self.logger.info("Attempting to load standard Whisper model as a fallback.")
-            self._load_fallback_whisper()
+        with self.perf_tracker.track_execution("Load transcription models"):
+            try:
+                # Load WhisperX model
+                self._preload("whisperx")
+                self.loaded_models.add("whisperx")
+                self.logger.info("WhisperX model loaded successfully.")
+            except Exception as e:
+                self.logger.error(f"Failed to load WhisperX model: {e}")
+                self.logger.info(
+                    "Attempting to load standard Whisper model as a fallback."
+                )
+                self._load_fallback_whisper()
 
-    @inject
-    @perf_tracker.track
     def _load_fallback_whisper(self):
         """Attempts to load the standard Whisper model as a fallback."""
+        with self.perf_tracker.track_execution("Load fallback Whisper model"):
+            try:
+                # Load Whisper model
+                self._preload("whisper")
+                self.loaded_models.add("whisper")
+                self.logger.info("Standard Whisper model loaded successfully.")
+            except Exception as fallback_e:
+                self.logger.error(
+                    f"Failed to load both WhisperX and Whisper models: {fallback_e}"
+                )
+                raise ValueError(
+                    "Could not load any transcription model"
+                ) from fallback_e
+
+    def start_warmup(self, model_names: Sequence[str] = DEFAULT_WARMUP_MODELS):
+        """
+        Load `model_names` concurrently in background threads and return
+        immediately. Transcription calls wait only for the model they use;
+        each model's load latency is reported to the performance tracker.
+        """
+        with self._warmup_lock:
+            names = [name for name in model_names if name not in self._ready]
+            for name in names:
+                self._ready[name] = threading.Event()
+        for name in names:
+            threading.Thread(
+                target=self._warm_up, args=(name,), name=f"warmup-{name}", daemon=True
+            ).start()
+        if names:
+            self.logger.info(f"Warming up models in the background: {names}")
+
+    def _warm_up(self, name: str):
+        started = time.perf_counter()
         try:
-            # Load Whisper model
-            whisper_model = self.model_registry.create_model("whisper", "base")
-            self.model_registry.register_model("whisper", whisper_model)
-            self.logger.info("Standard Whisper model loaded successfully.")
-        except Exception as fallback_e:
-            self.logger.error(
-                f"Failed to load both WhisperX and Whisper models: {fallback_e}"
+            self._preload(name)
+            self.loaded_models.add(name)
+            elapsed = time.perf_counter() - started
+            self.perf_tracker.log_metric(f"Model warm-up latency {name}", elapsed)
+            self.logger.info(f"Model '{name}' warmed up in {elapsed:.2f}s.")
+        except Exception as e:
+            self.logger.error(f"Failed to warm up model '{name}': {e}")
+        finally:
+            self._ready[name].set()
+
+    def wait_for_model(self, name: str, timeout: Optional[float] = None) -> bool:
+        """
+        Block until a warming model has finished loading. Returns whether it
+        is loaded; models that were never warmed return immediately.
+        """
+        event = self._ready.get(name)
+        if event is not None and not event.is_set():
+            self.logger.info(f"Waiting for model '{name}' to finish warming up.")
+            event.wait(timeout)
+        return name in self.loaded_models
+
+    def require_model(self, name: str, timeout: Optional[float] = None) -> bool:
+        """
+        Like `wait_for_model`, but first starts loading a model that was
+        never warmed (such as the Whisper fallback), so it is loaded lazily
+        on first use.
+        """
+        self.start_warmup([name])
+        return self.wait_for_model(name, timeout)
+
+    def _preload(self, name: str):
+        if not self.model_registry.has_model_factory(name):
+            self.model_registry.register_model_factory(
+                name, TRANSCRIPTION_MODEL_FACTORIES[name]
+            )
+        for size in self.model_sizes:
+            self.model_registry.preload_model(
+                name, size, self.device, self.compute_type
+            )
+            self.logger.info(
+                f"Loaded {name} '{size}' on {self.device} ({self.compute_type})."
             )
-            raise ValueError("Could not load any transcription model") from fallback_e
 
-    def transcribe_with_whisperx(self, audio_file, **kwargs):
+    def _lease(self, name: str, model_size: Optional[str] = None):
+        size = model_size or self.model_size
+        if size not in self.model_sizes:
+            raise ValueError(
+                f"Model size '{size}' was not preloaded; available: "
+                f"{self.model_sizes}"
+            )
+        return self.model_registry.lease_model(
+            name, size, self.device, self.compute_type
+        )
+
+    def transcribe(self, audio_file, model_size: Optional[str] = None, **kwargs):
+        """
+        Transcribe with WhisperX, or Whisper if only the fallback is loaded.
+
+        Args:
+            audio_file (str | np.ndarray): Path or mono float32 16 kHz buffer.
+            model_size (str): One of the preloaded sizes; defaults to
+                `model_size`.
+            **kwargs: Additional model parameters.
+        """
+        if self.wait_for_model("whisperx"):
+            return self.transcribe_with_whisperx(audio_file, model_size, **kwargs)
+        return self.transcribe_with_whisper(audio_file, model_size, **kwargs)
+
+    def transcribe_with_whisperx(
+        self, audio_file, model_size: Optional[str] = None, **kwargs
+    ):
         """
         Transcribe using WhisperX if it is loaded.
 
         Args:
-            audio_file (str): Path to the audio_processing file.
+            audio_file (str | np.ndarray): Path to the audio_processing file, or a
+                mono float32 16 kHz buffer (e.g. from AudioConverter.to_array).
+            model_size (str): One of the preloaded sizes; defaults to
+                `model_size`.
             **kwargs: Additional WhisperX parameters.
 
         Returns:
             dict: Transcription and alignment results.
         """
-        whisperx_model = self.model_registry.get_model("whisperx")
-        if not whisperx_model:
+        if not self.wait_for_model("whisperx"):
             raise ValueError("WhisperX model is not loaded.")
         try:
             self.logger.info(f"Transcribing with WhisperX: {audio_file}")
-            result = whisperx_model.transcribe(audio_file, **kwargs)
+            with self._lease("whisperx", model_size) as whisperx_model:
+                result = whisperx_model.transcribe(audio_file, **kwargs)
             self.logger.info("WhisperX transcription completed.")
             return result
         except Exception as e:
             self.logger.error(f"Failed to transcribe with WhisperX: {e}")
             raise
 
-    def transcribe_with_whisper(self, audio_file, **kwargs):
+    def transcribe_with_whisper(
+        self, audio_file, model_size: Optional[str] = None, **kwargs
+    ):
         """
         Transcribe using Whisper if it is loaded.
 
         Args:
-            audio_file (str): Path to the audio_processing file.
+            audio_file (str | np.ndarray): Path to the audio_processing file, or a
+                mono float32 16 kHz buffer (e.g. from AudioConverter.to_array).
+            model_size (str): One of the preloaded sizes; defaults to
+                `model_size`.
             **kwargs: Additional Whisper parameters.
 
         Returns:
             dict: Transcription results.
         """
-        whisper_model = self.model_registry.get_model("whisper")
-        if not whisper_model:
+        if not self.require_model("whisper"):
             raise ValueError("Whisper model is not loaded.")
         try:
             self.logger.info(f"Transcribing with Whisper: {audio_file}")
-            result = whisper_model.transcribe(audio_file, **kwargs)
+            with self._lease("whisper", model_size) as whisper_model:
+                result = whisper_model.transcribe(audio_file, **kwargs)
             self.logger.info("Whisper transcription completed.")
             return result
         except Exception as e:
             self.logger.error(f"Failed to transcribe with Whisper: {e}")
             raise
 
+    def transcribe_batch(
+        self,
+        audio_files: Sequence[Union[str, np.ndarray]],
+        batch_size: int = 16,
+        language: Optional[str] = None,
+        model_size: Optional[str] = None,
+        **kwargs,
+    ) -> List[dict]:
+        """
+        Transcribe many inputs, packing their speech chunks into shared
+        model batches.
+
+        Each input is cut into the VAD-merged speech chunks WhisperX's own
+        transcribe uses, so words are not split at chunk edges. Its language
+        is detected from its own audio, and inputs are grouped by language;
+        each group's chunks are fed through the WhisperX pipeline in batches
+        of `batch_size`, so short clips share a forward pass instead of each
+        paying the per-call overhead. Without WhisperX, inputs are
+        transcribed one at a time with Whisper.
+
+        Args:
+            audio_files (list[str | np.ndarray]): Paths or mono float32 16 kHz
+                buffers.
+            batch_size (int): Number of chunks per model batch.
+            language (str): Language code for every input; detected per input
+                when omitted.
+            model_size (str): One of the preloaded sizes, used for the whole
+                batch; defaults to `model_size`.
+            **kwargs: Additional Whisper parameters for the fallback path.
+
+        Returns:
+            list[dict]: One result per input, in input order, each with
+            "segments" (one per speech chunk) and "language".
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1.")
+        if not self.wait_for_model("whisperx"):
+            self.logger.info("WhisperX not loaded; transcribing batch sequentially.")
+            return [
+                self.transcribe_with_whisper(
+                    audio, model_size, language=language, **kwargs
+                )
+                for audio in audio_files
+            ]
+
+        buffers = [
+            audio if isinstance(audio, np.ndarray) else decode_to_array(audio)
+            for audio in audio_files
+        ]
+        results = [{"segments": [], "language": language} for _ in buffers]
+
+        try:
+            with self._lease("whisperx", model_size) as whisperx_model:
+                inputs_by_language = defaultdict(list)
+                chunks = []
+                for index, buffer in enumerate(buffers):
+                    chunks.append(self._vad_chunks(whisperx_model, buffer))
+                    if not chunks[index]:
+                        continue
+                    detected = language or whisperx_model.detect_language(buffer)
+                    results[index]["language"] = detected
+                    inputs_by_language[detected].append(index)
+
+                for detected, indices in inputs_by_language.items():
+                    self._prepare_batch_tokenizer(whisperx_model, detected)
+                    pending = [
+                        (index, chunk) for index in indices for chunk in chunks[index]
+                    ]
+                    self.logger.info(
+                        f"Transcribing {len(indices)} '{detected}' inputs "
+                        f"({len(pending)} chunks) with WhisperX, batch size "
+                        f"{batch_size}"
+                    )
+                    outputs = whisperx_model(
+                        (
+                            {"inputs": self._chunk_audio(buffers[index], chunk)}
+                            for index, chunk in pending
+                        ),
+                        batch_size=batch_size,
+                    )
+                    for (index, chunk), output in zip(pending, outputs, strict=True):
+                        text = output["text"]
+                        if isinstance(text, list):
+                            text = text[0]
+                        results[index]["segments"].append(
+                            {
+                                "text": text,
+                                "start": round(chunk["start"], 3),
+                                "end": round(chunk["end"], 3),
+                            }
+                        )
+            self.logger.info("WhisperX batch transcription completed.")
+            return results
+        except Exception as e:
+            self.logger.error(f"Failed to batch transcribe with WhisperX: {e}")
+            raise
+
+    @staticmethod
+    def _vad_chunks(whisperx_model, audio: np.ndarray) -> List[dict]:
+        """
+        Speech chunks of `audio` ({"start", "end"} in seconds), merged up to
+        VAD_CHUNK_SECONDS exactly as WhisperX's transcribe merges them.
+        """
+        vad_model = whisperx_model.vad_model
+        if hasattr(vad_model, "preprocess_audio"):
+            # WhisperX >= 3.3 wraps each VAD backend in a Vad class.
+            waveform = vad_model.preprocess_audio(audio)
+            merge_chunks = vad_model.merge_chunks
+        else:
+            import torch
+            from whisperx.vad import merge_chunks
+
+            waveform = torch.from_numpy(audio).unsqueeze(0)
+        segments = vad_model({"waveform": waveform, "sample_rate": MODEL_SAMPLE_RATE})
+        return merge_chunks(
+            segments,
+            VAD_CHUNK_SECONDS,
+            onset=whisperx_model._vad_params["vad_onset"],
+            offset=whisperx_model._vad_params["vad_offset"],
+        )
+
+    @staticmethod
+    def _chunk_audio(audio: np.ndarray, chunk: dict) -> np.ndarray:
+        start = int(chunk["start"] * MODEL_SAMPLE_RATE)
+        end = int(chunk["end"] * MODEL_SAMPLE_RATE)
+        return audio[start:end]
+
+    def _prepare_batch_tokenizer(self, whisperx_model, language: str):
+        """
+        Fix the pipeline's tokenizer to `language` for the chunks that
+        follow, as WhisperX's own transcribe does per call.
+        """
+        from faster_whisper.tokenizer import Tokenizer
+
+        tokenizer = whisperx_model.tokenizer
+        if tokenizer is None or tokenizer.language_code != language:
+            whisperx_model.tokenizer = Tokenizer(
+                whisperx_model.model.hf_tokenizer,
+                whisperx_model.model.model.is_multilingual,
+                task="transcribe",
+                language=language,
+            )
+
+
+_worker_model_loader: Optional[ModelLoader] = None
+_worker_model_loader_lock = threading.Lock()
+
+
+def get_worker_model_loader() -> ModelLoader:
+    """
+    The ModelLoader shared by every task in this worker process, configured
+    from the deployment settings so warm-up loads the models tasks lease.
+    """
+    global _worker_model_loader
+    with _worker_model_loader_lock:
+        if _worker_model_loader is None:
+            _worker_model_loader = ModelLoader.from_settings()
+        return _worker_model_loader
+
+
+def warm_up_worker_models(model_names: Sequence[str] = DEFAULT_WARMUP_MODELS):
+    """
+    Worker start-up hook: begin loading models in the background so the
+    first task does not pay the cold-start cost.
+    """
+    loader = get_worker_model_loader()
+    loader.start_warmup(model_names)
+    return loader
+
 
 # Example usage
 if __name__ == "__main__":
     container = AppContainer()
     container.wire(modules=[__name__])
 
-    model_loader = ModelLoader()
+    model_loader = ModelLoader.from_settings()
     model_loader.load_models()
 
     # Example audio_processing file path
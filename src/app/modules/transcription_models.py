@@ -0,0 +1,40 @@
+from typing import Optional
+
+
+def load_whisperx_model(
+    size: str, device: str = "cpu", compute_type: Optional[str] = None
+):
+    """
+    Load a WhisperX (CTranslate2) model. CTranslate2 runs int8 and
+    int8_float32 natively, so the compute type is passed straight through.
+    """
+    import whisperx
+
+    return whisperx.load_model(size, device, compute_type=compute_type or "float32")
+
+
+def load_whisper_model(
+    size: str, device: str = "cpu", compute_type: Optional[str] = None
+):
+    """
+    Load an openai-whisper model. For the int8 modes the Linear layers are
+    dynamically quantized: weights are stored as int8 and activations stay
+    float32, which is what both int8 modes mean for a PyTorch model on CPU.
+    """
+    import torch
+    import whisper
+
+    model = whisper.load_model(size, device=device)
+    if compute_type in ("int8", "int8_float32"):
+        if device != "cpu":
+            raise ValueError("Dynamic int8 quantization is only supported on CPU.")
+        model = torch.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    return model
+
+
+TRANSCRIPTION_MODEL_FACTORIES = {
+    "whisperx": load_whisperx_model,
+    "whisper": load_whisper_model,
+}
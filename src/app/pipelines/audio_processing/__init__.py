@@ -5,6 +5,10 @@ __all__ = [
     "AudioNormalizer",
     "AudioTrimmer",
     "AudioProcessorBase",
+    "FusedAudioPipeline",
+    "AudioArtifactCache",
+    "AudioStreamReader",
+    "AudioStreamWriter",
 ]
 
 # Mapping of class names to their respective modules for lazy loading
@@ -13,7 +17,11 @@ _module_map = {
     "AudioConverter": "audio_converter",
     "AudioNormalizer": "audio_normalizer",
     "AudioTrimmer": "audio_trimmer",
-    "AudioProcessorBase": "audioprocessorbase",
+    "AudioProcessorBase": "audio_processor_base",
+    "FusedAudioPipeline": "fused_audio_pipeline",
+    "AudioArtifactCache": "artifact_cache",
+    "AudioStreamReader": "audio_stream",
+    "AudioStreamWriter": "audio_stream",
 }
 
 
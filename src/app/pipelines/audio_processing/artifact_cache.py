@@ -0,0 +1,165 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional
+
+# Inputs are hashed in blocks of this size so large files aren't read at once.
+HASH_BLOCK_SIZE = 1024 * 1024
+# Most recently hashed inputs whose digests are kept in memory.
+MAX_MEMOIZED_DIGESTS = 1024
+
+
+class AudioArtifactCache:
+    """
+    Content-addressed cache of processed audio artifacts in a local directory.
+
+    Keys combine the SHA-256 of the input file's contents with the processor
+    name and its parameters, so a renamed or re-downloaded but identical file
+    still hits. The directory is bounded to `max_bytes` with least-recently-
+    used eviction; recency survives restarts through file modification times.
+    """
+
+    def __init__(self, cache_directory: str, max_bytes: int, logger):
+        if max_bytes <= 0:
+            raise ValueError("Cache size must be greater than 0.")
+        self.cache_directory = cache_directory
+        self.max_bytes = max_bytes
+        self.logger = logger
+        self._lock = Lock()
+        self._entries: "OrderedDict[str, tuple[str, int]]" = OrderedDict()
+        self._total_bytes = 0
+        self._digests: "OrderedDict[tuple, str]" = OrderedDict()
+        os.makedirs(self.cache_directory, exist_ok=True)
+        self._load_index()
+
+    def _load_index(self):
+        """Rebuild the LRU index from the files already in the directory."""
+        files = []
+        for name in os.listdir(self.cache_directory):
+            path = os.path.join(self.cache_directory, name)
+            if name.startswith(".") or not os.path.isfile(path):
+                continue
+            stat = os.stat(path)
+            files.append((stat.st_mtime, name, stat.st_size))
+        for _, name, size in sorted(files):
+            key = name.split(".", 1)[0]
+            self._entries[key] = (name, size)
+            self._total_bytes += size
+        self.logger.info(
+            f"Audio artifact cache loaded: {len(self._entries)} entries, "
+            f"{self._total_bytes // (1024 ** 2)}MB in {self.cache_directory}"
+        )
+
+    def _input_digest(self, input_file: str) -> str:
+        """SHA-256 of the file contents, memoized by path, size and mtime."""
+        stat = os.stat(input_file)
+        memo_key = (os.path.abspath(input_file), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            digest = self._digests.get(memo_key)
+            if digest is not None:
+                self._digests.move_to_end(memo_key)
+                return digest
+
+        sha = hashlib.sha256()
+        with open(input_file, "rb") as file:
+            for block in iter(lambda: file.read(HASH_BLOCK_SIZE), b""):
+                sha.update(block)
+        digest = sha.hexdigest()
+        with self._lock:
+            self._digests[memo_key] = digest
+            self._digests.move_to_end(memo_key)
+            while len(self._digests) > MAX_MEMOIZED_DIGESTS:
+                self._digests.popitem(last=False)
+        return digest
+
+    def make_key(self, input_file: str, processor_name: str, params: dict) -> str:
+        """
+        Build the cache key for running `processor_name` with `params` on
+        `input_file`.
+        """
+        payload = json.dumps(
+            {
+                "input": self._input_digest(input_file),
+                "processor": processor_name,
+                "params": params,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str, output_path: str) -> Optional[str]:
+        """
+        Copy the cached artifact for `key` to `output_path`.
+
+        Returns:
+            str | None: `output_path` on a hit, None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+        cached_path = os.path.join(self.cache_directory, entry[0])
+        try:
+            shutil.copyfile(cached_path, output_path)
+            os.utime(cached_path)
+        except FileNotFoundError:
+            # Evicted by another process sharing the directory.
+            with self._lock:
+                self._forget(key)
+            return None
+        self.logger.info(f"Audio artifact cache hit: {key[:12]} -> {output_path}")
+        return output_path
+
+    def put(self, key: str, artifact_path: str):
+        """
+        Store a copy of `artifact_path` under `key` and evict old entries if
+        the cache is over its size limit.
+        """
+        extension = os.path.splitext(artifact_path)[1]
+        name = f"{key}{extension}"
+        size = os.path.getsize(artifact_path)
+        if size > self.max_bytes:
+            self.logger.warning(
+                f"Artifact {artifact_path} ({size} bytes) exceeds the cache size."
+            )
+            return
+
+        # Copy to a temporary file first so readers never see a partial file.
+        fd, temp_path = tempfile.mkstemp(prefix=".", dir=self.cache_directory)
+        os.close(fd)
+        try:
+            shutil.copyfile(artifact_path, temp_path)
+            os.replace(temp_path, os.path.join(self.cache_directory, name))
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        with self._lock:
+            self._forget(key)
+            self._entries[key] = (name, size)
+            self._total_bytes += size
+            self._evict()
+        self.logger.info(f"Audio artifact cached: {key[:12]} ({size} bytes)")
+
+    def _forget(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry[1]
+
+    def _evict(self):
+        """Remove least recently used entries until under `max_bytes`."""
+        while self._total_bytes > self.max_bytes and self._entries:
+            key, (name, size) = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            try:
+                os.remove(os.path.join(self.cache_directory, name))
+            except FileNotFoundError:
+                pass
+            self.logger.info(f"Evicted audio artifact {key[:12]} ({size} bytes)")
@@ -0,0 +1,414 @@
+from typing import Iterable, List
+
+import numpy as np
+from pydub import AudioSegment
+
+# Energy envelopes are computed over fixed windows of this many milliseconds.
+ENERGY_WINDOW_MS = 10
+
+
+def segment_to_array(audio: AudioSegment) -> np.ndarray:
+    """
+    Return the samples of `audio` as a (frames, channels) integer array.
+    """
+    samples = np.array(audio.get_array_of_samples())
+    return samples.reshape(-1, audio.channels)
+
+
+def envelope_window_samples(frame_rate: int, window_ms: int = ENERGY_WINDOW_MS) -> int:
+    """
+    Samples per energy-envelope window. This is `window_ms` rounded down to
+    whole samples, so windows are slightly shorter than `window_ms` when
+    `frame_rate * window_ms` is not a multiple of 1000 (220 samples, not
+    220.5, at 22050 Hz).
+    """
+    return max(1, frame_rate * window_ms // 1000)
+
+
+def energy_envelope(
+    samples: np.ndarray, frame_rate: int, window_ms: int = ENERGY_WINDOW_MS
+) -> np.ndarray:
+    """
+    Vectorized RMS energy of the mono mix-down, one value per window of
+    `envelope_window_samples` samples. The last window may be shorter than
+    the others.
+
+    Args:
+        samples (np.ndarray): (frames, channels) or 1-D sample array.
+        frame_rate (int): Sample rate of `samples`.
+        window_ms (int): Nominal window length in milliseconds.
+
+    Returns:
+        np.ndarray: RMS value per window, in raw sample units.
+    """
+    mono = samples.mean(axis=1) if samples.ndim == 2 else samples.astype(np.float64)
+    if mono.size == 0:
+        return np.zeros(0)
+    window = envelope_window_samples(frame_rate, window_ms)
+    starts = np.arange(0, mono.size, window)
+    sums = np.add.reduceat(np.square(mono, dtype=np.float64), starts)
+    counts = np.diff(np.append(starts, mono.size))
+    return np.sqrt(sums / counts)
+
+
+def energy_envelope_stream(
+    segments: Iterable[AudioSegment], window_ms: int = ENERGY_WINDOW_MS
+):
+    """
+    `energy_envelope` over consecutive frames of one audio stream.
+
+    Windows follow the continuous sample stream: samples left over at the
+    end of a frame are carried into the next one, so frame boundaries do
+    not add partial windows and the result matches `energy_envelope` of
+    the whole signal.
+
+    Returns:
+        tuple[np.ndarray, int | None, int]: The envelope, the sample rate
+        (None for an empty stream) and the total number of frames.
+    """
+    envelopes = []
+    leftover = np.zeros(0)
+    frame_rate = window = None
+    frames = 0
+    for segment in segments:
+        samples = segment_to_array(segment)
+        if frame_rate is None:
+            frame_rate = segment.frame_rate
+            window = envelope_window_samples(frame_rate, window_ms)
+        frames += len(samples)
+        mono = np.concatenate((leftover, samples.mean(axis=1)))
+        complete = len(mono) // window * window
+        if complete:
+            squares = np.square(mono[:complete]).reshape(-1, window)
+            envelopes.append(np.sqrt(squares.mean(axis=1)))
+        leftover = mono[complete:]
+    if leftover.size:
+        envelopes.append(np.sqrt([np.square(leftover).mean()]))
+    envelope = np.concatenate(envelopes) if envelopes else np.zeros(0)
+    return envelope, frame_rate, frames
+
+
+def find_split_points(
+    envelope: np.ndarray,
+    chunk_duration_ms: int,
+    tolerance_ms: int,
+    frame_rate: int,
+    duration_ms: int,
+    window_ms: int = ENERGY_WINDOW_MS,
+) -> List[int]:
+    """
+    Choose chunk boundaries near every `chunk_duration_ms`, moved to the
+    quietest window within +/- `tolerance_ms` of the nominal cut.
+
+    Among windows that are (nearly) as quiet as the quietest one, the one
+    closest to the nominal cut wins, so long silences don't shorten chunks.
+    Window indices are converted to time with the window's exact length in
+    samples, so cuts don't drift over long inputs.
+
+    Args:
+        envelope (np.ndarray): Output of `energy_envelope`.
+        chunk_duration_ms (int): Nominal chunk length.
+        tolerance_ms (int): How far a cut may move from its nominal position.
+        frame_rate (int): Sample rate the envelope was computed at.
+        duration_ms (int): Length of the audio, as `len(AudioSegment)`.
+        window_ms (int): Nominal window length the envelope was built with.
+
+    Returns:
+        list[int]: Increasing cut positions in milliseconds, strictly between
+        0 and `duration_ms`.
+    """
+    window = envelope_window_samples(frame_rate, window_ms)
+    window_duration_ms = window * 1000 / frame_rate
+    tolerance_windows = max(0, int(tolerance_ms // window_duration_ms))
+    cuts = []
+    start = 0
+    while duration_ms - start > chunk_duration_ms:
+        target = round((start + chunk_duration_ms) / window_duration_ms)
+        lo = max(int(start // window_duration_ms) + 1, target - tolerance_windows)
+        hi = min(len(envelope), target + tolerance_windows + 1)
+        if hi <= lo:
+            break
+        candidates = envelope[lo:hi]
+        quiet = np.flatnonzero(candidates <= candidates.min() * 1.05 + 1e-9) + lo
+        best = int(quiet[np.argmin(np.abs(quiet - target))])
+        # Middle of the chosen window, from its position in samples.
+        cut = int((best * window + window // 2) * 1000 / frame_rate)
+        if not start < cut < duration_ms:
+            break
+        cuts.append(cut)
+        start = cut
+    return cuts
+
+
+def array_to_segment(samples: np.ndarray, like: AudioSegment) -> AudioSegment:
+    """
+    Build an AudioSegment from a (frames, channels) array, copying the
+    sample layout of `like`.
+    """
+    dtype = np.dtype(f"<i{like.sample_width}")
+    return AudioSegment(
+        data=np.ascontiguousarray(samples, dtype=dtype).tobytes(),
+        sample_width=like.sample_width,
+        frame_rate=like.frame_rate,
+        channels=like.channels,
+    )
+
+
+def _sample_bounds(sample_width: int):
+    max_possible = float(2 ** (8 * sample_width - 1))
+    return max_possible, -max_possible, max_possible - 1
+
+
+def apply_gain(samples: np.ndarray, sample_width: int, gain_db: float) -> np.ndarray:
+    """
+    Scale samples by `gain_db`, saturating like `AudioSegment.apply_gain`.
+    """
+    _, lowest, highest = _sample_bounds(sample_width)
+    factor = 10 ** (gain_db / 20)
+    scaled = np.floor(np.clip(samples * factor, lowest, highest))
+    return scaled.astype(samples.dtype)
+
+
+def peak_normalize(
+    samples: np.ndarray, sample_width: int, headroom: float = 0.1
+) -> np.ndarray:
+    """
+    Peak-normalize to `headroom` dB below full scale, the same gain rule as
+    `pydub.effects.normalize`.
+    """
+    peak = int(np.abs(samples).max()) if samples.size else 0
+    if peak == 0:
+        return samples
+    max_possible, _, _ = _sample_bounds(sample_width)
+    gain_db = 20 * np.log10(max_possible * 10 ** (-headroom / 20) / peak)
+    return apply_gain(samples, sample_width, gain_db)
+
+
+def rms_normalize(
+    samples: np.ndarray, sample_width: int, target_dbfs: float = -20.0
+) -> np.ndarray:
+    """
+    Scale samples so their RMS level is `target_dbfs`.
+    """
+    if not samples.size:
+        return samples
+    rms = np.sqrt(np.mean(np.square(samples, dtype=np.float64)))
+    if rms == 0:
+        return samples
+    max_possible, _, _ = _sample_bounds(sample_width)
+    gain_db = target_dbfs - 20 * np.log10(rms / max_possible)
+    return apply_gain(samples, sample_width, gain_db)
+
+
+def _energy_per_ms(
+    samples: np.ndarray, frame_rate: int, duration_ms: int, block_ms: int = 60_000
+) -> np.ndarray:
+    """
+    Sum of squared samples in each millisecond, using the same
+    millisecond-to-frame mapping as AudioSegment slicing. Computed in
+    blocks so the float64 temporaries stay small for long inputs.
+    """
+    bounds = np.arange(duration_ms + 1, dtype=np.int64) * frame_rate // 1000
+    bounds = np.minimum(bounds, len(samples))
+    energy = np.zeros(duration_ms)
+    for block_start in range(0, duration_ms, block_ms):
+        block_end = min(block_start + block_ms, duration_ms)
+        first, last = bounds[block_start], bounds[block_end]
+        block = np.square(samples[first:last], dtype=np.float64)
+        block = block.sum(axis=1) if block.ndim == 2 else block
+        offsets = bounds[block_start:block_end] - first
+        # reduceat can't express empty buckets; mask them out afterwards.
+        non_empty = offsets < (bounds[block_start + 1 : block_end + 1] - first)
+        if block.size:
+            sums = np.add.reduceat(block, np.minimum(offsets, block.size - 1))
+            energy[block_start:block_end] = np.where(non_empty, sums, 0.0)
+    return energy
+
+
+def detect_edge_silence(
+    samples: np.ndarray,
+    frame_rate: int,
+    sample_width: int,
+    silence_thresh: float = -16.0,
+    silence_len: int = 1000,
+):
+    """
+    Locate the non-silent region between leading and trailing silence.
+
+    Follows `pydub.silence.detect_silence`: a window of `silence_len` ms,
+    stepped by 1 ms, is silent when its RMS is at or below `silence_thresh`
+    dBFS, and silent windows closer than `silence_len` apart are merged.
+    The windowed RMS comes from a cumulative sum, not per-window slicing.
+
+    Returns:
+        tuple[int, int] | None: (start_ms, end_ms) of the audible region, or
+        None when the whole input is silent.
+    """
+    frames = len(samples)
+    channels = samples.shape[1] if samples.ndim == 2 else 1
+    duration_ms = round(1000 * frames / frame_rate)
+    if duration_ms < silence_len:
+        return 0, duration_ms
+
+    per_ms = _energy_per_ms(samples, frame_rate, duration_ms)
+    cumulative = np.concatenate(([0.0], np.cumsum(per_ms)))
+    last_start = duration_ms - silence_len
+    starts = np.arange(last_start + 1)
+    ends = starts + silence_len
+    lo = np.minimum(starts * frame_rate // 1000, frames)
+    hi = np.minimum(ends * frame_rate // 1000, frames)
+    counts = np.maximum((hi - lo) * channels, 1)
+    rms = np.floor(np.sqrt((cumulative[ends] - cumulative[starts]) / counts))
+
+    max_possible, _, _ = _sample_bounds(sample_width)
+    threshold = 10 ** (silence_thresh / 20) * max_possible
+    silent_starts = np.flatnonzero(rms <= threshold)
+    if not silent_starts.size:
+        return 0, duration_ms
+
+    # Boundaries between merged silent ranges, as in detect_silence.
+    breaks = np.flatnonzero(np.diff(silent_starts) > silence_len)
+    range_starts = np.concatenate(([silent_starts[0]], silent_starts[breaks + 1]))
+    range_ends = (
+        np.concatenate((silent_starts[breaks], [silent_starts[-1]])) + silence_len
+    )
+
+    start_ms, end_ms = 0, duration_ms
+    if range_starts[0] == 0:
+        if range_ends[0] >= duration_ms:
+            return None
+        start_ms = int(range_ends[0])
+    if range_ends[-1] >= duration_ms:
+        end_ms = int(range_starts[-1])
+    return start_ms, end_ms
+
+
+def detect_edge_silence_stream(
+    segments: Iterable[AudioSegment],
+    silence_thresh: float = -16.0,
+    silence_len: int = 1000,
+):
+    """
+    `detect_edge_silence` over consecutive frames of one audio stream, in
+    memory bounded by the frame size plus `silence_len`.
+
+    Per-millisecond energy uses the whole stream's millisecond-to-frame
+    mapping, and each `silence_len` window is classified as soon as its
+    last millisecond has arrived. Only the energy of windows still open is
+    kept, plus where the leading silent range ended and where the latest
+    one began, so frame boundaries don't change the result.
+
+    Returns:
+        tuple[tuple[int, int] | None, int]: The audible region (as returned
+        by `detect_edge_silence`) and the total number of frames.
+    """
+    frame_rate = channels = threshold = None
+    frames = 0
+    offset = 0  # First millisecond whose energy is still held.
+    energy = np.zeros(0)
+    next_start = 0  # Next window start to classify.
+    leading_silent = False
+    lead_end = None  # End of the leading silent range, once it is over.
+    run_start = last_silent = None  # Latest merged silent range so far.
+
+    def classify(stop: int, total_frames: int):
+        """Classify window starts in [next_start, stop)."""
+        nonlocal next_start, leading_silent, lead_end, run_start, last_silent
+        starts = np.arange(next_start, stop)
+        if not starts.size:
+            return
+        cumulative = np.concatenate(([0.0], np.cumsum(energy)))
+        relative = starts - offset
+        sums = cumulative[relative + silence_len] - cumulative[relative]
+        lo = np.minimum(starts * frame_rate // 1000, total_frames)
+        hi = np.minimum((starts + silence_len) * frame_rate // 1000, total_frames)
+        counts = np.maximum((hi - lo) * channels, 1)
+        rms = np.floor(np.sqrt(sums / counts))
+        silent = starts[rms <= threshold]
+        if next_start == 0:
+            leading_silent = bool(silent.size) and silent[0] == 0
+        next_start = stop
+        if not silent.size:
+            return
+
+        # Silent starts more than `silence_len` apart begin a new range, as
+        # silent windows are merged in detect_silence.
+        if run_start is None:
+            run_start = last_silent = int(silent[0])
+        gaps = np.diff(silent, prepend=last_silent)
+        breaks = np.flatnonzero(gaps > silence_len)
+        if breaks.size:
+            if leading_silent and lead_end is None:
+                first = breaks[0]
+                previous = silent[first - 1] if first else last_silent
+                lead_end = int(previous) + silence_len
+            run_start = int(silent[breaks[-1]])
+        last_silent = int(silent[-1])
+
+    for segment in segments:
+        samples = segment_to_array(segment)
+        if frame_rate is None:
+            frame_rate = segment.frame_rate
+            channels = segment.channels
+            max_possible, _, _ = _sample_bounds(segment.sample_width)
+            threshold = 10 ** (silence_thresh / 20) * max_possible
+        if not len(samples):
+            continue
+        # Millisecond m covers frames [m * rate // 1000, (m + 1) * rate // 1000).
+        positions = np.arange(frames + 1, frames + len(samples) + 1, dtype=np.int64)
+        ms = (positions * 1000 + frame_rate - 1) // frame_rate - 1
+        squares = np.square(samples, dtype=np.float64).sum(axis=1)
+        added = np.bincount(ms - offset, weights=squares)
+        energy = np.pad(energy, (0, max(len(added) - len(energy), 0)))
+        energy[: len(added)] += added
+        frames += len(samples)
+
+        complete_ms = ((frames + 1) * 1000 - 1) // frame_rate
+        classify(complete_ms - silence_len + 1, frames)
+        energy = energy[next_start - offset :]
+        offset = next_start
+
+    if not frames:
+        return (0, 0), 0
+    duration_ms = round(1000 * frames / frame_rate)
+    if duration_ms < silence_len:
+        return (0, duration_ms), frames
+
+    # Milliseconds past the last sample hold no energy, as in _energy_per_ms.
+    held = duration_ms - offset
+    energy = np.pad(energy[:held], (0, max(held - len(energy), 0)))
+    classify(duration_ms - silence_len + 1, frames)
+
+    last_start = duration_ms - silence_len
+    start_ms, end_ms = 0, duration_ms
+    if leading_silent:
+        if lead_end is None:
+            # The leading silent range is also the last one.
+            if last_silent == last_start:
+                return None, frames
+            lead_end = last_silent + silence_len
+        start_ms = lead_end
+    if last_silent == last_start:
+        end_ms = run_start
+    return (start_ms, end_ms), frames
+
+
+def trim_edge_silence(
+    audio: AudioSegment,
+    silence_thresh: float = -16.0,
+    silence_len: int = 1000,
+    padding: int = 100,
+) -> AudioSegment:
+    """
+    Trim leading and trailing silence, keeping `padding` ms on each side.
+    Matches `AudioSegment.strip_silence` whenever the audio has no interior
+    silence of `silence_len` or longer; interior silences are kept.
+    """
+    samples = segment_to_array(audio)
+    region = detect_edge_silence(
+        samples, audio.frame_rate, audio.sample_width, silence_thresh, silence_len
+    )
+    if region is None:
+        return audio[0:0]
+    start_ms, end_ms = region
+    return audio[max(start_ms - padding, 0) : min(end_ms + padding, len(audio))]
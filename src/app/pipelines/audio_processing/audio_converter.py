@@ -1,4 +1,13 @@
+from typing import Optional
+
+import numpy as np
+from pydub import AudioSegment
+
 from src.app.pipelines.audio_processing import AudioProcessorBase
+from src.app.pipelines.audio_processing.audio_stream import (
+    MODEL_SAMPLE_RATE,
+    decode_to_array,
+)
 
 
 class AudioConverter(AudioProcessorBase):
@@ -7,15 +16,57 @@ class AudioConverter(AudioProcessorBase):
     """
 
     def process(
-        self, input_file: str, output_file: str, target_format: str = "wav"
+        self,
+        input_file: str,
+        output_file: str,
+        target_format: str = "wav",
+        streaming: bool = False,
     ) -> str:
-        self.format = target_format
         try:
             self.logger.info(f"Converting {input_file} to {target_format}")
-            audio = self.load_audio(input_file)
-            converted_file = self.save_audio(audio, output_file)
+            cache_key = self._cache_key(
+                input_file, {"target_format": target_format, "streaming": streaming}
+            )
+            cached_file = self._restore_from_cache(cache_key, output_file)
+            if cached_file:
+                return cached_file
+            if streaming:
+                converted_file = self.save_audio_stream(
+                    self.stream_audio(input_file), output_file, target_format
+                )
+            else:
+                audio = self.load_audio(input_file)
+                converted_file = self.save_audio(audio, output_file, target_format)
+            self._store_in_cache(cache_key, converted_file)
             self.logger.info(f"Successfully converted {input_file} to {target_format}")
             return converted_file
         except Exception as e:
             self.logger.error(f"Error converting {input_file} to {target_format}: {e}")
             raise
+
+    def to_array(
+        self, input_file: str, sample_rate: int = MODEL_SAMPLE_RATE
+    ) -> np.ndarray:
+        """
+        Convert `input_file` to a mono float32 buffer at `sample_rate` for
+        direct hand-off to a transcriber, skipping the intermediate WAV.
+        """
+        try:
+            self.logger.info(f"Converting {input_file} to in-memory audio buffer")
+            with self.track("Convert to array"):
+                samples = decode_to_array(input_file, sample_rate)
+            self.logger.info(
+                f"Converted {input_file} to {len(samples) / sample_rate:.1f}s "
+                f"buffer at {sample_rate} Hz"
+            )
+            return samples
+        except Exception as e:
+            self.logger.error(f"Error converting {input_file} to array: {e}")
+            raise
+
+    def apply(self, audio: AudioSegment, target_format: str = "wav") -> AudioSegment:
+        # Conversion only changes the container/codec, which is chosen at encode.
+        return audio
+
+    def output_format(self, target_format: str = "wav", **kwargs) -> Optional[str]:
+        return target_format
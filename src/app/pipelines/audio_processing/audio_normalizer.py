@@ -1,19 +1,70 @@
-from pydub import effects
+import math
+
+from pydub import AudioSegment, effects
+from pydub.utils import db_to_float, ratio_to_db
 
 from src.app.pipelines.audio_processing import AudioProcessorBase
+from src.app.pipelines.audio_processing.audio_analysis import (
+    array_to_segment,
+    peak_normalize,
+    rms_normalize,
+    segment_to_array,
+)
+
+ENGINES = ("pydub", "numpy")
+METHODS = ("peak", "rms")
 
 
 class AudioNormalizer(AudioProcessorBase):
     """
     Normalizes audio_processing files to a standard volume level.
+
+    `method` is "peak" (scale the loudest sample to `headroom` dB below full
+    scale) or "rms" (scale the average level to `target_dbfs`). `engine`
+    selects pydub or the vectorized NumPy implementation. Peak results are
+    sample-identical; RMS results differ only by pydub's integer RMS rounding.
     """
 
-    def process(self, input_file: str, output_file: str) -> str:
+    def process(
+        self,
+        input_file: str,
+        output_file: str,
+        headroom: float = 0.1,
+        streaming: bool = False,
+        engine: str = "pydub",
+        method: str = "peak",
+        target_dbfs: float = -20.0,
+    ) -> str:
         try:
             self.logger.info(f"Normalizing audio_processing file: {input_file}")
-            audio = self.load_audio(input_file)
-            normalized_audio = effects.normalize(audio)
-            normalized_file = self.save_audio(normalized_audio, output_file)
+            cache_key = self._cache_key(
+                input_file,
+                {
+                    "headroom": headroom,
+                    "method": method,
+                    "target_dbfs": target_dbfs,
+                    "engine": engine,
+                    "streaming": streaming,
+                },
+            )
+            cached_file = self._restore_from_cache(cache_key, output_file)
+            if cached_file:
+                return cached_file
+            if streaming:
+                normalized_file = self._normalize_stream(
+                    input_file, output_file, headroom, method, target_dbfs
+                )
+            else:
+                audio = self.load_audio(input_file)
+                normalized_audio = self.apply(
+                    audio,
+                    headroom=headroom,
+                    engine=engine,
+                    method=method,
+                    target_dbfs=target_dbfs,
+                )
+                normalized_file = self.save_audio(normalized_audio, output_file)
+            self._store_in_cache(cache_key, normalized_file)
             self.logger.info(f"Successfully normalized {input_file}")
             return normalized_file
         except Exception as e:
@@ -21,3 +72,69 @@ class AudioNormalizer(AudioProcessorBase):
                 f"Error normalizing audio_processing file {input_file}: {e}"
             )
             raise
+
+    def apply(
+        self,
+        audio: AudioSegment,
+        headroom: float = 0.1,
+        engine: str = "pydub",
+        method: str = "peak",
+        target_dbfs: float = -20.0,
+    ) -> AudioSegment:
+        if engine not in ENGINES or method not in METHODS:
+            raise ValueError(
+                f"Unsupported normalization engine/method '{engine}'/'{method}'. "
+                f"Expected engine in {ENGINES} and method in {METHODS}."
+            )
+        if engine == "numpy":
+            samples = segment_to_array(audio)
+            if method == "peak":
+                samples = peak_normalize(samples, audio.sample_width, headroom)
+            else:
+                samples = rms_normalize(samples, audio.sample_width, target_dbfs)
+            return array_to_segment(samples, audio)
+
+        if method == "peak":
+            return effects.normalize(audio, headroom=headroom)
+        if audio.rms == 0:
+            return audio
+        return audio.apply_gain(target_dbfs - audio.dBFS)
+
+    def _normalize_stream(
+        self,
+        input_file: str,
+        output_file: str,
+        headroom: float,
+        method: str = "peak",
+        target_dbfs: float = -20.0,
+    ) -> str:
+        """
+        Two-pass normalization: the first pass measures the peak sample (or
+        the overall RMS), the second applies the resulting gain frame by frame.
+        """
+        peak = 0
+        squares = 0.0
+        samples = 0
+        max_possible = None
+        for frame in self.stream_audio(input_file):
+            frame_samples = int(frame.frame_count()) * frame.channels
+            peak = max(peak, frame.max)
+            squares += float(frame.rms) ** 2 * frame_samples
+            samples += frame_samples
+            max_possible = frame.max_possible_amplitude
+
+        if method == "rms":
+            rms = math.sqrt(squares / samples) if samples else 0.0
+            gain = target_dbfs - ratio_to_db(rms / max_possible) if rms else 0.0
+        elif peak == 0:
+            gain = 0.0
+        else:
+            target_peak = max_possible * db_to_float(-headroom)
+            gain = ratio_to_db(target_peak / peak)
+        self.logger.info(f"Applying {gain:.2f} dB gain to {input_file}")
+
+        frames = (
+            frame.apply_gain(gain) if gain else frame
+            for frame in self.stream_audio(input_file)
+        )
+        return self.save_audio_stream(frames, output_file)
@@ -1,27 +1,79 @@
 import os
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
+from typing import Iterable, Iterator, Optional
 
 from pydub import AudioSegment
 
+from src.app.pipelines.audio_processing.audio_stream import (
+    AudioStreamReader,
+    AudioStreamWriter,
+)
+
 
 class AudioProcessorBase(ABC):
-    def __init__(self, output_directory: str, logger, tracker=None, format: str = "wav"):
+    def __init__(
+        self,
+        output_directory: str,
+        logger,
+        tracker=None,
+        format: str = "wav",
+        frame_duration_ms: int = 1000,
+        cache=None,
+    ):
         self.output_directory = output_directory
         self.logger = logger
         self.tracker = tracker
         self.format = format
+        self.frame_duration_ms = frame_duration_ms
+        self.cache = cache
         os.makedirs(self.output_directory, exist_ok=True)
 
     def process_pipeline(self, input_file: str, output_file: str, *args, **kwargs):
         try:
+            cache_key = self._cache_key(input_file, {"args": args, **kwargs})
+            cached_file = self._restore_from_cache(cache_key, output_file)
+            if cached_file:
+                return cached_file
             audio = self.load_audio(input_file)
-            processed_audio = self.process(audio, *args, **kwargs)
+            processed_audio = self.apply(audio, *args, **kwargs)
             saved_file = self.save_audio(processed_audio, output_file)
+            self._store_in_cache(cache_key, saved_file)
             return saved_file
         except Exception as e:
             self.logger.error(f"Error processing file {input_file}: {e}")
             raise
 
+    def _cache_key(self, input_file: str, params: dict) -> Optional[str]:
+        """
+        Cache key for this processor's output on `input_file`, or None when no
+        cache is configured. The output format is always part of the key.
+        """
+        if self.cache is None:
+            return None
+        return self.cache.make_key(
+            input_file, type(self).__name__, {**params, "format": self.format}
+        )
+
+    def _restore_from_cache(
+        self, cache_key: Optional[str], output_file: str
+    ) -> Optional[str]:
+        """Copy a cached artifact to `output_file`, skipping the decode."""
+        if cache_key is None:
+            return None
+        return self.cache.get(
+            cache_key, os.path.join(self.output_directory, output_file)
+        )
+
+    def _store_in_cache(self, cache_key: Optional[str], saved_file: str):
+        if cache_key is None:
+            return
+        try:
+            self.cache.put(cache_key, saved_file)
+        except OSError as e:
+            # A cache failure must never fail the processing itself.
+            self.logger.warning(f"Failed to cache {saved_file}: {e}")
+
     def load_audio(self, input_file: str) -> AudioSegment:
         if not input_file.strip():
             self.logger.error("Empty file path provided for loading audio.")
@@ -33,14 +85,33 @@ class AudioProcessorBase(ABC):
             self.logger.error(f"Failed to load audio file {input_file}: {e}")
             raise
 
-    def save_audio(self, audio: AudioSegment, output_file: str) -> str:
+    def stream_audio(self, input_file: str) -> Iterator[AudioSegment]:
+        """
+        Decode an audio file lazily, yielding frames of `frame_duration_ms`.
+        Each call starts a fresh decode, so callers may stream a file twice
+        (e.g. an analysis pass followed by a write pass).
+        """
+        if not input_file.strip():
+            self.logger.error("Empty file path provided for streaming audio.")
+            raise ValueError("Empty file path is not allowed.")
+        try:
+            self.logger.info(f"Streaming audio file: {input_file}")
+            return iter(AudioStreamReader(input_file, self.frame_duration_ms))
+        except Exception as e:
+            self.logger.error(f"Failed to stream audio file {input_file}: {e}")
+            raise
+
+    def save_audio(
+        self, audio: AudioSegment, output_file: str, format: Optional[str] = None
+    ) -> str:
+        """Encode `audio` to `output_file` as `format` (default `self.format`)."""
         if not output_file.strip():
             self.logger.error("Empty file path provided for saving audio.")
             raise ValueError("Empty file path is not allowed.")
         output_path = os.path.join(self.output_directory, output_file)
         try:
             self.logger.info(f"Saving audio to {output_path}")
-            audio.export(output_path, format=self.format)
+            audio.export(output_path, format=format or self.format)
             if self.tracker:
                 self.tracker.track_execution("save_audio", {"file": output_path})
             return output_path
@@ -48,6 +119,71 @@ class AudioProcessorBase(ABC):
             self.logger.error(f"Failed to save audio file {output_file}: {e}")
             raise
 
+    def open_audio_writer(
+        self,
+        output_file: str,
+        frame_rate: int,
+        channels: int,
+        format: Optional[str] = None,
+    ) -> AudioStreamWriter:
+        """
+        Create an unopened stream writer for `output_file` in the output directory.
+        """
+        if not output_file.strip():
+            self.logger.error("Empty file path provided for saving audio.")
+            raise ValueError("Empty file path is not allowed.")
+        output_path = os.path.join(self.output_directory, output_file)
+        return AudioStreamWriter(
+            output_path, format or self.format, frame_rate, channels
+        )
+
+    def save_audio_stream(
+        self,
+        frames: Iterable[AudioSegment],
+        output_file: str,
+        format: Optional[str] = None,
+    ) -> str:
+        """
+        Encode a stream of frames to `output_file`, one frame at a time.
+        The output sample layout is taken from the first frame.
+        """
+        frames = iter(frames)
+        try:
+            first_frame = next(frames, None)
+            if first_frame is None:
+                raise ValueError(f"No audio frames to save to {output_file}.")
+            writer = self.open_audio_writer(
+                output_file, first_frame.frame_rate, first_frame.channels, format
+            )
+            self.logger.info(f"Streaming audio to {writer.output_path}")
+            with writer:
+                writer.write(first_frame)
+                for frame in frames:
+                    writer.write(frame)
+            return writer.output_path
+        except Exception as e:
+            self.logger.error(f"Failed to stream audio to file {output_file}: {e}")
+            raise
+
+    def track(self, operation_name: str):
+        """Track an operation if a tracker is configured."""
+        if self.tracker:
+            return self.tracker.track_execution(operation_name)
+        return nullcontext()
+
+    def apply(self, audio: AudioSegment, *args, **kwargs) -> AudioSegment:
+        """
+        Transform an already decoded segment in memory. Used by
+        `process_pipeline` and by `FusedAudioPipeline` stages.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support in-memory processing."
+        )
+
+    def output_format(self, **kwargs) -> Optional[str]:
+        """Format this processor wants its output encoded in, if any."""
+        return None
+
     @abstractmethod
     def process(self, audio: AudioSegment, *args, **kwargs) -> AudioSegment:
         pass
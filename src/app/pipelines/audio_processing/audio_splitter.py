@@ -1,27 +1,78 @@
-from typing import List
+import itertools
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Iterable, Iterator, List, Tuple
+
+from pydub import AudioSegment
 
 from src.app.pipelines.audio_processing import AudioProcessorBase
+from src.app.pipelines.audio_processing.audio_analysis import (
+    energy_envelope,
+    energy_envelope_stream,
+    find_split_points,
+    segment_to_array,
+)
+
+SPLIT_MODES = ("fixed", "silence")
 
 
 class AudioSplitter(AudioProcessorBase):
     """
     Splits audio_processing files into smaller chunks.
+
+    In "fixed" mode chunks are cut every `chunk_duration_ms`. In "silence"
+    mode each cut is moved to the quietest point within `tolerance_ms` of
+    the nominal boundary, so chunks don't end in the middle of a word.
     """
 
     def process(
-        self, input_file: str, chunk_duration_ms: int, output_file_prefix: str
+        self,
+        input_file: str,
+        chunk_duration_ms: int,
+        output_file_prefix: str,
+        streaming: bool = False,
+        export_workers: int = 1,
+        split_mode: str = "fixed",
+        tolerance_ms: int = 2000,
     ) -> List[str]:
+        """
+        Split `input_file` into chunks named `<prefix>_chunk<idx>.<format>`.
+        With `export_workers` > 1, chunk encoding is spread across a process
+        pool; chunks are produced lazily and at most two per worker are in
+        flight at any time.
+        """
         try:
             self.logger.info(f"Splitting audio_processing file: {input_file}")
-            audio = self.load_audio(input_file)
-            chunks = [
-                audio[i : i + chunk_duration_ms]
-                for i in range(0, len(audio), chunk_duration_ms)
-            ]
-            chunk_files = []
-            for idx, chunk in enumerate(chunks):
-                chunk_file = f"{output_file_prefix}_chunk{idx}.{self.format}"
-                chunk_files.append(self.save_audio(chunk, chunk_file))
+            if streaming:
+                cuts = self._stream_cut_points(
+                    input_file, chunk_duration_ms, split_mode, tolerance_ms
+                )
+                if export_workers > 1:
+                    chunk_files = self._export_chunks_parallel(
+                        self._iter_stream_chunks(input_file, cuts),
+                        output_file_prefix,
+                        export_workers,
+                    )
+                else:
+                    chunk_files = self._split_stream(
+                        input_file, cuts, output_file_prefix
+                    )
+            else:
+                audio = self.load_audio(input_file)
+                chunks = self._iter_chunks(
+                    audio, chunk_duration_ms, split_mode, tolerance_ms
+                )
+                if export_workers > 1:
+                    chunk_files = self._export_chunks_parallel(
+                        chunks, output_file_prefix, export_workers
+                    )
+                else:
+                    chunk_files = [
+                        self.save_audio(
+                            chunk, self._chunk_file_name(output_file_prefix, idx)
+                        )
+                        for idx, chunk in enumerate(chunks)
+                    ]
             self.logger.info(f"Split audio_processing into {len(chunk_files)} chunks.")
             return chunk_files
         except Exception as e:
@@ -29,3 +80,222 @@ class AudioSplitter(AudioProcessorBase):
                 f"Error splitting audio_processing file {input_file}: {e}"
             )
             raise
+
+    def apply(
+        self,
+        audio: AudioSegment,
+        chunk_duration_ms: int,
+        split_mode: str = "fixed",
+        tolerance_ms: int = 2000,
+    ) -> List[AudioSegment]:
+        return list(
+            self._iter_chunks(audio, chunk_duration_ms, split_mode, tolerance_ms)
+        )
+
+    def _chunk_file_name(self, output_file_prefix: str, idx: int) -> str:
+        return f"{output_file_prefix}_chunk{idx}.{self.format}"
+
+    def _check_split_mode(self, split_mode: str):
+        if split_mode not in SPLIT_MODES:
+            self.logger.error(f"Unsupported split mode: {split_mode}")
+            raise ValueError(
+                f"Unsupported split mode '{split_mode}'. Expected one of {SPLIT_MODES}."
+            )
+
+    def _iter_chunks(
+        self,
+        audio: AudioSegment,
+        chunk_duration_ms: int,
+        split_mode: str = "fixed",
+        tolerance_ms: int = 2000,
+    ) -> Iterator[AudioSegment]:
+        self._check_split_mode(split_mode)
+        if split_mode == "fixed":
+            for i in range(0, len(audio), chunk_duration_ms):
+                yield audio[i : i + chunk_duration_ms]
+            return
+
+        with self.track("Silence analysis"):
+            envelope = energy_envelope(segment_to_array(audio), audio.frame_rate)
+            cuts = find_split_points(
+                envelope, chunk_duration_ms, tolerance_ms, audio.frame_rate, len(audio)
+            )
+        for start, end in itertools.pairwise([0, *cuts, len(audio)]):
+            if end > start:
+                yield audio[start:end]
+
+    def _stream_cut_points(
+        self,
+        input_file: str,
+        chunk_duration_ms: int,
+        split_mode: str,
+        tolerance_ms: int,
+    ) -> Iterator[int]:
+        """
+        Cut positions in milliseconds for a streamed split. Silence mode runs
+        an analysis pass that keeps only the energy envelope (one float per
+        window), not the audio itself, and finds the same cuts as the
+        in-memory split.
+        """
+        self._check_split_mode(split_mode)
+        if split_mode == "fixed":
+            return itertools.count(chunk_duration_ms, chunk_duration_ms)
+
+        with self.track("Silence analysis"):
+            envelope, frame_rate, frames = energy_envelope_stream(
+                self.stream_audio(input_file)
+            )
+            if frame_rate is None:
+                return iter(())
+            duration_ms = round(1000 * frames / frame_rate)
+            cuts = find_split_points(
+                envelope, chunk_duration_ms, tolerance_ms, frame_rate, duration_ms
+            )
+        return iter(cuts)
+
+    def _iter_stream_pieces(
+        self, input_file: str, cuts_ms: Iterator[int]
+    ) -> Iterator[Tuple[int, AudioSegment]]:
+        """
+        Yield `(chunk_idx, piece)` pairs, where pieces are slices of decoded
+        frames that never straddle a cut. Cuts are converted to sample
+        positions so chunk lengths don't drift.
+        """
+        chunk_idx = 0
+        consumed = 0
+        next_cut = next(cuts_ms, None)
+        for frame in self.stream_audio(input_file):
+            position = 0
+            frame_samples = int(frame.frame_count())
+            while position < frame_samples:
+                cut_sample = (
+                    None if next_cut is None else next_cut * frame.frame_rate // 1000
+                )
+                if cut_sample is not None and consumed >= cut_sample:
+                    chunk_idx += 1
+                    next_cut = next(cuts_ms, None)
+                    continue
+                take = frame_samples - position
+                if cut_sample is not None:
+                    take = min(take, cut_sample - consumed)
+                yield chunk_idx, frame.get_sample_slice(position, position + take)
+                position += take
+                consumed += take
+
+    def _split_stream(
+        self, input_file: str, cuts_ms: Iterator[int], output_file_prefix: str
+    ) -> List[str]:
+        """
+        Split while decoding: pieces are written straight into the current
+        chunk's encoder, so only one frame is held in memory at a time.
+        """
+        chunk_files = []
+        writer = None
+        try:
+            for chunk_idx, piece in self._iter_stream_pieces(input_file, cuts_ms):
+                if writer is not None and chunk_idx != len(chunk_files):
+                    writer.close()
+                    chunk_files.append(writer.output_path)
+                    writer = None
+                if writer is None:
+                    writer = self.open_audio_writer(
+                        self._chunk_file_name(output_file_prefix, chunk_idx),
+                        piece.frame_rate,
+                        piece.channels,
+                    ).open()
+                writer.write(piece)
+            if writer is not None:
+                writer.close()
+                chunk_files.append(writer.output_path)
+                writer = None
+        finally:
+            if writer is not None:
+                writer.abort()
+        return chunk_files
+
+    def _iter_stream_chunks(
+        self, input_file: str, cuts_ms: Iterator[int]
+    ) -> Iterator[AudioSegment]:
+        """
+        Assemble whole chunks from streamed pieces, holding at most one chunk
+        (plus one frame) in memory.
+        """
+        current_idx = 0
+        pieces = []
+        for chunk_idx, piece in self._iter_stream_pieces(input_file, cuts_ms):
+            if chunk_idx != current_idx and pieces:
+                yield self._join_pieces(pieces)
+                pieces = []
+            current_idx = chunk_idx
+            pieces.append(piece)
+        if pieces:
+            yield self._join_pieces(pieces)
+
+    @staticmethod
+    def _join_pieces(pieces: List[AudioSegment]) -> AudioSegment:
+        first = pieces[0]
+        return AudioSegment(
+            data=b"".join(piece.raw_data for piece in pieces),
+            sample_width=first.sample_width,
+            frame_rate=first.frame_rate,
+            channels=first.channels,
+        )
+
+    def _export_chunks_parallel(
+        self, chunks: Iterable[AudioSegment], output_file_prefix: str, workers: int
+    ) -> List[str]:
+        """
+        Encode chunks in a process pool. Submission is bounded so chunks are
+        pulled from the iterable only as workers free up; results are
+        returned in chunk order regardless of completion order.
+        """
+        chunk_files = {}
+        max_in_flight = workers * 2
+        with self.track("Parallel chunk export"), ProcessPoolExecutor(
+            max_workers=workers
+        ) as executor:
+            in_flight = set()
+            for idx, chunk in enumerate(chunks):
+                output_path = os.path.join(
+                    self.output_directory,
+                    self._chunk_file_name(output_file_prefix, idx),
+                )
+                in_flight.add(
+                    executor.submit(
+                        _export_chunk,
+                        idx,
+                        chunk.raw_data,
+                        chunk.sample_width,
+                        chunk.frame_rate,
+                        chunk.channels,
+                        output_path,
+                        self.format,
+                    )
+                )
+                if len(in_flight) >= max_in_flight:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    chunk_files.update(future.result() for future in done)
+            for future in in_flight:
+                idx, output_path = future.result()
+                chunk_files[idx] = output_path
+        return [chunk_files[idx] for idx in sorted(chunk_files)]
+
+
+def _export_chunk(
+    idx: int,
+    raw_data: bytes,
+    sample_width: int,
+    frame_rate: int,
+    channels: int,
+    output_path: str,
+    format: str,
+):
+    """Encode one chunk in a worker process."""
+    chunk = AudioSegment(
+        data=raw_data,
+        sample_width=sample_width,
+        frame_rate=frame_rate,
+        channels=channels,
+    )
+    chunk.export(output_path, format=format)
+    return idx, output_path
@@ -0,0 +1,223 @@
+import subprocess
+from typing import Iterator, Optional
+
+import numpy as np
+from pydub import AudioSegment
+from pydub.utils import mediainfo
+
+# Streams are always decoded to signed 16-bit little-endian PCM.
+PCM_FORMAT = "s16le"
+PCM_SAMPLE_WIDTH = 2
+
+# Sample rate expected by Whisper-family models.
+MODEL_SAMPLE_RATE = 16000
+
+
+def decode_to_array(
+    input_file: str,
+    sample_rate: int = MODEL_SAMPLE_RATE,
+    start_s: float = 0.0,
+    duration_s: Optional[float] = None,
+) -> np.ndarray:
+    """
+    Decode an audio file straight to a mono float32 array in [-1, 1] at
+    `sample_rate`, the input format transcription models consume.
+    Nothing is written to disk. `start_s` and `duration_s` decode only that
+    span, so long files can be processed a window at a time.
+    """
+    command = [AudioSegment.converter, "-nostdin", "-v", "error"]
+    if start_s:
+        command += ["-ss", str(start_s)]
+    command += ["-i", input_file]
+    if duration_s is not None:
+        command += ["-t", str(duration_s)]
+    command += [
+        "-f",
+        "f32le",
+        "-acodec",
+        "pcm_f32le",
+        "-ac",
+        "1",
+        "-ar",
+        str(sample_rate),
+        "-",
+    ]
+    result = subprocess.run(command, capture_output=True)
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"ffmpeg failed to decode {input_file}: "
+            f"{result.stderr.decode(errors='replace').strip()}"
+        )
+    return np.frombuffer(result.stdout, dtype=np.float32)
+
+
+class AudioStreamReader:
+    """
+    Decodes an audio file through an ffmpeg pipe and yields fixed-size PCM
+    frames as AudioSegment objects, so peak memory is bounded by the frame
+    size instead of the file length.
+    """
+
+    def __init__(
+        self,
+        input_file: str,
+        frame_duration_ms: int = 1000,
+        frame_rate: Optional[int] = None,
+        channels: Optional[int] = None,
+    ):
+        if frame_duration_ms <= 0:
+            raise ValueError("Frame duration must be greater than 0.")
+        self.input_file = input_file
+        self.frame_duration_ms = frame_duration_ms
+
+        if frame_rate is None or channels is None:
+            info = mediainfo(input_file)
+            frame_rate = frame_rate or int(info.get("sample_rate") or 44100)
+            channels = channels or int(info.get("channels") or 2)
+        self.frame_rate = frame_rate
+        self.channels = channels
+
+    @property
+    def frame_bytes(self) -> int:
+        """Number of PCM bytes in one full frame."""
+        samples = max(1, self.frame_rate * self.frame_duration_ms // 1000)
+        return samples * self.channels * PCM_SAMPLE_WIDTH
+
+    def _command(self) -> list:
+        return [
+            AudioSegment.converter,
+            "-nostdin",
+            "-v",
+            "error",
+            "-i",
+            self.input_file,
+            "-f",
+            PCM_FORMAT,
+            "-acodec",
+            f"pcm_{PCM_FORMAT}",
+            "-ac",
+            str(self.channels),
+            "-ar",
+            str(self.frame_rate),
+            "-",
+        ]
+
+    def __iter__(self) -> Iterator[AudioSegment]:
+        process = subprocess.Popen(
+            self._command(), stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        completed = False
+        try:
+            while True:
+                data = process.stdout.read(self.frame_bytes)
+                if not data:
+                    break
+                yield AudioSegment(
+                    data=data,
+                    sample_width=PCM_SAMPLE_WIDTH,
+                    frame_rate=self.frame_rate,
+                    channels=self.channels,
+                )
+            completed = True
+        finally:
+            process.stdout.close()
+            if not completed and process.poll() is None:
+                # The consumer stopped early; don't wait for ffmpeg to finish.
+                process.kill()
+            stderr = process.stderr.read()
+            process.stderr.close()
+            process.wait()
+
+        if process.returncode != 0:
+            raise RuntimeError(
+                f"ffmpeg failed to decode {self.input_file}: "
+                f"{stderr.decode(errors='replace').strip()}"
+            )
+
+
+class AudioStreamWriter:
+    """
+    Encodes PCM frames to an output file through an ffmpeg pipe.
+    Frames are converted to the writer's sample layout before being written.
+    """
+
+    def __init__(
+        self,
+        output_path: str,
+        format: str,
+        frame_rate: int,
+        channels: int,
+    ):
+        self.output_path = output_path
+        self.format = format
+        self.frame_rate = frame_rate
+        self.channels = channels
+        self._process = None
+
+    def _command(self) -> list:
+        return [
+            AudioSegment.converter,
+            "-nostdin",
+            "-y",
+            "-v",
+            "error",
+            "-f",
+            PCM_FORMAT,
+            "-ar",
+            str(self.frame_rate),
+            "-ac",
+            str(self.channels),
+            "-i",
+            "-",
+            "-f",
+            self.format,
+            self.output_path,
+        ]
+
+    def open(self) -> "AudioStreamWriter":
+        self._process = subprocess.Popen(
+            self._command(), stdin=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        return self
+
+    def write(self, frame: AudioSegment):
+        if self._process is None:
+            raise RuntimeError("Writer is not open.")
+        frame = (
+            frame.set_sample_width(PCM_SAMPLE_WIDTH)
+            .set_frame_rate(self.frame_rate)
+            .set_channels(self.channels)
+        )
+        self._process.stdin.write(frame.raw_data)
+
+    def close(self):
+        if self._process is None:
+            return
+        process, self._process = self._process, None
+        process.stdin.close()
+        stderr = process.stderr.read()
+        process.stderr.close()
+        process.wait()
+        if process.returncode != 0:
+            raise RuntimeError(
+                f"ffmpeg failed to encode {self.output_path}: "
+                f"{stderr.decode(errors='replace').strip()}"
+            )
+
+    def abort(self):
+        """Stop the encoder without checking its exit status."""
+        if self._process is None:
+            return
+        process, self._process = self._process, None
+        process.kill()
+        process.wait()
+
+    def __enter__(self) -> "AudioStreamWriter":
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            # Don't mask the original error with ffmpeg's exit status.
+            self.abort()
+        else:
+            self.close()
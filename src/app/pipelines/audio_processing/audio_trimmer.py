@@ -1,21 +1,115 @@
+from pydub import AudioSegment
+
 from src.app.pipelines.audio_processing import AudioProcessorBase
+from src.app.pipelines.audio_processing.audio_analysis import (
+    detect_edge_silence_stream,
+    trim_edge_silence,
+)
+
+ENGINES = ("pydub", "numpy")
 
 
 class AudioTrimmer(AudioProcessorBase):
     """
     Trims silence from the beginning and end of audio_processing files.
+
+    The "pydub" engine uses `AudioSegment.strip_silence`; the "numpy" engine
+    detects leading/trailing silence with a vectorized windowed RMS and gives
+    the same result unless the audio has long interior silences, which it
+    keeps rather than removes. Streaming always uses the "numpy" detection,
+    fed frame by frame.
     """
 
     def process(
-        self, input_file: str, output_file: str, silence_thresh: int = -40
+        self,
+        input_file: str,
+        output_file: str,
+        silence_thresh: int = -40,
+        streaming: bool = False,
+        engine: str = "pydub",
     ) -> str:
         try:
             self.logger.info(f"Trimming silence from {input_file}")
-            audio = self.load_audio(input_file)
-            trimmed_audio = audio.strip_silence(silence_thresh=silence_thresh)
-            trimmed_file = self.save_audio(trimmed_audio, output_file)
+            cache_key = self._cache_key(
+                input_file,
+                {
+                    "silence_thresh": silence_thresh,
+                    "engine": engine,
+                    "streaming": streaming,
+                },
+            )
+            cached_file = self._restore_from_cache(cache_key, output_file)
+            if cached_file:
+                return cached_file
+            if streaming:
+                trimmed_file = self._trim_stream(
+                    input_file, output_file, silence_thresh
+                )
+            else:
+                audio = self.load_audio(input_file)
+                trimmed_audio = self.apply(
+                    audio, silence_thresh=silence_thresh, engine=engine
+                )
+                trimmed_file = self.save_audio(trimmed_audio, output_file)
+            self._store_in_cache(cache_key, trimmed_file)
             self.logger.info(f"Successfully trimmed {input_file}")
             return trimmed_file
         except Exception as e:
             self.logger.error(f"Error trimming audio_processing file {input_file}: {e}")
             raise
+
+    def apply(
+        self, audio: AudioSegment, silence_thresh: int = -40, engine: str = "pydub"
+    ) -> AudioSegment:
+        if engine not in ENGINES:
+            raise ValueError(
+                f"Unsupported trimming engine '{engine}'. Expected one of {ENGINES}."
+            )
+        if engine == "numpy":
+            return trim_edge_silence(audio, silence_thresh=silence_thresh)
+        return audio.strip_silence(silence_thresh=silence_thresh)
+
+    def _trim_stream(
+        self,
+        input_file: str,
+        output_file: str,
+        silence_thresh: int,
+        silence_len: int = 1000,
+        padding: int = 100,
+    ) -> str:
+        """
+        Two-pass leading/trailing trim. The first pass runs the same windowed
+        RMS edge detection as the "numpy" engine over the streamed frames;
+        the second writes the audible region, padded by `padding` ms as
+        `strip_silence` does, cutting frames at sample boundaries. Input that
+        is silent throughout gives empty audio, as on the in-memory path.
+        """
+        region, frame_count = detect_edge_silence_stream(
+            self.stream_audio(input_file), silence_thresh, silence_len
+        )
+
+        def trimmed_frames():
+            offset = 0
+            first = last = None
+            for frame in self.stream_audio(input_file):
+                if region is None:
+                    # Keep the sample layout for the writer, but no samples.
+                    yield frame.get_sample_slice(0, 0)
+                    return
+                if first is None:
+                    start_ms, end_ms = region
+                    # Same millisecond-to-frame mapping as AudioSegment slicing.
+                    rate = frame.frame_rate
+                    duration_ms = round(1000 * frame_count / rate)
+                    first = int(max(start_ms - padding, 0) * rate / 1000)
+                    last = int(min(end_ms + padding, duration_ms) * rate / 1000)
+                count = int(frame.frame_count())
+                if offset >= last:
+                    break
+                if offset + count > first:
+                    yield frame.get_sample_slice(
+                        max(first - offset, 0), min(last - offset, count)
+                    )
+                offset += count
+
+        return self.save_audio_stream(trimmed_frames(), output_file)
@@ -0,0 +1,78 @@
+from typing import List, Sequence, Tuple, Union
+
+from pydub import AudioSegment
+
+from src.app.pipelines.audio_processing import AudioProcessorBase
+
+Stage = Union[AudioProcessorBase, Tuple[AudioProcessorBase, dict]]
+
+
+class FusedAudioPipeline(AudioProcessorBase):
+    """
+    Runs an ordered chain of audio processors over a single decoded buffer.
+
+    The input is decoded once, each stage transforms the in-memory segment via
+    its `apply` method, and only the final output(s) are encoded. A splitter
+    may only appear as the last stage, since it turns one segment into many.
+    """
+
+    def __init__(
+        self,
+        stages: Sequence[Stage],
+        output_directory: str,
+        logger,
+        tracker=None,
+        format: str = "wav",
+    ):
+        super().__init__(output_directory, logger, tracker, format)
+        if not stages:
+            raise ValueError("FusedAudioPipeline requires at least one stage.")
+        self.stages = [
+            stage if isinstance(stage, tuple) else (stage, {}) for stage in stages
+        ]
+
+    def process(self, input_file: str, output_file: str) -> Union[str, List[str]]:
+        """
+        Run all stages on `input_file`. Returns the saved file, or the list of
+        chunk files when the last stage splits the audio. When splitting,
+        `output_file` is used as the chunk file prefix.
+        """
+        try:
+            self.logger.info(
+                f"Running fused pipeline on {input_file}: "
+                f"{' -> '.join(type(p).__name__ for p, _ in self.stages)}"
+            )
+            with self.track("Fused stage: decode"):
+                audio = self.load_audio(input_file)
+
+            # A local, not self.format: the pipeline may run concurrently.
+            output_format = self.format
+            for position, (processor, params) in enumerate(self.stages):
+                stage_name = type(processor).__name__
+                with self.track(f"Fused stage: {stage_name}"):
+                    audio = processor.apply(audio, **params)
+                output_format = processor.output_format(**params) or output_format
+                if isinstance(audio, list) and position != len(self.stages) - 1:
+                    raise ValueError(
+                        f"{stage_name} produces multiple segments and must be "
+                        f"the last stage."
+                    )
+
+            with self.track("Fused stage: encode"):
+                if isinstance(audio, list):
+                    saved = self._save_chunks(audio, output_file, output_format)
+                else:
+                    saved = self.save_audio(audio, output_file, output_format)
+            self.logger.info(f"Fused pipeline completed for {input_file}")
+            return saved
+        except Exception as e:
+            self.logger.error(f"Error in fused pipeline for {input_file}: {e}")
+            raise
+
+    def _save_chunks(
+        self, chunks: List[AudioSegment], output_file_prefix: str, format: str
+    ) -> List[str]:
+        return [
+            self.save_audio(chunk, f"{output_file_prefix}_chunk{idx}.{format}", format)
+            for idx, chunk in enumerate(chunks)
+        ]
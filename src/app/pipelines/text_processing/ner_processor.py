@@ -1,13 +1,52 @@
+from functools import lru_cache
+from typing import Iterable, List
+
 import spacy
 
 from src.app.pipelines.text_processing.text_processor_base import TextProcessorBase
 
+# Components that set `doc.ents`. Only these, and the embedding layers they
+# listen to, run for NER; the tagger, parser, lemmatizer, ... are skipped.
+ENTITY_COMPONENTS = ("entity_ruler", "ner")
+
+
+@lru_cache(maxsize=None)
+def load_ner_model(spacy_model: str):
+    """
+    Load a spaCy pipeline, cached per process so processors created for each
+    task share one model. The cached pipeline is never modified; components
+    are disabled per call instead.
+    """
+    return spacy.load(spacy_model)
+
+
+def ner_pipes(nlp) -> List[str]:
+    """
+    Names of the components NER needs: ENTITY_COMPONENTS plus any shared
+    `tok2vec` or `transformer` one of them listens to. In pipelines where
+    `ner` embeds on its own (e.g. en_core_web_sm), the shared tok2vec only
+    feeds the tagger and parser and is skipped too.
+    """
+    return [
+        name
+        for name, component in nlp.pipeline
+        if name in ENTITY_COMPONENTS
+        or any(
+            listener in ENTITY_COMPONENTS
+            for listener in getattr(component, "listening_components", ())
+        )
+    ]
+
 
 class NERProcessor(TextProcessorBase):
     def __init__(self, spacy_model="en_core_web_sm", *args, **kwargs):
         super().__init__(*args, **kwargs)
         try:
-            self.spacy_model = spacy.load(spacy_model)
+            self.spacy_model = load_ner_model(spacy_model)
+            needed = ner_pipes(self.spacy_model)
+            self.disabled_pipes = [
+                name for name in self.spacy_model.pipe_names if name not in needed
+            ]
             self.logger.info(f"spaCy model '{spacy_model}' loaded successfully.")
         except Exception as e:
             self.logger.error(f"Error loading spaCy model '{spacy_model}': {e}")
@@ -18,9 +57,39 @@ class NERProcessor(TextProcessorBase):
         if not self.validate_text(text):
             return []
 
-        doc = self.spacy_model(text)
-        entities = [
-            {"text_processing": ent.text, "label": ent.label_} for ent in doc.ents
-        ]
+        doc = self.spacy_model(text, disable=self.disabled_pipes)
+        entities = self._entities(doc)
         self.logger.info(f"Found {len(entities)} named entities.")
         return entities
+
+    def process_many(
+        self, texts: Iterable[str], batch_size: int = 64, n_process: int = 1
+    ) -> List[list]:
+        """
+        Perform NER on many texts with `nlp.pipe`, which batches texts through
+        the model and can fan out to `n_process` worker processes.
+
+        Returns:
+            list[list]: The entities of each text, in input order. Invalid
+            texts yield an empty list.
+        """
+        texts = list(texts)
+        valid = [i for i, text in enumerate(texts) if self.validate_text(text)]
+        results: List[list] = [[] for _ in texts]
+        with self.tracker.track_execution(f"NER on {len(valid)} texts"):
+            docs = self.spacy_model.pipe(
+                (texts[i] for i in valid),
+                batch_size=batch_size,
+                n_process=n_process,
+                disable=self.disabled_pipes,
+            )
+            for index, doc in zip(valid, docs, strict=True):
+                results[index] = self._entities(doc)
+        self.logger.info(
+            f"Found {sum(map(len, results))} named entities in {len(texts)} texts."
+        )
+        return results
+
+    @staticmethod
+    def _entities(doc) -> list:
+        return [{"text_processing": ent.text, "label": ent.label_} for ent in doc.ents]
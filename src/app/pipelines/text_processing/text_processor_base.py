@@ -1,4 +1,8 @@
+import math
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, List, Optional
 
 from dependency_injector.wiring import Provide, inject
 
@@ -19,6 +23,8 @@ class TextProcessorBase(ABC):
     ):
         self.logger = logger
         self.tracker = tracker
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_workers = 0
 
     def validate_text(self, text: str) -> bool:
         """Validate input text_processing."""
@@ -33,3 +39,54 @@ class TextProcessorBase(ABC):
         Abstract method for processing text_processing. Must be implemented by subclasses.
         """
         pass
+
+    def map_in_processes(
+        self,
+        func: Callable,
+        texts: Iterable[str],
+        workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        initializer: Optional[Callable] = None,
+    ) -> List:
+        """
+        Apply the module-level `func` to every valid text on a process pool
+        and return the results in input order. Invalid texts map to [].
+
+        The pool is created on first use and kept for later calls, so each
+        worker runs `initializer` (e.g. loading NLTK models) only once.
+        Call `close()` when finished.
+
+        Without `chunksize`, texts are sent in chunks sized so each worker
+        gets about four: few enough round trips to amortise pickling, yet
+        small enough that a slow chunk does not leave the other workers idle.
+        """
+        texts = list(texts)
+        valid = [i for i, text in enumerate(texts) if self.validate_text(text)]
+        results: List = [[] for _ in texts]
+        workers = workers or os.cpu_count() or 1
+        if workers == 1:
+            outputs = map(func, (texts[i] for i in valid))
+        else:
+            if chunksize is None:
+                chunksize = max(1, math.ceil(len(valid) / (workers * 4)))
+            pool = self._get_pool(workers, initializer)
+            outputs = pool.map(func, [texts[i] for i in valid], chunksize=chunksize)
+        for index, output in zip(valid, outputs, strict=True):
+            results[index] = output
+        return results
+
+    def _get_pool(self, workers: int, initializer: Optional[Callable]):
+        if self._pool is None or self._pool_workers != workers:
+            self.close()
+            self._pool = ProcessPoolExecutor(
+                max_workers=workers, initializer=initializer
+            )
+            self._pool_workers = workers
+        return self._pool
+
+    def close(self):
+        """Shut down the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+            self._pool_workers = 0
@@ -1,8 +1,16 @@
 import json
+import os
 
 import pandas as pd
 
 from src.app.pipelines.text_processing.text_processor_base import TextProcessorBase
+from src.app.utils.columnar_writer import (
+    ENTITY_SCHEMA,
+    SEGMENT_SCHEMA,
+    ColumnarWriter,
+    entity_rows,
+    sentence_rows,
+)
 
 
 class TextSaver(TextProcessorBase):
@@ -25,3 +33,21 @@ class TextSaver(TextProcessorBase):
         except Exception as e:
             self.logger.error(f"Error saving data to JSON: {e}")
             raise
+
+    def save_to_parquet(self, sentences, entities, filepath, source=None):
+        """
+        Save sentences and their entities as two Parquet tables with fixed
+        schemas: `<filepath>` holds the sentences (SEGMENT_SCHEMA) and
+        `<stem>.entities.parquet` the entities (ENTITY_SCHEMA).
+        """
+        source = source or os.path.basename(filepath)
+        entities_path = f"{os.path.splitext(filepath)[0]}.entities.parquet"
+        try:
+            with ColumnarWriter(filepath, SEGMENT_SCHEMA) as writer:
+                writer.write_rows(sentence_rows(source, sentences))
+            with ColumnarWriter(entities_path, ENTITY_SCHEMA) as writer:
+                writer.write_rows(entity_rows(source, entities))
+            self.logger.info(f"Data saved to Parquet at {filepath}.")
+        except Exception as e:
+            self.logger.error(f"Error saving data to Parquet: {e}")
+            raise
@@ -1,8 +1,15 @@
+from typing import Iterable, List, Optional
+
 from nltk.tokenize import sent_tokenize
 
 from src.app.pipelines.text_processing.text_processor_base import TextProcessorBase
 
 
+def _load_sentence_model():
+    """Pool initializer: load and cache the Punkt model once per worker."""
+    sent_tokenize("Warm up.")
+
+
 class TextSegmenter(TextProcessorBase):
     def process(self, text: str) -> list:
         """Segment text_processing into sentences."""
@@ -18,3 +25,26 @@ class TextSegmenter(TextProcessorBase):
         except Exception as e:
             self.logger.error(f"Error during sentence segmentation: {e}")
             raise
+
+    def process_many(
+        self,
+        texts: Iterable[str],
+        workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+    ) -> List[list]:
+        """
+        Segment many texts across a process pool.
+
+        Returns:
+            list[list]: The sentences of each text, in input order.
+        """
+        texts = list(texts)
+        with self.tracker.track_execution(f"Segmenting {len(texts)} texts"):
+            results = self.map_in_processes(
+                sent_tokenize, texts, workers, chunksize, _load_sentence_model
+            )
+        self.logger.info(
+            f"Segmented {len(texts)} texts into "
+            f"{sum(map(len, results))} sentences."
+        )
+        return results
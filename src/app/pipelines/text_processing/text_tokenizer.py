@@ -1,8 +1,15 @@
+from typing import Iterable, List, Optional
+
 from nltk.tokenize import word_tokenize
 
 from src.app.pipelines.text_processing.text_processor_base import TextProcessorBase
 
 
+def _load_word_model():
+    """Pool initializer: load and cache the Punkt model once per worker."""
+    word_tokenize("Warm up.")
+
+
 class TextTokenizer(TextProcessorBase):
     def process(self, text: str) -> list:
         """Tokenize text_processing into words."""
@@ -16,3 +23,25 @@ class TextTokenizer(TextProcessorBase):
         except Exception as e:
             self.logger.error(f"Error during tokenization: {e}")
             raise
+
+    def process_many(
+        self,
+        texts: Iterable[str],
+        workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+    ) -> List[list]:
+        """
+        Tokenize many texts across a process pool.
+
+        Returns:
+            list[list]: The tokens of each text, in input order.
+        """
+        texts = list(texts)
+        with self.tracker.track_execution(f"Tokenizing {len(texts)} texts"):
+            results = self.map_in_processes(
+                word_tokenize, texts, workers, chunksize, _load_word_model
+            )
+        self.logger.info(
+            f"Tokenized {len(texts)} texts into {sum(map(len, results))} tokens."
+        )
+        return results
@@ -1,9 +1,12 @@
-from audio_processing_pipeline import AudioProcessingPipeline
-from audio_to_text_transcriber import AudioTranscriber
-from transcription_pipeline_manager import TranscriptionManager
-from transcription_saver import TranscriptionSaver
-
+from src.app.pipelines.transcription.audio_processing_pipeline import (
+    AudioProcessingPipeline,
+)
+from src.app.pipelines.transcription.audio_to_text_transcriber import AudioTranscriber
 from src.app.pipelines.transcription.basepipeline import BasePipeline
+from src.app.pipelines.transcription.transcription_pipeline_manager import (
+    TranscriptionManager,
+)
+from src.app.pipelines.transcription.transcription_saver import TranscriptionSaver
 
 __all__ = [
     "AudioProcessingPipeline",
@@ -1,6 +1,14 @@
 import os
+from typing import Dict, Optional
 
 from src.app.pipelines.transcription.basepipeline import BasePipeline
+from src.app.pipelines.transcription.staged_execution import (
+    PipelineStage,
+    StagedExecutor,
+)
+
+AUDIO_EXTENSIONS = (".mp3", ".wav", ".m4a", ".flac")
+DEFAULT_STAGE_WORKERS = {"convert": 2, "transcribe": 1, "save": 1}
 
 
 class AudioProcessingPipeline(BasePipeline):
@@ -10,14 +18,38 @@ class AudioProcessingPipeline(BasePipeline):
     """
 
     def __init__(
-        self, input_directory: str, output_directory: str, converter, transcriber, saver
+        self,
+        input_directory: str,
+        output_directory: str,
+        converter,
+        transcriber,
+        saver,
+        in_memory: bool = False,
+        pipelined: bool = False,
+        stage_workers: Optional[Dict[str, int]] = None,
+        queue_size: int = 4,
     ):
+        """
+        Args:
+            in_memory (bool): Hand the converter's float32 16 kHz buffer straight
+                to the transcriber instead of writing and re-reading a WAV file.
+            pipelined (bool): Run conversion, transcription and saving as
+                concurrent stages connected by bounded queues.
+            stage_workers (dict): Worker threads per stage ("convert",
+                "transcribe", "save"); missing stages use the defaults.
+            queue_size (int): Capacity of each inter-stage queue. A full queue
+                blocks the upstream stage, bounding the files held in memory.
+        """
         super().__init__()
         self.input_directory = input_directory
         self.output_directory = output_directory
         self.converter = converter
         self.transcriber = transcriber
         self.saver = saver
+        self.in_memory = in_memory
+        self.pipelined = pipelined
+        self.stage_workers = {**DEFAULT_STAGE_WORKERS, **(stage_workers or {})}
+        self.queue_size = queue_size
 
     def process_files(self):
         """
@@ -25,28 +57,67 @@ class AudioProcessingPipeline(BasePipeline):
         """
         self.ensure_directory_exists(self.output_directory)
         audio_files = self.get_files_with_extensions(
-            self.input_directory, (".mp3", ".wav", ".m4a", ".flac")
+            self.input_directory, AUDIO_EXTENSIONS
         )
+        if self.pipelined:
+            self._process_pipelined(audio_files)
+            return
         for file_name in audio_files:
             self._process_single_file(file_name)
 
-    def _process_single_file(self, file_name: str):
+    def _process_pipelined(self, audio_files):
         """
-        Processes a single audio file.
+        Processes files with conversion, transcription and saving overlapping,
+        so the model is not idle while the next file is being converted.
+        """
+        stages = [
+            PipelineStage("convert", self._convert, self.stage_workers["convert"]),
+            PipelineStage(
+                "transcribe", self._transcribe, self.stage_workers["transcribe"]
+            ),
+            PipelineStage("save", self._save, self.stage_workers["save"]),
+        ]
+        executor = StagedExecutor(
+            stages,
+            self.logger,
+            self.performance_tracker,
+            queue_size=self.queue_size,
+            name="Audio pipeline",
+        )
+        with self.track(f"Pipelined processing of {len(audio_files)} files"):
+            executor.run(audio_files)
+
+    def _convert(self, file_name: str):
+        """
+        Returns (file_name, audio) where audio is a buffer or WAV path, or None
+        if the file could not be converted.
         """
         input_path = os.path.join(self.input_directory, file_name)
+        if self.in_memory:
+            return file_name, self.converter.to_array(input_path)
+        if file_name.endswith(".wav"):
+            return file_name, input_path
+        wav_file = self.converter.convert_to_wav(input_path)
+        if not wav_file:
+            self.logger.warning(f"Skipping '{file_name}' due to conversion error.")
+            return None
+        return file_name, wav_file
+
+    def _transcribe(self, item):
+        file_name, audio = item
+        return file_name, self.transcriber.transcribe(audio)
 
+    def _save(self, item):
+        file_name, segments = item
+        self.saver.save_transcription(segments, file_name)
+        self.logger.info(f"Successfully processed '{file_name}'.")
+
+    def _process_single_file(self, file_name: str):
+        """
+        Processes a single audio file.
+        """
         with self.track(f"Processing {file_name}"):
-            if not file_name.endswith(".wav"):
-                wav_file = self.converter.convert_to_wav(input_path)
-                if not wav_file:
-                    self.logger.warning(
-                        f"Skipping '{file_name}' due to conversion error."
-                    )
-                    return
-            else:
-                wav_file = input_path
-
-            segments = self.transcriber.transcribe(wav_file)
-            self.saver.save_transcription(segments, file_name)
-            self.logger.info(f"Successfully processed '{file_name}'.")
+            converted = self._convert(file_name)
+            if converted is None:
+                return
+            self._save(self._transcribe(converted))
@@ -1,3 +1,7 @@
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+
 from src.app.pipelines.transcription.basepipeline import BasePipeline
 
 
@@ -10,10 +14,47 @@ class AudioTranscriber(BasePipeline):
         super().__init__()
         self.transcription_service = transcription_service
 
-    def transcribe(self, audio_file: str):
+    def transcribe(
+        self, audio_file: Union[str, np.ndarray], model_size: Optional[str] = None
+    ):
         """
         Transcribes an audio file into text segments.
+        Accepts a file path or a mono float32 16 kHz buffer, which is passed
+        to the model as-is without touching disk. `model_size` selects one of
+        the service's preloaded sizes, e.g. as chosen by ModelSizeRouter.
         """
         with self.track("Audio Transcription"):
-            self.logger.info(f"Transcribing file: {audio_file}")
-            return self.transcription_service.transcribe(audio_file)
+            if isinstance(audio_file, np.ndarray):
+                self.logger.info(
+                    f"Transcribing in-memory buffer ({audio_file.size} samples)"
+                )
+            else:
+                self.logger.info(f"Transcribing file: {audio_file}")
+            if model_size is None:
+                return self.transcription_service.transcribe(audio_file)
+            return self.transcription_service.transcribe(
+                audio_file, model_size=model_size
+            )
+
+    def transcribe_batch(
+        self,
+        audio_files: Sequence[Union[str, np.ndarray]],
+        batch_size: int = 16,
+        model_size: Optional[str] = None,
+    ) -> List:
+        """
+        Transcribes several files or buffers in shared model batches.
+        Returns one result per input, in input order. `model_size` selects
+        the preloaded size used for the whole batch.
+        """
+        with self.track(f"Batch Transcription ({len(audio_files)} inputs)"):
+            self.logger.info(
+                f"Transcribing {len(audio_files)} inputs, batch size {batch_size}"
+            )
+            if model_size is None:
+                return self.transcription_service.transcribe_batch(
+                    audio_files, batch_size=batch_size
+                )
+            return self.transcription_service.transcribe_batch(
+                audio_files, batch_size=batch_size, model_size=model_size
+            )
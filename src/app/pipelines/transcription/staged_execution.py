@@ -0,0 +1,159 @@
+import queue
+import threading
+import time
+from typing import Callable, Iterable, List, Optional
+
+# Marks the end of a stage's input.
+_STOP = object()
+
+
+class PipelineStage:
+    """
+    One step of a staged pipeline: `workers` threads take items from the
+    input queue, apply `func` and put the result on the output queue.
+    Returning None from `func` drops the item (e.g. a failed conversion).
+    """
+
+    def __init__(self, name: str, func: Callable, workers: int = 1):
+        if workers < 1:
+            raise ValueError(f"Stage '{name}' needs at least one worker.")
+        self.name = name
+        self.func = func
+        self.workers = workers
+        self.processed = 0
+        self.failed = 0
+        self.busy_seconds = 0.0
+        self.max_queue_depth = 0
+        self._depth_total = 0
+        self._depth_samples = 0
+        self._lock = threading.Lock()
+
+    def record(self, queue_depth: int, elapsed: float, failed: bool):
+        with self._lock:
+            self._depth_total += queue_depth
+            self._depth_samples += 1
+            self.max_queue_depth = max(self.max_queue_depth, queue_depth)
+            self.busy_seconds += elapsed
+            if failed:
+                self.failed += 1
+            else:
+                self.processed += 1
+
+    @property
+    def average_queue_depth(self) -> float:
+        return self._depth_total / self._depth_samples if self._depth_samples else 0.0
+
+
+class StagedExecutor:
+    """
+    Runs items through a chain of stages connected by bounded queues.
+
+    Each stage has its own worker threads, so conversion, inference and
+    saving overlap instead of running back to back. A full queue blocks the
+    upstream stage, which bounds the number of items in memory.
+    Per-stage queue depth and throughput are reported to the tracker.
+    """
+
+    def __init__(
+        self,
+        stages: List[PipelineStage],
+        logger,
+        performance_tracker,
+        queue_size: int = 4,
+        name: str = "Staged pipeline",
+    ):
+        if not stages:
+            raise ValueError("StagedExecutor requires at least one stage.")
+        if queue_size < 1:
+            raise ValueError("Queue size must be at least 1.")
+        self.stages = stages
+        self.logger = logger
+        self.performance_tracker = performance_tracker
+        self.queue_size = queue_size
+        self.name = name
+
+    def run(self, items: Iterable):
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in self.stages]
+        queues.append(None)  # The last stage's results are discarded.
+        threads = []
+        started = time.perf_counter()
+
+        for index, stage in enumerate(self.stages):
+            remaining = [stage.workers]
+            remaining_lock = threading.Lock()
+            for worker in range(stage.workers):
+                thread = threading.Thread(
+                    target=self._worker,
+                    args=(
+                        stage,
+                        queues[index],
+                        queues[index + 1],
+                        remaining,
+                        remaining_lock,
+                    ),
+                    name=f"{stage.name}-{worker}",
+                    daemon=True,
+                )
+                thread.start()
+                threads.append(thread)
+
+        for item in items:
+            queues[0].put(item)
+        queues[0].put(_STOP)
+
+        for thread in threads:
+            thread.join()
+        self._report(time.perf_counter() - started)
+
+    def _worker(
+        self,
+        stage: PipelineStage,
+        input_queue: queue.Queue,
+        output_queue: Optional[queue.Queue],
+        remaining: list,
+        remaining_lock: threading.Lock,
+    ):
+        while True:
+            depth = input_queue.qsize()
+            item = input_queue.get()
+            if item is _STOP:
+                # Let sibling workers see the marker too.
+                input_queue.put(_STOP)
+                break
+
+            started = time.perf_counter()
+            result, failed = None, False
+            try:
+                result = stage.func(item)
+            except Exception as e:
+                failed = True
+                self.logger.error(f"{self.name}: stage '{stage.name}' failed: {e}")
+            stage.record(depth, time.perf_counter() - started, failed)
+
+            if result is not None and output_queue is not None:
+                output_queue.put(result)
+
+        with remaining_lock:
+            remaining[0] -= 1
+            last_worker = remaining[0] == 0
+        if last_worker and output_queue is not None:
+            output_queue.put(_STOP)
+
+    def _report(self, elapsed: float):
+        for stage in self.stages:
+            throughput = stage.processed / elapsed if elapsed else 0.0
+            prefix = f"{self.name} [{stage.name}]"
+            self.performance_tracker.log_metric(
+                f"{prefix} throughput (items/s)", round(throughput, 3)
+            )
+            self.performance_tracker.log_metric(
+                f"{prefix} avg queue depth", round(stage.average_queue_depth, 2)
+            )
+            self.performance_tracker.log_metric(
+                f"{prefix} max queue depth", stage.max_queue_depth
+            )
+            self.performance_tracker.log_metric(
+                f"{prefix} busy seconds", round(stage.busy_seconds, 2)
+            )
+            if stage.failed:
+                self.logger.warning(f"{prefix}: {stage.failed} item(s) failed.")
@@ -1,6 +1,16 @@
 import os
+from typing import Callable, Optional
+
+from pydub.utils import mediainfo
 
 from src.app.pipelines.transcription.basepipeline import BasePipeline
+from src.app.pipelines.transcription.windowed_transcription import (
+    WindowedTranscriber,
+)
+
+# Window length used when resuming is requested without an explicit window:
+# a whole-file model call has no intermediate progress to journal.
+DEFAULT_RESUME_WINDOW_SECONDS = 300.0
 
 
 class TranscriptionManager(BasePipeline):
@@ -8,12 +18,73 @@ class TranscriptionManager(BasePipeline):
     Coordinates the transcription process for a batch of audio files.
     """
 
-    def __init__(self, input_directory: str, output_directory: str, transcriber, saver):
+    def __init__(
+        self,
+        input_directory: str,
+        output_directory: str,
+        transcriber,
+        saver,
+        batch_size: int = 16,
+        short_clip_seconds: float = 60.0,
+        min_batch_files: int = 4,
+        window_seconds: Optional[float] = None,
+        window_overlap_seconds: float = 5.0,
+        window_workers: int = 1,
+        model_router=None,
+        queue_depth: Optional[Callable[[], int]] = None,
+        priority: str = "normal",
+        resume: bool = True,
+    ):
+        """
+        Args:
+            batch_size (int): Model batch size used for short clips.
+            short_clip_seconds (float): Clips up to this duration are
+                transcribed together in batches.
+            min_batch_files (int): Minimum number of short clips before the
+                batched path is used; fewer are transcribed one by one.
+            window_seconds (float): When set, files are transcribed as
+                overlapping windows of this length (see WindowedTranscriber).
+            window_overlap_seconds (float): Overlap between windows.
+            window_workers (int): Windows transcribed concurrently.
+            model_router (ModelSizeRouter): Picks a preloaded model size per
+                file, and per batch of short clips, from the audio duration
+                and the queue depth; the size is saved in the transcription
+                metadata.
+            queue_depth (callable): Returns the number of jobs waiting in the
+                task queue (e.g. `broker_queue_depth`); required with
+                `model_router`.
+            priority (str): Job priority passed to the router.
+            resume (bool): Journal each window through the saver so a retried
+                task resumes from the last committed timestamp. Turns on
+                windowing (DEFAULT_RESUME_WINDOW_SECONDS) if `window_seconds`
+                is not set.
+        """
         super().__init__()
+        if model_router is not None and queue_depth is None:
+            raise ValueError("model_router needs a queue_depth callable.")
         self.input_directory = input_directory
         self.output_directory = output_directory
         self.transcriber = transcriber
         self.saver = saver
+        self.batch_size = batch_size
+        self.short_clip_seconds = short_clip_seconds
+        self.min_batch_files = min_batch_files
+        self.model_router = model_router
+        self.queue_depth = queue_depth
+        self.priority = priority
+        self.resume = resume
+        if resume and not window_seconds:
+            window_seconds = DEFAULT_RESUME_WINDOW_SECONDS
+        self.windowed_transcriber = (
+            WindowedTranscriber(
+                transcriber,
+                window_seconds=window_seconds,
+                overlap_seconds=window_overlap_seconds,
+                max_workers=window_workers,
+            )
+            if window_seconds
+            else None
+        )
 
     def process_files(self):
         """
@@ -23,9 +94,55 @@ class TranscriptionManager(BasePipeline):
         audio_files = self.get_files_with_extensions(
             self.input_directory, (".wav", ".mp3")
         )
+        short_clips = [f for f in audio_files if self._is_short_clip(f)]
+        if len(short_clips) >= self.min_batch_files:
+            self._process_batch(short_clips)
+            batched = set(short_clips)
+            audio_files = [f for f in audio_files if f not in batched]
         for file_name in audio_files:
             self._process_file(file_name)
 
+    def _duration(self, file_name: str) -> Optional[float]:
+        input_path = os.path.join(self.input_directory, file_name)
+        try:
+            return float(mediainfo(input_path)["duration"])
+        except (KeyError, ValueError, OSError) as e:
+            self.logger.warning(f"Could not read duration of '{file_name}': {e}")
+            return None
+
+    def _is_short_clip(self, file_name: str) -> bool:
+        duration = self._duration(file_name)
+        return duration is not None and duration <= self.short_clip_seconds
+
+    def _route_model_size(self, duration: Optional[float]) -> Optional[str]:
+        if self.model_router is None or duration is None:
+            return None
+        return self.model_router.choose(duration, self.queue_depth(), self.priority)
+
+    def _process_batch(self, file_names):
+        """
+        Transcribes short clips in shared model batches, then saves each
+        result under its own file name.
+        """
+        input_paths = [os.path.join(self.input_directory, f) for f in file_names]
+        with self.track(f"Batch transcribing {len(file_names)} short clips"):
+            # The clips share one model, so route on their combined duration.
+            durations = [self._duration(f) for f in file_names]
+            model_size = self._route_model_size(
+                None if None in durations else sum(durations)
+            )
+            results = self.transcriber.transcribe_batch(
+                input_paths, batch_size=self.batch_size, model_size=model_size
+            )
+            metadata = {"model_size": model_size} if model_size else None
+            for file_name, segments in zip(file_names, results, strict=True):
+                self.saver.save_transcription(
+                    segments, file_name, metadata=metadata
+                )
+            self.logger.info(
+                f"Batch transcription completed for {len(file_names)} files."
+            )
+
     def _process_file(self, file_name: str):
         """
         Transcribes and saves a single file.
@@ -33,6 +150,55 @@ class TranscriptionManager(BasePipeline):
         input_path = os.path.join(self.input_directory, file_name)
 
         with self.track(f"Transcribing {file_name}"):
-            segments = self.transcriber.transcribe(input_path)
-            self.saver.save_transcription(segments, file_name)
+            if self.windowed_transcriber:
+                segments, model_size = self._transcribe_windowed(
+                    input_path, file_name
+                )
+            else:
+                model_size = self._route_model_size(self._duration(file_name))
+                segments = self.transcriber.transcribe(input_path, model_size)
+            metadata = {"model_size": model_size} if model_size else None
+            self.saver.save_transcription(segments, file_name, metadata=metadata)
+            if self.resume:
+                self.saver.clear_checkpoint(file_name)
             self.logger.info(f"Transcription completed for '{file_name}'.")
+
+    def _transcribe_windowed(self, input_path: str, file_name: str):
+        """
+        Transcribes window by window. With `resume`, each window is journaled
+        through the saver so a retried task resumes from the last committed
+        timestamp, provided the input and options are unchanged. A resumed
+        file keeps the model size it was started with.
+
+        Returns:
+            tuple: The transcript and the model size used.
+        """
+        if not self.resume:
+            model_size = self._route_model_size(self._duration(file_name))
+            transcript = self.windowed_transcriber.transcribe(
+                input_path, model_size=model_size
+            )
+            return transcript, model_size
+
+        key = self.saver.checkpoint_key(
+            input_path,
+            window_seconds=self.windowed_transcriber.window_seconds,
+            overlap_seconds=self.windowed_transcriber.overlap_seconds,
+        )
+        checkpoint = self.saver.load_checkpoint(file_name, key)
+        if checkpoint is None:
+            model_size = self._route_model_size(self._duration(file_name))
+            self.saver.start_checkpoint(file_name, key, model_size)
+        else:
+            model_size = checkpoint.model_size
+
+        def on_window(committed_until, segments, language):
+            self.saver.append_checkpoint(file_name, committed_until, segments, language)
+
+        transcript = self.windowed_transcriber.transcribe(
+            input_path,
+            checkpoint=checkpoint,
+            on_window=on_window,
+            model_size=model_size,
+        )
+        return transcript, model_size
@@ -1,7 +1,15 @@
+import hashlib
 import json
 import os
+from typing import List, Optional
 
 from src.app.pipelines.transcription.basepipeline import BasePipeline
+from src.app.pipelines.transcription.windowed_transcription import Checkpoint
+from src.app.utils.columnar_writer import SEGMENT_SCHEMA, ColumnarWriter, segment_rows
+
+CHECKPOINT_SUFFIX = ".segments.jsonl"
+# Inputs are hashed in blocks of this size so large files aren't read at once.
+HASH_BLOCK_SIZE = 1024 * 1024
 
 
 class TranscriptionSaver(BasePipeline):
@@ -14,9 +22,17 @@ class TranscriptionSaver(BasePipeline):
         self.output_directory = output_directory
         self.ensure_directory_exists(self.output_directory)
 
-    def save_transcription(self, segments, file_name: str, format="txt"):
+    def save_transcription(
+        self,
+        segments,
+        file_name: str,
+        format="txt",
+        metadata: Optional[dict] = None,
+    ):
         """
-        Saves transcription data to the specified file format.
+        Saves transcription data to the specified file format. `metadata`
+        (e.g. the model size used) is written to a `.meta.json` sidecar so
+        the transcript formats themselves are unchanged.
         """
         output_file = os.path.join(self.output_directory, f"{file_name}.{format}")
 
@@ -25,13 +41,21 @@ class TranscriptionSaver(BasePipeline):
                 self._save_as_txt(segments, output_file)
             elif format == "json":
                 self._save_as_json(segments, output_file)
+            elif format == "parquet":
+                self._save_as_parquet(segments, file_name, output_file)
             else:
                 self.logger.error(f"Unsupported format: {format}")
+                return
+            if metadata is not None:
+                self._save_metadata(metadata, file_name)
 
     def _save_as_txt(self, segments, output_file):
         """
-        Saves transcription as a plain text file.
+        Saves transcription as a plain text file. Accepts a list of segments
+        or a dict with a "segments" key as returned by Whisper.
         """
+        if isinstance(segments, dict):
+            segments = segments.get("segments", [])
         with open(output_file, "w") as f:
             for segment in segments:
                 f.write(f"{segment['text']}\n")
@@ -44,3 +68,135 @@ class TranscriptionSaver(BasePipeline):
         with open(output_file, "w") as f:
             json.dump(segments, f, indent=4)
         self.logger.info(f"Saved transcription to {output_file} (json)")
+
+    def _save_as_parquet(self, segments, file_name, output_file):
+        """
+        Saves transcription segments as a Parquet table (SEGMENT_SCHEMA).
+        """
+        with ColumnarWriter(output_file, SEGMENT_SCHEMA) as writer:
+            writer.write_rows(segment_rows(file_name, segments))
+        self.logger.info(f"Saved transcription to {output_file} (parquet)")
+
+    def open_segment_writer(self, name: str = "segments") -> ColumnarWriter:
+        """
+        Open one Parquet table for many files' segments; each
+        `write_rows(segment_rows(file_name, segments))` call appends a row
+        group, so large batches are written incrementally.
+        """
+        output_file = os.path.join(self.output_directory, f"{name}.parquet")
+        self.logger.info(f"Writing transcription segments to {output_file}")
+        return ColumnarWriter(output_file, SEGMENT_SCHEMA)
+
+    def _save_metadata(self, metadata: dict, file_name: str):
+        metadata_file = os.path.join(self.output_directory, f"{file_name}.meta.json")
+        with open(metadata_file, "w") as f:
+            json.dump(metadata, f, indent=4)
+        self.logger.info(f"Saved transcription metadata to {metadata_file}")
+
+    def checkpoint_path(self, file_name: str) -> str:
+        return os.path.join(self.output_directory, f"{file_name}{CHECKPOINT_SUFFIX}")
+
+    def checkpoint_key(self, input_path: str, **options) -> dict:
+        """
+        Identifies the run a journal belongs to: the SHA-256 of the input's
+        contents plus the options that shape its segments (window, overlap).
+        A journal written under another key is discarded instead of being
+        stitched onto a different transcription.
+        """
+        sha = hashlib.sha256()
+        with open(input_path, "rb") as f:
+            for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+                sha.update(block)
+        return {"input_sha256": sha.hexdigest(), **options}
+
+    def start_checkpoint(
+        self, file_name: str, key: dict, model_size: Optional[str] = None
+    ):
+        """
+        Starts a new journal for `file_name`, replacing any old one, with a
+        header line recording `key` and the model size, which a resumed run
+        reuses so one transcript never mixes sizes.
+        """
+        header = {"key": key, "model_size": model_size}
+        with open(self.checkpoint_path(file_name), "w") as f:
+            f.write(json.dumps(header) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def append_checkpoint(
+        self,
+        file_name: str,
+        committed_until: float,
+        segments: List[dict],
+        language: Optional[str] = None,
+    ):
+        """
+        Appends one window's segments to the file's JSONL journal and syncs
+        it to disk, so the work survives a worker crash.
+        """
+        record = {
+            "committed_until": committed_until,
+            "language": language,
+            "segments": segments,
+        }
+        with open(self.checkpoint_path(file_name), "a") as f:
+            f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def load_checkpoint(self, file_name: str, key: dict) -> Optional[Checkpoint]:
+        """
+        Reads the journal left by an interrupted run, if any. A journal whose
+        header does not match `key` (the input or the options changed since)
+        is deleted and None is returned. A torn last line from a crash
+        mid-write is ignored.
+        """
+        path = self.checkpoint_path(file_name)
+        if not os.path.exists(path):
+            return None
+        header = self._checkpoint_header(path)
+        if header.get("key") != key:
+            self.logger.warning(
+                f"Discarding checkpoint {path}: written for a different input "
+                f"or options"
+            )
+            os.remove(path)
+            return None
+        committed_until, segments, language = 0.0, [], None
+        with open(path, "rb+") as f:
+            valid_bytes = len(f.readline())
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Drop the torn tail so the next append starts a clean line.
+                    self.logger.warning(f"Truncating incomplete checkpoint in {path}")
+                    f.truncate(valid_bytes)
+                    break
+                valid_bytes += len(line)
+                committed_until = record["committed_until"]
+                segments.extend(record["segments"])
+                language = language or record.get("language")
+        self.logger.info(
+            f"Loaded checkpoint for {file_name}: {len(segments)} segments up to "
+            f"{committed_until:.1f}s"
+        )
+        return Checkpoint(
+            committed_until, segments, language, header.get("model_size")
+        )
+
+    @staticmethod
+    def _checkpoint_header(path: str) -> dict:
+        """The journal's header line, or {} if it is missing or torn."""
+        with open(path, "rb") as f:
+            try:
+                header = json.loads(f.readline())
+            except json.JSONDecodeError:
+                return {}
+        return header if isinstance(header, dict) else {}
+
+    def clear_checkpoint(self, file_name: str):
+        """Removes the journal once the final transcription is saved."""
+        path = self.checkpoint_path(file_name)
+        if os.path.exists(path):
+            os.remove(path)
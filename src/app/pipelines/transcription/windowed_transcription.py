@@ -0,0 +1,268 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional
+
+from pydub.utils import mediainfo
+
+from src.app.pipelines.audio_processing.audio_stream import decode_to_array
+from src.app.pipelines.transcription.basepipeline import BasePipeline
+
+# Longest run of words compared when removing text repeated across windows.
+MAX_OVERLAP_WORDS = 20
+
+
+class Window(NamedTuple):
+    """
+    A span of the input. Segments whose midpoint falls in [keep_from,
+    keep_until) belong to this window; the bounds sit halfway through the
+    overlap with each neighbour, so every instant has exactly one owner.
+    """
+
+    index: int
+    start: float
+    end: float
+    keep_from: float
+    keep_until: float
+
+
+class Checkpoint(NamedTuple):
+    """Progress of an interrupted windowed transcription."""
+
+    committed_until: float
+    segments: List[dict]
+    language: Optional[str] = None
+    model_size: Optional[str] = None
+
+
+def window_grid(
+    duration: float, window_seconds: float, overlap_seconds: float
+) -> List[Window]:
+    """Split `duration` seconds into overlapping windows."""
+    if window_seconds <= 0:
+        raise ValueError("Window length must be greater than 0.")
+    if not 0 <= overlap_seconds < window_seconds:
+        raise ValueError("Overlap must be non-negative and shorter than a window.")
+    step = window_seconds - overlap_seconds
+    spans = []
+    start = 0.0
+    while True:
+        end = min(start + window_seconds, duration)
+        spans.append((start, end))
+        if end >= duration:
+            break
+        start += step
+
+    windows = []
+    for index, (start, end) in enumerate(spans):
+        keep_from = 0.0 if index == 0 else (start + spans[index - 1][1]) / 2
+        is_last = index == len(spans) - 1
+        keep_until = float("inf") if is_last else (spans[index + 1][0] + end) / 2
+        windows.append(Window(index, start, end, keep_from, keep_until))
+    return windows
+
+
+def _words(text: str) -> List[str]:
+    return [re.sub(r"[^\w']", "", word).lower() for word in text.split()]
+
+
+def strip_repeated_prefix(previous_text: str, text: str, min_words: int = 2) -> str:
+    """
+    Remove the start of `text` that repeats the end of `previous_text`, as
+    happens when both windows transcribe speech inside their overlap.
+    """
+    previous, current = _words(previous_text), _words(text)
+    longest = min(len(previous), len(current), MAX_OVERLAP_WORDS)
+    for size in range(longest, min_words - 1, -1):
+        if previous[-size:] == current[:size]:
+            return " ".join(text.split()[size:])
+    return text
+
+
+class WindowedTranscriber(BasePipeline):
+    """
+    Transcribes long audio as a series of overlapping windows.
+
+    Only one window per worker is decoded at a time, so memory does not grow
+    with the file's duration, and a failed window is retried on its own
+    instead of restarting the whole file. Segments are shifted to file time
+    and stitched, dropping text duplicated in the overlaps.
+    """
+
+    def __init__(
+        self,
+        transcriber,
+        window_seconds: float = 300.0,
+        overlap_seconds: float = 5.0,
+        max_workers: int = 1,
+        max_retries: int = 2,
+    ):
+        """
+        Args:
+            transcriber: Object with a `transcribe(np.ndarray)` method, such as
+                AudioTranscriber.
+            window_seconds (float): Length of each window.
+            overlap_seconds (float): Audio shared by consecutive windows, so
+                words at a cut are heard whole by at least one window.
+            max_workers (int): Windows transcribed concurrently.
+            max_retries (int): Extra attempts for a window that fails.
+        """
+        super().__init__()
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        self.transcriber = transcriber
+        self.window_seconds = window_seconds
+        self.overlap_seconds = overlap_seconds
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+
+    def transcribe(
+        self,
+        input_file: str,
+        checkpoint: Optional[Checkpoint] = None,
+        on_window: Optional[Callable[[float, list, Optional[str]], None]] = None,
+        model_size: Optional[str] = None,
+    ) -> dict:
+        """
+        Transcribes `input_file` window by window.
+
+        Args:
+            checkpoint (Checkpoint): Progress from an interrupted run. Windows
+                that end before `checkpoint.committed_until` are skipped and
+                its segments are kept as-is.
+            on_window (callable): Called in window order once a window is
+                stitched, with the time transcribed up to, the window's new
+                segments and the language, e.g. to journal progress.
+            model_size (str): Passed to the transcriber for every window.
+
+        Returns:
+            dict: "segments" with file-relative timestamps, the joined "text"
+            and the "language" reported for the first window.
+        """
+        duration = float(mediainfo(input_file)["duration"])
+        windows = window_grid(duration, self.window_seconds, self.overlap_seconds)
+        committed_until = 0.0
+        segments: List[dict] = []
+        language: Optional[str] = None
+        if checkpoint is not None:
+            committed_until = checkpoint.committed_until
+            segments = list(checkpoint.segments)
+            language = checkpoint.language
+            windows = [w for w in windows if w.keep_until > committed_until]
+            self.logger.info(
+                f"Resuming {input_file} from {committed_until:.1f}s "
+                f"({len(segments)} segments already transcribed)"
+            )
+        self.logger.info(
+            f"Transcribing {input_file} ({duration:.1f}s) in {len(windows)} windows"
+        )
+        with self.track(f"Windowed transcription of {input_file}"):
+            results = self._transcribe_windows(input_file, windows, model_size)
+            for window, result in zip(windows, results):
+                language = language or result.get("language")
+                added = self._stitch_window(segments, window, result, committed_until)
+                if on_window is not None:
+                    on_window(min(window.keep_until, duration), added, language)
+        return self._as_transcript(segments, language)
+
+    def _transcribe_windows(
+        self, input_file: str, windows: List[Window], model_size: Optional[str]
+    ) -> Iterator[dict]:
+        """Yields window results in order as they complete."""
+        if self.max_workers == 1:
+            for window in windows:
+                yield self._transcribe_window(input_file, window, model_size)
+            return
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            yield from executor.map(
+                lambda w: self._transcribe_window(input_file, w, model_size), windows
+            )
+
+    def _transcribe_window(
+        self, input_file: str, window: Window, model_size: Optional[str]
+    ) -> dict:
+        for attempt in range(self.max_retries + 1):
+            try:
+                audio = decode_to_array(
+                    input_file,
+                    start_s=window.start,
+                    duration_s=window.end - window.start,
+                )
+                result = self.transcriber.transcribe(audio, model_size)
+                return self._as_result(result)
+            except Exception as e:
+                if attempt == self.max_retries:
+                    self.logger.error(
+                        f"Window {window.index} of {input_file} failed after "
+                        f"{attempt + 1} attempts: {e}"
+                    )
+                    raise
+                self.logger.warning(
+                    f"Window {window.index} of {input_file} failed "
+                    f"(attempt {attempt + 1}), retrying: {e}"
+                )
+
+    @staticmethod
+    def _as_result(result) -> dict:
+        if isinstance(result, dict):
+            return result
+        return {"segments": list(result)}
+
+    @staticmethod
+    def _as_transcript(segments: List[dict], language: Optional[str]) -> dict:
+        return {
+            "segments": segments,
+            "text": " ".join(segment["text"].strip() for segment in segments),
+            "language": language,
+        }
+
+    @classmethod
+    def stitch(cls, windows: Iterable[Window], results: Iterable[dict]) -> dict:
+        """
+        Merge per-window results: shift timestamps by the window start, keep
+        the segments each window owns, and trim text repeated at the seams.
+        """
+        segments: List[dict] = []
+        language: Optional[str] = None
+        for window, result in zip(windows, results):
+            language = language or result.get("language")
+            cls._stitch_window(segments, window, result)
+        return cls._as_transcript(segments, language)
+
+    @staticmethod
+    def _stitch_window(
+        segments: List[dict], window: Window, result: dict, keep_after: float = 0.0
+    ) -> List[dict]:
+        """
+        Append the segments `window` owns to `segments`, ignoring anything
+        before `keep_after`. Returns the appended segments.
+        """
+        keep_from = max(window.keep_from, keep_after)
+        added = []
+        for segment in result.get("segments", []):
+            start = segment["start"] + window.start
+            end = segment["end"] + window.start
+            if not keep_from <= (start + end) / 2 < window.keep_until:
+                continue
+            shifted = {**segment, "start": start, "end": end}
+            if "words" in segment:
+                # Words the aligner could not place have no timestamps.
+                shifted["words"] = [
+                    {
+                        **word,
+                        **{
+                            key: word[key] + window.start
+                            for key in ("start", "end")
+                            if key in word
+                        },
+                    }
+                    for word in segment["words"]
+                ]
+            if segments and start < segments[-1]["end"]:
+                shifted["text"] = strip_repeated_prefix(
+                    segments[-1]["text"], shifted["text"]
+                )
+                if not shifted["text"].strip():
+                    continue
+            segments.append(shifted)
+            added.append(shifted)
+        return added
@@ -0,0 +1,98 @@
+from typing import Iterable, List, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Transcript segments and sentences. Untimed text (e.g. segmented documents)
+# leaves start/end null; speaker is null unless diarization ran.
+SEGMENT_SCHEMA = pa.schema(
+    [
+        pa.field("file", pa.string(), nullable=False),
+        pa.field("start", pa.float64()),
+        pa.field("end", pa.float64()),
+        pa.field("speaker", pa.string()),
+        pa.field("text", pa.string(), nullable=False),
+    ]
+)
+
+# Named entities; segment_index points at the row's position among the
+# file's segments so entities can be joined back to their sentence.
+ENTITY_SCHEMA = pa.schema(
+    [
+        pa.field("file", pa.string(), nullable=False),
+        pa.field("segment_index", pa.int32(), nullable=False),
+        pa.field("text", pa.string(), nullable=False),
+        pa.field("label", pa.string(), nullable=False),
+    ]
+)
+
+
+def segment_rows(file_name: str, segments) -> List[dict]:
+    """
+    Flatten a transcription result (a list of segments, or a dict with a
+    "segments" key as returned by Whisper) into SEGMENT_SCHEMA rows.
+    """
+    if isinstance(segments, dict):
+        segments = segments.get("segments", [])
+    return [
+        {
+            "file": file_name,
+            "start": segment.get("start"),
+            "end": segment.get("end"),
+            "speaker": segment.get("speaker"),
+            "text": segment["text"],
+        }
+        for segment in segments
+    ]
+
+
+def sentence_rows(file_name: str, sentences: Iterable[str]) -> List[dict]:
+    return [
+        {"file": file_name, "start": None, "end": None, "speaker": None, "text": s}
+        for s in sentences
+    ]
+
+
+def entity_rows(file_name: str, entities_per_segment: Iterable[list]) -> List[dict]:
+    """Flatten per-segment entity lists from NERProcessor into ENTITY_SCHEMA rows."""
+    return [
+        {
+            "file": file_name,
+            "segment_index": index,
+            "text": entity["text_processing"],
+            "label": entity["label"],
+        }
+        for index, entities in enumerate(entities_per_segment)
+        for entity in entities
+    ]
+
+
+class ColumnarWriter:
+    """
+    Writes rows to a Parquet file with a fixed schema, one row group per
+    `write_rows` call, so large outputs are produced incrementally without
+    holding them in memory. Use as a context manager to close the file.
+    """
+
+    def __init__(
+        self, file_path: str, schema: pa.Schema, compression: Optional[str] = "zstd"
+    ):
+        self.file_path = file_path
+        self.schema = schema
+        self.rows_written = 0
+        self._writer = pq.ParquetWriter(file_path, schema, compression=compression)
+
+    def write_rows(self, rows: List[dict]):
+        if not rows:
+            return
+        self._writer.write_table(pa.Table.from_pylist(rows, schema=self.schema))
+        self.rows_written += len(rows)
+
+    def close(self):
+        self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
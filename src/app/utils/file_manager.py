@@ -6,8 +6,6 @@ from typing import Optional
 import yaml
 from dependency_injector.wiring import Provide, inject
 
-from src.infrastructure.app.app_container import AppContainer
-
 
 class FileUtilityFacade:
     """
@@ -18,8 +16,8 @@ class FileUtilityFacade:
     @inject
     def __init__(
         self,
-        logger=Provide[AppContainer.logger],
-        tracker=Provide[AppContainer.performance_tracker],
+        logger=Provide["logger"],
+        tracker=Provide["performance_tracker"],
     ):
         self.logger = logger
         self.tracker = tracker
@@ -9,8 +9,6 @@ from typing import Optional
 from dependency_injector.wiring import Provide, inject
 from tqdm import tqdm
 
-from src.infrastructure.app.app_container import AppContainer
-
 
 class TrackerStrategy(ABC):
     """
@@ -28,7 +26,7 @@ class PerformanceTracker(TrackerStrategy):
     """
 
     @inject
-    def __init__(self, logger=Provide[AppContainer.logger]):
+    def __init__(self, logger=Provide["logger"]):
         self.logger = logger
         self.metrics = {}
 
@@ -78,8 +76,8 @@ class ProgressBarTracker(TrackerStrategy):
     @inject
     def __init__(
         self,
-        logger=Provide[AppContainer.logger],
-        performance_tracker=Provide[AppContainer.performance_tracker],
+        logger=Provide["logger"],
+        performance_tracker=Provide["performance_tracker"],
     ):
         self.logger = logger
         self.performance_tracker = performance_tracker
@@ -30,6 +30,10 @@ DATABASES = {
 # Whisper Configuration
 WHISPER_MODEL_SIZE = env("WHISPER_MODEL_SIZE", default="base")
 DEVICE = env("DEVICE", default="cpu")
+# One of "int8", "int8_float32" or "float32"; int8 modes are faster on CPU.
+WHISPER_COMPUTE_TYPE = env("WHISPER_COMPUTE_TYPE", default="float32")
+# Extra sizes preloaded next to WHISPER_MODEL_SIZE for ModelSizeRouter.
+WHISPER_ROUTED_MODEL_SIZES = env.list("WHISPER_ROUTED_MODEL_SIZES", default=[])
 
 # WhisperX Configuration
 WHISPERX_ALIGNMENT_ENABLED = env.bool("ALIGNMENT_ENABLED", default=True)
@@ -17,6 +17,8 @@ from src.app.cli import (
     SplitAudioCommand,
     TrimAudioCommand,
 )
+from src.app.core import FunctionBatchProcessor, MemoryMonitor
+from src.app.modules.text_handler import TextHandler
 from src.app.pipelines.audio_processing import (
     AudioConverter,
     AudioNormalizer,
@@ -25,13 +27,14 @@ from src.app.pipelines.audio_processing import (
     AudioTrimmer,
 )
 from src.app.pipelines.text_processing import (
+    NERProcessor,
     TextLoader,
     TextSaver,
     TextSegmenter,
     TextTokenizer,
 )
 from src.app.pipelines.transcription import AudioTranscriber, TranscriptionPipeline
-from src.app.utils import ApplicationLogger, PerformanceTracker
+from src.app.utils import ApplicationLogger, FileUtilityFacade, PerformanceTracker
 from src.infrastructure.registries import ConfigurationRegistry
 
 
@@ -46,6 +49,12 @@ class AppContainer(containers.DeclarativeContainer):
     # Shared Utilities
     logger = providers.Singleton(ApplicationLogger.get_logger)
     performance_tracker = providers.Singleton(PerformanceTracker)
+    file_utility = providers.Singleton(FileUtilityFacade)
+
+    # Resource Management
+    memory_monitor = providers.Singleton(MemoryMonitor)
+    # A factory: PipelineManager builds one processor per function it runs.
+    batch_processor = providers.Factory(FunctionBatchProcessor)
 
     # Observers
     logger_observer = providers.Factory(LoggerObserver, logger=logger)
@@ -75,6 +84,9 @@ class AppContainer(containers.DeclarativeContainer):
     text_segmenter = providers.Singleton(TextSegmenter)
     text_tokenizer = providers.Singleton(TextTokenizer)
     text_saver = providers.Singleton(TextSaver)
+    ner_processor = providers.Singleton(NERProcessor)
+    # One handler per process, so chained CLI commands share its state.
+    text_handler = providers.Singleton(TextHandler)
 
     # Tasks
     audio_processing_task = providers.Factory(
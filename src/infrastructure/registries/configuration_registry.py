@@ -53,7 +53,11 @@ class ConfigurationRegistry:
         """
         with self.concurrency.get_lock(), self.tracker.track_execution("Register Configuration Item"):
             if lazy_load:
-                self._lazy_loaded_configs[name] = config
+                # Copy-on-write so get can check for pending lazy items unlocked.
+                self._lazy_loaded_configs = {
+                    **self._lazy_loaded_configs,
+                    name: config,
+                }
                 self.logger.info(f"Lazy configuration '{name}' registered.")
             else:
                 self.base_registry.register(name, config)
@@ -64,23 +68,31 @@ class ConfigurationRegistry:
         Retrieve a configuration value by name. If the configuration is lazy-loaded,
         it will be initialized.
 
+        Already-loaded values are read without locking, logging or tracking;
+        only the first read of a lazy configuration takes the lock.
+
         Args:
             name (str): The name of the configuration.
 
         Returns:
             Any: The configuration value.
         """
+        if name not in self._lazy_loaded_configs:
+            return self.base_registry.get(name)
+
         with self.concurrency.get_lock(), self.tracker.track_execution("Get Configuration Item"):
+            # Another thread may have loaded it while we waited for the lock.
             if name in self._lazy_loaded_configs:
-                # Double-check to avoid race conditions
-                config = self._lazy_loaded_configs.pop(name)
+                pending = dict(self._lazy_loaded_configs)
+                config = pending.pop(name)
                 if callable(config):
                     config = config()  # Call the lazy-loaded function
                 self.base_registry.register(name, config)
+                self._lazy_loaded_configs = pending
                 self.logger.info(f"Lazy configuration '{name}' loaded and registered.")
                 return config
 
-            return self.base_registry.get(name)
+        return self.base_registry.get(name)
 
 
 # Example Usage
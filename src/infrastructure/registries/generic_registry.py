@@ -34,6 +34,9 @@ class GenericRegistry(ABC, Generic[T]):
         """
         Register an item with a unique name.
 
+        Writes copy the registry and swap in the new dict, so readers always
+        see a complete snapshot without taking the lock.
+
         Args:
             name (str): Unique name for the item.
             item (T or Callable[..., T]): The item or a callable to produce the item.
@@ -42,41 +45,42 @@ class GenericRegistry(ABC, Generic[T]):
             if name in self._registry:
                 self.logger.error(f"Item with name '{name}' is already registered.")
                 raise ValueError(f"Item with name '{name}' is already registered.")
-            self._registry[name] = item
+            self._registry = {**self._registry, name: item}
             self.logger.info(f"Registered item with name: '{name}'.")
 
     def get(self, name: str) -> Union[T, Callable[..., T]]:
         """
         Retrieve an item by name.
 
+        This is the hot path: it reads the current snapshot without locking,
+        logging or tracking. Only a missing name is logged.
+
         Args:
             name (str): The name of the registered item.
 
         Returns:
             T or Callable[..., T]: The requested item or callable.
         """
-        with self._lock, self.tracker.track_execution("Get Item"):
-            if name not in self._registry:
-                available = ", ".join(self._registry.keys())
-                self.logger.error(
-                    f"Item '{name}' is not registered. Available: {available}"
-                )
-                raise ValueError(
-                    f"Item '{name}' is not registered. Available: {available}"
-                )
-            self.logger.info(f"Retrieved item with name: '{name}'.")
-            return self._registry[name]
+        registry = self._registry
+        try:
+            return registry[name]
+        except KeyError:
+            available = ", ".join(registry.keys())
+            self.logger.error(
+                f"Item '{name}' is not registered. Available: {available}"
+            )
+            raise ValueError(
+                f"Item '{name}' is not registered. Available: {available}"
+            ) from None
 
     def list_items(self) -> dict[str, Union[T, Callable[..., T]]]:
         """
         List all registered items.
 
         Returns:
-            dict[str, T or Callable[..., T]]: A dictionary of all registered items.
+            dict[str, T or Callable[..., T]]: A copy of all registered items.
         """
-        with self._lock, self.tracker.track_execution("List Items"):
-            self.logger.info("Listing all registered items.")
-            return self._registry
+        return dict(self._registry)
 
     @abstractmethod
     def validate_item(self, item: T) -> bool:
@@ -93,24 +97,25 @@ class GenericRegistry(ABC, Generic[T]):
 
 
 # Example usage of the refactored GenericRegistry.
-class RefactoredProcessorRegistry(GenericRegistry[Callable[[int], int]]):
-    def validate_item(self, item: Callable[[int], int]) -> bool:
-        # Example validation logic: check if item is callable
-        if callable(item):
-            self.logger.info("Validated processor item.")
-            return True
-        self.logger.error("Invalid processor item. It must be callable.")
-        return False
+if __name__ == "__main__":
 
+    class RefactoredProcessorRegistry(GenericRegistry[Callable[[int], int]]):
+        def validate_item(self, item: Callable[[int], int]) -> bool:
+            # Example validation logic: check if item is callable
+            if callable(item):
+                self.logger.info("Validated processor item.")
+                return True
+            self.logger.error("Invalid processor item. It must be callable.")
+            return False
 
-# Reinitialize the processor registry.
-processor_registry = RefactoredProcessorRegistry()
+    # Reinitialize the processor registry.
+    processor_registry = RefactoredProcessorRegistry()
 
-# Register a processor that takes one argument.
-processor_registry.register("example_processor", lambda x: x * 2)
+    # Register a processor that takes one argument.
+    processor_registry.register("example_processor", lambda x: x * 2)
 
-# Retrieve the registered processor without automatic invocation.
-retrieved_processor = processor_registry.get("example_processor")
-result = retrieved_processor(5)  # Invoke callable manually with correct argument.
+    # Retrieve the registered processor without automatic invocation.
+    retrieved_processor = processor_registry.get("example_processor")
+    result = retrieved_processor(5)  # Invoke callable manually with correct argument.
 
-print(result)  # Expected output: 10
+    print(result)  # Expected output: 10
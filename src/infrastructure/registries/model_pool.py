@@ -0,0 +1,282 @@
+import re
+import time
+from contextlib import contextmanager
+from threading import Condition
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+import psutil
+
+
+class ModelKey(NamedTuple):
+    """Identifies interchangeable model instances."""
+
+    name: str
+    size: str
+    device: str = "cpu"
+    compute_type: Optional[str] = None
+
+
+# Approximate parameter counts of Whisper checkpoints, by size family.
+WHISPER_PARAMETERS = {
+    "tiny": 39_000_000,
+    "base": 74_000_000,
+    "small": 244_000_000,
+    "medium": 769_000_000,
+    "large": 1_550_000_000,
+    "turbo": 809_000_000,
+}
+# Bytes per weight for each compute type; float32 when none is set.
+BYTES_PER_PARAMETER = {
+    "int8": 1,
+    "int8_float16": 1,
+    "int8_float32": 1,
+    "float16": 2,
+    "bfloat16": 2,
+    "float32": 4,
+}
+
+
+def estimate_model_memory(key: ModelKey) -> Optional[int]:
+    """
+    Rough resident size of a Whisper checkpoint: its parameter count times
+    the width of `key.compute_type`. "large-v3" and "tiny.en" count as their
+    family; unknown sizes return None.
+    """
+    parameters = WHISPER_PARAMETERS.get(re.split(r"[.-]", key.size)[0])
+    if parameters is None:
+        return None
+    return parameters * BYTES_PER_PARAMETER.get(key.compute_type or "float32", 4)
+
+
+class _PooledModel:
+    __slots__ = ("model", "memory_bytes", "last_used", "pinned")
+
+    def __init__(self, model: Any, memory_bytes: int, pinned: bool = False):
+        self.model = model
+        self.memory_bytes = memory_bytes
+        self.last_used = time.monotonic()
+        self.pinned = pinned
+
+
+class ModelPool:
+    """
+    Keeps loaded model instances warm within a process and leases them out.
+
+    Up to `max_instances_per_key` instances exist per ModelKey; a lease takes
+    an idle instance if there is one, loads a new one if the key is below its
+    limit, and otherwise waits for a release. Instances idle for longer than
+    `idle_timeout` are dropped, and when `max_memory_bytes` is set the least
+    recently used idle instances are dropped to make room for a new load.
+    Instances loaded by `preload` are pinned: neither rule evicts them, so a
+    model warmed at start-up is never reloaded inside a task.
+
+    Memory per instance comes from `memory_estimator` (declared sizes, or
+    `estimate_model_memory` by default), so room for the incoming model is
+    made, and reserved, before it loads. A key without an estimate is
+    measured as the process RSS growth while it loads alone, with no other
+    load running, and that measurement is used for its later loads.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[ModelKey], Any],
+        logger,
+        tracker,
+        max_instances_per_key: int = 1,
+        idle_timeout: Optional[float] = 900.0,
+        max_memory_bytes: Optional[int] = None,
+        memory_estimator: Callable[[ModelKey], Optional[int]] = estimate_model_memory,
+    ):
+        if max_instances_per_key < 1:
+            raise ValueError("max_instances_per_key must be at least 1.")
+        self.loader = loader
+        self.logger = logger
+        self.tracker = tracker
+        self.max_instances_per_key = max_instances_per_key
+        self.idle_timeout = idle_timeout
+        self.max_memory_bytes = max_memory_bytes
+        self.memory_estimator = memory_estimator
+        self._condition = Condition()
+        self._idle: Dict[ModelKey, List[_PooledModel]] = {}
+        self._instances: Dict[ModelKey, int] = {}
+        self._memory_bytes = 0
+        self._measured_bytes: Dict[ModelKey, int] = {}
+        self._loading = 0
+        self._measuring = False
+        self.hits = 0
+        self.misses = 0
+        self.load_seconds = 0.0
+
+    @contextmanager
+    def lease(self, key: ModelKey):
+        """
+        Borrow a model instance for `key` for the duration of the block.
+        """
+        pooled = self._acquire(key)
+        try:
+            yield pooled.model
+        finally:
+            self._release(key, pooled)
+
+    def preload(self, key: ModelKey, count: int = 1):
+        """
+        Load instances for `key` ahead of the first lease and pin them, so
+        they stay loaded for the life of the pool.
+        """
+        with self._condition:
+            current = self._instances.get(key, 0)
+            missing = max(min(count, self.max_instances_per_key) - current, 0)
+            self._instances[key] = current + missing
+        for _ in range(missing):
+            pooled = self._load_reserved(key)
+            pooled.pinned = True
+            with self._condition:
+                self._idle.setdefault(key, []).append(pooled)
+                self._condition.notify_all()
+
+    def _acquire(self, key: ModelKey) -> _PooledModel:
+        with self._condition:
+            self._evict_expired()
+            while True:
+                idle = self._idle.get(key)
+                if idle:
+                    self.hits += 1
+                    self._report_hit_rate()
+                    return idle.pop()
+                if self._instances.get(key, 0) < self.max_instances_per_key:
+                    # Reserve the slot, then load outside the lock.
+                    self._instances[key] = self._instances.get(key, 0) + 1
+                    self.misses += 1
+                    self._report_hit_rate()
+                    break
+                self._condition.wait()
+        return self._load_reserved(key)
+
+    def _load_reserved(self, key: ModelKey) -> _PooledModel:
+        """Load into a slot already counted in `_instances`."""
+        try:
+            return self._load(key)
+        except Exception:
+            with self._condition:
+                self._instances[key] -= 1
+                self._condition.notify_all()
+            raise
+
+    def _release(self, key: ModelKey, pooled: _PooledModel):
+        with self._condition:
+            pooled.last_used = time.monotonic()
+            self._idle.setdefault(key, []).append(pooled)
+            self._evict_expired()
+            self._condition.notify_all()
+
+    def _expected_bytes(self, key: ModelKey) -> Optional[int]:
+        if key in self._measured_bytes:
+            return self._measured_bytes[key]
+        return self.memory_estimator(key)
+
+    def _load(self, key: ModelKey) -> _PooledModel:
+        with self._condition:
+            expected = self._expected_bytes(key)
+            measure = expected is None
+            # RSS growth is only this model's if no other load is running.
+            self._condition.wait_for(
+                lambda: not self._measuring and not (measure and self._loading)
+            )
+            self._loading += 1
+            self._measuring = measure
+            reserved = expected or 0
+            self._make_room(max(reserved, 1))
+            self._memory_bytes += reserved
+        process = psutil.Process()
+        try:
+            rss_before = process.memory_info().rss
+            started = time.perf_counter()
+            model = self.loader(key)
+            elapsed = time.perf_counter() - started
+            if measure:
+                memory_bytes = max(process.memory_info().rss - rss_before, 0)
+            else:
+                memory_bytes = reserved
+        except Exception:
+            with self._condition:
+                self._memory_bytes -= reserved
+            raise
+        finally:
+            with self._condition:
+                self._loading -= 1
+                if measure:
+                    self._measuring = False
+                self._condition.notify_all()
+        with self._condition:
+            self._memory_bytes += memory_bytes - reserved
+            if measure:
+                self._measured_bytes[key] = memory_bytes
+            self.load_seconds += elapsed
+        self.tracker.log_metric(f"Model load time {key.name}/{key.size}", elapsed)
+        self.logger.info(
+            f"Loaded model {key} in {elapsed:.2f}s "
+            f"({'measured' if measure else 'estimated'} "
+            f"~{memory_bytes // (1024 ** 2)}MB)"
+        )
+        return _PooledModel(model, memory_bytes)
+
+    def _drop(self, key: ModelKey, pooled: _PooledModel, reason: str):
+        self._instances[key] -= 1
+        self._memory_bytes -= pooled.memory_bytes
+        self._condition.notify_all()
+        self.logger.info(f"Evicted model {key} from pool ({reason}).")
+
+    def _evict_expired(self):
+        """Drop idle instances unused for longer than `idle_timeout`."""
+        if self.idle_timeout is None:
+            return
+        cutoff = time.monotonic() - self.idle_timeout
+        for key, idle in self._idle.items():
+            for pooled in [p for p in idle if not p.pinned and p.last_used < cutoff]:
+                idle.remove(pooled)
+                self._drop(key, pooled, "idle timeout")
+
+    def _make_room(self, incoming_bytes: int):
+        """
+        Drop least recently used idle instances until `incoming_bytes` more
+        fit under the memory cap.
+        """
+        if self.max_memory_bytes is None:
+            return
+        while self._memory_bytes + incoming_bytes > self.max_memory_bytes:
+            candidates = [
+                (pooled.last_used, key, pooled)
+                for key, idle in self._idle.items()
+                for pooled in idle
+                if not pooled.pinned
+            ]
+            if not candidates:
+                self.logger.warning(
+                    "Model pool cannot fit the next model under its memory cap: "
+                    "every instance is leased or preloaded; loading anyway."
+                )
+                return
+            _, key, pooled = min(candidates, key=lambda c: c[0])
+            self._idle[key].remove(pooled)
+            self._drop(key, pooled, "memory cap")
+
+    def _report_hit_rate(self):
+        self.tracker.log_metric("Model pool hit rate", round(self.hit_rate, 3))
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        """Snapshot of pool usage for monitoring."""
+        with self._condition:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hit_rate,
+                "load_seconds": round(self.load_seconds, 3),
+                "memory_bytes": self._memory_bytes,
+                "instances": {str(k): n for k, n in self._instances.items() if n},
+                "idle": {str(k): len(v) for k, v in self._idle.items() if v},
+            }
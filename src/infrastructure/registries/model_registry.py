@@ -1,8 +1,15 @@
-from typing import Any, Callable, dict, type
+from contextlib import contextmanager
+from typing import Any, Callable, Optional
 
 from dependency_injector.wiring import Provide, inject
 
-from src.infrastructure.app.app_container import AppContainer, GenericRegistry
+from src.infrastructure.app.app_container import AppContainer
+from src.infrastructure.registries.generic_registry import GenericRegistry
+from src.infrastructure.registries.model_pool import ModelKey, ModelPool
+
+# CPU precision modes accepted by create_model: int8 weights and compute,
+# int8 weights with float32 compute, and full float32.
+COMPUTE_TYPES = ("int8", "int8_float32", "float32")
 
 
 class ModelRegistry(GenericRegistry[Any]):
@@ -42,6 +49,7 @@ class ModelRegistry(GenericRegistry[Any]):
         self.concurrency = concurrency
         self._registered_models: dict[str, Any] = {}
         self._model_factories: dict[str, Callable] = {}
+        self.model_pool = ModelPool(self._load_pooled_model, self.logger, tracker)
         self.logger.info("Initialized ModelRegistry singleton.")
 
     def validate_item(self, item: Any) -> bool:
@@ -72,7 +80,8 @@ class ModelRegistry(GenericRegistry[Any]):
             "Register Model"
         ):
             if self.validate_item(model):
-                self._registered_models[name] = model
+                # Copy-on-write so get_model can read without the lock.
+                self._registered_models = {**self._registered_models, name: model}
                 self.logger.info(f"Model '{name}' registered successfully.")
             else:
                 raise ValueError(
@@ -83,19 +92,20 @@ class ModelRegistry(GenericRegistry[Any]):
         """
         Retrieve a registered model instance by name.
 
+        Reads the current snapshot without locking, logging or tracking, as
+        this runs on every transcription call.
+
         Args:
             name (str): The name of the model to retrieve.
 
         Returns:
             Any: The registered model instance.
         """
-        with self.concurrency.get_lock(), self.tracker.track_execution("Get Model"):
-            if name not in self._registered_models:
-                self.logger.error(f"Model '{name}' not found in registry.")
-                raise ValueError(f"Model '{name}' not found in registry.")
-
-            self.logger.info(f"Model '{name}' retrieved from registry.")
+        try:
             return self._registered_models[name]
+        except KeyError:
+            self.logger.error(f"Model '{name}' not found in registry.")
+            raise ValueError(f"Model '{name}' not found in registry.") from None
 
     def register_model_factory(self, name: str, model_class: type, *args, **kwargs):
         """
@@ -117,24 +127,41 @@ class ModelRegistry(GenericRegistry[Any]):
             self._model_factories[name] = (model_class, args, kwargs)
             self.logger.info(f"Model factory for '{name}' registered successfully.")
 
-    def create_model(self, name: str, *args, **kwargs) -> Any:
+    def has_model_factory(self, name: str) -> bool:
+        return name in self._model_factories
+
+    def create_model(
+        self, name: str, *args, compute_type: Optional[str] = None, **kwargs
+    ) -> Any:
         """
         Create a new instance of a model using the registered factory.
 
         Args:
             name (str): The name of the model factory to use.
             *args: Additional positional arguments for the model class.
+            compute_type (str): Precision mode, one of COMPUTE_TYPES. Passed
+                to the factory only when set, so factories without the option
+                keep working.
             **kwargs: Additional keyword arguments for the model class.
 
         Returns:
             Any: A new instance of the model.
         """
-        with self.concurrency.get_lock(), self.tracker.track_execution("Create Model"):
+        if compute_type is not None:
+            if compute_type not in COMPUTE_TYPES:
+                raise ValueError(
+                    f"Unsupported compute type '{compute_type}'. "
+                    f"Expected one of {COMPUTE_TYPES}."
+                )
+            kwargs["compute_type"] = compute_type
+        with self.concurrency.get_lock():
             if name not in self._model_factories:
                 self.logger.error(f"Model factory for '{name}' not found in registry.")
                 raise ValueError(f"Model factory for '{name}' not found in registry.")
-
             model_class, default_args, default_kwargs = self._model_factories[name]
+
+        # Construct outside the lock so different models can load in parallel.
+        with self.tracker.track_execution("Create Model"):
             combined_args = default_args + args
             combined_kwargs = {**default_kwargs, **kwargs}
             model_instance = model_class(*combined_args, **combined_kwargs)
@@ -142,6 +169,68 @@ class ModelRegistry(GenericRegistry[Any]):
             self.logger.info(f"Model '{name}' instance created successfully.")
             return model_instance
 
+    def configure_pool(
+        self,
+        max_instances_per_key: int = 1,
+        idle_timeout: Optional[float] = 900.0,
+        max_memory_bytes: Optional[int] = None,
+        memory_estimator: Optional[Callable[[ModelKey], Optional[int]]] = None,
+    ):
+        """
+        Set the limits of the warm model pool. Instances already in the pool
+        are kept and count toward the new limits. `memory_estimator` returns
+        the declared size of a model key, or None to measure it on load;
+        defaults to `estimate_model_memory`.
+        """
+        if max_instances_per_key < 1:
+            raise ValueError("max_instances_per_key must be at least 1.")
+        with self.concurrency.get_lock():
+            pool = self.model_pool
+            pool.max_instances_per_key = max_instances_per_key
+            pool.idle_timeout = idle_timeout
+            pool.max_memory_bytes = max_memory_bytes
+            if memory_estimator is not None:
+                pool.memory_estimator = memory_estimator
+            self.logger.info(
+                f"Model pool configured: {max_instances_per_key} per key, "
+                f"idle timeout {idle_timeout}s, memory cap {max_memory_bytes}"
+            )
+
+    @contextmanager
+    def lease_model(
+        self,
+        name: str,
+        size: str,
+        device: str = "cpu",
+        compute_type: Optional[str] = None,
+    ):
+        """
+        Borrow a warm model instance from the pool, loading it through the
+        factory registered under `name` on first use.
+
+        Usage:
+            with model_registry.lease_model("whisperx", "base") as model:
+                model.transcribe(audio)
+        """
+        with self.model_pool.lease(ModelKey(name, size, device, compute_type)) as m:
+            yield m
+
+    def preload_model(
+        self,
+        name: str,
+        size: str,
+        device: str = "cpu",
+        compute_type: Optional[str] = None,
+        count: int = 1,
+    ):
+        """Load `count` pooled instances now so the first lease is warm."""
+        self.model_pool.preload(ModelKey(name, size, device, compute_type), count)
+
+    def _load_pooled_model(self, key: ModelKey) -> Any:
+        return self.create_model(
+            key.name, key.size, device=key.device, compute_type=key.compute_type
+        )
+
 
 # Example Usage
 if __name__ == "__main__":
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Callable, dict, type
+from typing import Callable
 
 from dependency_injector.wiring import Provide, inject
 
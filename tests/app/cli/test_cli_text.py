@@ -0,0 +1,102 @@
+import importlib
+import json
+from unittest import mock
+
+import pytest
+from click.testing import CliRunner
+from dependency_injector import providers
+
+from src.app.modules.text_handler import TextHandler
+from src.app.utils.file_manager import FileUtilityFacade
+from src.infrastructure.app.app_container import AppContainer
+
+
+class FakeSegmenter:
+    def process(self, text):
+        return [f"{part.strip()}." for part in text.split(".") if part.strip()]
+
+
+class FakeTokenizer:
+    def process(self, text):
+        return text.split()
+
+
+class FakeNERProcessor:
+    def process_many(self, texts):
+        return [[{"text_processing": "Ada", "label": "PERSON"}] for _ in texts]
+
+
+class JsonSaver:
+    def save_to_json(self, data, filepath):
+        with open(filepath, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+
+
+@pytest.fixture
+def cli_text():
+    """
+    Load cli_text with its commands wired to a real TextHandler and
+    FileUtilityFacade. The commands are built on import, so the container is
+    wired before the module is (re)loaded.
+    """
+    logger = mock.MagicMock()
+    tracker = mock.MagicMock()
+    text_handler = TextHandler(
+        logger=logger,
+        segmenter=FakeSegmenter(),
+        tokenizer=FakeTokenizer(),
+        ner_processor=FakeNERProcessor(),
+        saver=JsonSaver(),
+    )
+    container = AppContainer()
+    container.logger.override(providers.Object(logger))
+    container.performance_tracker.override(providers.Object(tracker))
+    container.text_handler.override(providers.Object(text_handler))
+    container.file_utility.override(
+        providers.Object(FileUtilityFacade(logger=logger, tracker=tracker))
+    )
+    container.wire(modules=["src.app.cli.commands.base_command"])
+    yield importlib.reload(importlib.import_module("src.app.cli.cli_text"))
+    container.unwire()
+
+
+def test_streaming_chain_loads_processes_and_saves(cli_text, tmp_path):
+    input_dir = tmp_path / "raw"
+    input_dir.mkdir()
+    (input_dir / "a.txt").write_text("Ada wrote code. It ran.")
+    (input_dir / "b.txt").write_text("Ada met Babbage.")
+    output_dir = tmp_path / "out"
+
+    result = CliRunner().invoke(
+        cli_text.cli,
+        [
+            "load", "--input-dir", str(input_dir), "--stream",
+            "process", "--async_tasks", "segmentation,ner",
+            "save", "--output-dir", str(output_dir), "--format", "json",
+        ],
+    )  # fmt: skip
+
+    assert result.exit_code == 0, result.output
+    assert "Streamed 2 files" in result.output
+    saved = json.loads((output_dir / "a.json").read_text())
+    assert saved["sentences"] == ["Ada wrote code.", "It ran."]
+    assert saved["entities"] == [[{"text_processing": "Ada", "label": "PERSON"}]] * 2
+    assert "tokens" not in saved
+
+
+def test_parquet_requires_streaming(cli_text, tmp_path):
+    input_dir = tmp_path / "raw"
+    input_dir.mkdir()
+    (input_dir / "a.txt").write_text("Ada wrote code.")
+
+    result = CliRunner().invoke(
+        cli_text.cli,
+        [
+            "load", "--input-dir", str(input_dir),
+            "save", "--output-dir", str(tmp_path / "out"), "--format", "parquet",
+        ],
+    )  # fmt: skip
+
+    assert result.exit_code != 0
+    assert "parquet output requires 'load --stream'" in result.output
+    assert not (tmp_path / "out").exists()
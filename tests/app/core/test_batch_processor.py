@@ -0,0 +1,146 @@
+import itertools
+import logging
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from src.app.core.batch_processor import EXECUTORS, BatchProcessor
+
+
+class Squarer(BatchProcessor):
+    """Squares items; negative items fail. Module-level so workers can unpickle it."""
+
+    def __init__(self, delays=None, **kwargs):
+        super().__init__(
+            logger=logging.getLogger("tests"), perf_tracker=mock.MagicMock(), **kwargs
+        )
+        self.delays = delays or {}
+
+    def process_item(self, item):
+        time.sleep(self.delays.get(item, 0))
+        if item < 0:
+            raise ValueError(f"negative item {item}")
+        return item * item
+
+
+class ConcurrencyProbe(Squarer):
+    """Records how many items run at once."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.probe_lock = threading.Lock()
+        self.running = self.max_running = 0
+
+    def process_item(self, item):
+        with self.probe_lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            time.sleep(0.01)
+            return super().process_item(item)
+        finally:
+            with self.probe_lock:
+                self.running -= 1
+
+
+@pytest.fixture
+def make_processor():
+    processors = []
+
+    def make(cls=Squarer, **kwargs):
+        processor = cls(**kwargs)
+        processors.append(processor)
+        return processor
+
+    yield make
+    for processor in processors:
+        processor.close()
+
+
+@pytest.mark.parametrize("executor", EXECUTORS)
+def test_every_backend_returns_results_in_input_order(make_processor, executor):
+    processor = make_processor(batch_size=2, chunksize=2, executor=executor)
+
+    assert processor.process_batch([1, 2, -3, 4, 5]) == [1, 4, None, 16, 25]
+
+
+@pytest.mark.parametrize("executor", EXECUTORS)
+def test_a_failed_item_does_not_discard_the_others(make_processor, executor):
+    processor = make_processor(batch_size=2, chunksize=3, executor=executor)
+    processor.logger = mock.Mock()
+
+    results = dict(processor.process_stream([-1, 2, 3, -4], executor=executor))
+
+    assert results == {-1: None, 2: 4, 3: 9, -4: None}
+    failures = [call.args[0] for call in processor.logger.error.call_args_list]
+    assert failures == [
+        "Error processing item -1: negative item -1",
+        "Error processing item -4: negative item -4",
+    ]
+
+
+def test_threads_run_items_concurrently(make_processor):
+    processor = make_processor(ConcurrencyProbe, batch_size=4, use_threads=True)
+
+    processor.process_batch(range(16))
+
+    assert processor.max_running == 4
+
+
+def test_serialize_items_runs_one_item_at_a_time(make_processor):
+    processor = make_processor(
+        ConcurrencyProbe, batch_size=4, use_threads=True, serialize_items=True
+    )
+
+    processor.process_batch(range(8))
+
+    assert processor.max_running == 1
+
+
+@pytest.mark.parametrize("executor", ["threads", "processes"])
+def test_stream_keeps_at_most_max_in_flight_items_pulled(make_processor, executor):
+    processor = make_processor(batch_size=2, chunksize=2, executor=executor)
+    pulled = 0
+
+    def endless():
+        nonlocal pulled
+        for item in itertools.count():
+            pulled += 1
+            yield item
+
+    stream = processor.process_stream(endless(), max_in_flight=4)
+    for index, (item, result) in enumerate(itertools.islice(stream, 40)):
+        assert result == item * item
+        # Items pulled from the source and not yet handed back, this one included.
+        assert pulled - index <= 4
+
+
+def test_stream_yields_in_completion_or_input_order(make_processor):
+    # Earlier items are slower, so they finish last.
+    delays = {item: 0.02 * (4 - item) for item in range(5)}
+    processor = make_processor(batch_size=5, use_threads=True, delays=delays)
+
+    unordered = [item for item, _ in processor.process_stream(range(5))]
+    ordered = [item for item, _ in processor.process_stream(range(5), ordered=True)]
+
+    assert unordered == [4, 3, 2, 1, 0]
+    assert ordered == [0, 1, 2, 3, 4]
+
+
+def test_stream_caps_tasks_at_the_controller_limit(make_processor):
+    controller = mock.Mock(limit=2)
+    processor = make_processor(
+        ConcurrencyProbe,
+        batch_size=8,
+        use_threads=True,
+        concurrency_controller=controller,
+    )
+
+    results = [result for _, result in processor.process_stream(range(12))]
+
+    assert sorted(results) == [item * item for item in range(12)]
+    assert processor.max_running == 2
+    completed = sum(call.args[0] for call in controller.record_completion.mock_calls)
+    assert completed == 12
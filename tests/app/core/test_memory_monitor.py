@@ -0,0 +1,48 @@
+import os
+from unittest import mock
+
+import pytest
+
+from src.app.core.memory_monitor import (
+    MemoryMonitor,
+    ProcessMemorySample,
+    read_task_labels,
+    task_scope,
+)
+
+
+@pytest.fixture
+def monitor(tmp_path):
+    return MemoryMonitor(
+        task_label_dir=str(tmp_path),
+        logger=mock.Mock(),
+        perf_tracker=mock.MagicMock(),
+    )
+
+
+def test_concurrent_tasks_in_one_process_each_get_a_peak(monitor):
+    label_dir = monitor.task_label_dir
+    with task_scope("a.wav", label_dir), task_scope("b | c\n.wav", label_dir):
+        assert read_task_labels(os.getpid(), label_dir) == ("a.wav", "b | c .wav")
+        (sample,) = [s for s in monitor.sample_processes() if s.pid == os.getpid()]
+    assert read_task_labels(os.getpid(), label_dir) == ()
+
+    peaks = {peak.task: peak for peak in monitor.top_offenders()}
+    assert set(peaks) == {"a.wav", "b | c .wav"}
+    for peak in peaks.values():
+        assert (peak.peak_rss, peak.pid, peak.samples) == (sample.rss, sample.pid, 1)
+
+
+def test_each_task_keeps_its_own_peak(monitor):
+    monitor._record_peaks(
+        [
+            ProcessMemorySample(pid=10, rss=100, uss=60, tasks=("a", "b")),
+            ProcessMemorySample(pid=11, rss=500, uss=None, tasks=()),
+        ]
+    )
+    monitor._record_peaks([ProcessMemorySample(pid=12, rss=300, uss=200, tasks=("b",))])
+
+    assert [tuple(peak) for peak in monitor.top_offenders()] == [
+        ("b", 300, 200, 12, 2),
+        ("a", 100, 60, 10, 1),
+    ]
@@ -0,0 +1,106 @@
+import logging
+import threading
+from functools import partial
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from src.app.core.batch_processor import FunctionBatchProcessor
+from src.app.modules.pipeline_manager import PipelineManager
+
+LOGGER = logging.getLogger("tests")
+
+
+class FakeConfig:
+    def __init__(self, **settings):
+        self.settings = settings
+
+    def get(self, name):
+        if name not in self.settings:
+            raise ValueError(f"Item '{name}' is not registered.")
+        return self.settings[name]
+
+
+class ConcurrencyProbe:
+    """Blocks until `parties` calls run at once, and records the most seen."""
+
+    def __init__(self, parties):
+        self.barrier = threading.Barrier(parties, timeout=5)
+        self.lock = threading.Lock()
+        self.running = self.max_running = 0
+
+    def __call__(self, item):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            self.barrier.wait()
+        finally:
+            with self.lock:
+                self.running -= 1
+        return item * 2
+
+
+@pytest.fixture
+def manager():
+    tracker = mock.MagicMock()
+    manager = PipelineManager(
+        config_manager=FakeConfig(batch_size=8),
+        logger=LOGGER,
+        performance_tracker=tracker,
+        memory_monitor=mock.Mock(spec=["start", "stop"]),
+        batch_processor_factory=partial(
+            FunctionBatchProcessor, logger=LOGGER, perf_tracker=tracker
+        ),
+    )
+    yield manager
+    manager.close()
+
+
+def memory(percent):
+    return SimpleNamespace(percent=percent)
+
+
+def test_monitor_is_started_and_drives_the_controller(manager):
+    manager.memory_monitor.start.assert_called_once()
+    assert manager.concurrency_controller.limit == 8
+
+    manager.memory_monitor.action_on_high_usage(memory(95))
+
+    assert manager.concurrency_controller.limit == 4
+
+
+def test_controller_limit_caps_tasks_in_flight(manager):
+    manager.memory_monitor.action_on_high_usage(memory(95))
+    probe = ConcurrencyProbe(parties=4)
+
+    results = manager.process_batch(probe, range(12))
+
+    assert results == [item * 2 for item in range(12)]
+    assert probe.max_running == 4
+
+    # Items completed since the last sample, so a healthy sample adds one.
+    manager.memory_monitor.action_on_normal_usage(memory(50))
+    assert manager.concurrency_controller.limit == 5
+    manager.performance_tracker.log_metric.assert_any_call("Concurrency limit", 5)
+
+    probe = ConcurrencyProbe(parties=5)
+    streamed = dict(manager.process_stream(probe, range(10)))
+
+    assert streamed == {item: item * 2 for item in range(10)}
+    assert probe.max_running == 5
+
+
+def test_missing_settings_use_defaults():
+    manager = PipelineManager(
+        config_manager=FakeConfig(),
+        logger=LOGGER,
+        performance_tracker=mock.MagicMock(),
+        memory_monitor=mock.Mock(spec=["start", "stop"]),
+        batch_processor_factory=FunctionBatchProcessor,
+    )
+
+    assert manager.batch_size == 5
+    assert manager.executor == "threads"
+    assert manager.concurrency_controller.max_limit == 5
@@ -0,0 +1,158 @@
+from contextlib import contextmanager
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from src.app.modules.transcription_model_loader import (
+    DEFAULT_WARMUP_MODELS,
+    ModelLoader,
+)
+
+
+class FakeModel:
+    def __init__(self, name):
+        self.name = name
+
+    def transcribe(self, audio, **kwargs):
+        return {"model": self.name, "audio": audio}
+
+
+class FakeVad:
+    """Marks every non-zero sample as speech."""
+
+    def preprocess_audio(self, audio):
+        return audio
+
+    def __call__(self, inputs):
+        return np.flatnonzero(inputs["waveform"])
+
+    @staticmethod
+    def merge_chunks(speech, chunk_size, onset, offset):
+        if not speech.size:
+            return []
+        breaks = np.flatnonzero(np.diff(speech) > 1)
+        starts = np.concatenate(([speech[0]], speech[breaks + 1]))
+        ends = np.concatenate((speech[breaks], [speech[-1]])) + 1
+        return [
+            {"start": start / 16000, "end": end / 16000}
+            for start, end in zip(starts, ends, strict=True)
+        ]
+
+
+class FakeWhisperXPipeline:
+    """Transcribes a chunk as "<language>:<samples>"; positive audio is "en"."""
+
+    _vad_params = {"vad_onset": 0.5, "vad_offset": 0.36}
+
+    def __init__(self):
+        self.vad_model = FakeVad()
+        self.language = None
+
+    def detect_language(self, audio):
+        return "en" if audio.max() > 0 else "fr"
+
+    def __call__(self, inputs, batch_size):
+        for item in inputs:
+            yield {"text": f"{self.language}:{len(item['inputs'])}"}
+
+
+class FakeRegistry:
+    def __init__(self, failing=(), model=None):
+        self.factories = {}
+        self.preloaded = []
+        self.failing = set(failing)
+        self.model = model
+
+    def has_model_factory(self, name):
+        return name in self.factories
+
+    def register_model_factory(self, name, factory):
+        self.factories[name] = factory
+
+    def preload_model(self, name, size, device, compute_type):
+        if name in self.failing:
+            raise RuntimeError(f"{name} unavailable")
+        self.preloaded.append((name, size))
+
+    @contextmanager
+    def lease_model(self, name, size, device, compute_type):
+        yield self.model or FakeModel(name)
+
+
+def make_loader(registry):
+    return ModelLoader(
+        logger=mock.MagicMock(),
+        perf_tracker=mock.MagicMock(),
+        model_registry=registry,
+        config_registry=None,
+    )
+
+
+def test_worker_warm_up_loads_only_the_primary_model():
+    registry = FakeRegistry()
+    loader = make_loader(registry)
+
+    loader.start_warmup(DEFAULT_WARMUP_MODELS)
+
+    assert loader.wait_for_model("whisperx", timeout=5)
+    assert registry.preloaded == [("whisperx", "base")]
+
+
+def test_whisper_fallback_is_loaded_on_first_use():
+    registry = FakeRegistry(failing={"whisperx"})
+    loader = make_loader(registry)
+    loader.start_warmup(DEFAULT_WARMUP_MODELS)
+
+    result = loader.transcribe("clip.wav")
+
+    assert result == {"model": "whisper", "audio": "clip.wav"}
+    assert registry.preloaded == [("whisper", "base")]
+
+
+def test_load_models_tracks_through_the_injected_tracker():
+    registry = FakeRegistry(failing={"whisperx", "whisper"})
+    loader = make_loader(registry)
+
+    with pytest.raises(ValueError, match="Could not load any transcription model"):
+        loader.load_models()
+
+    calls = loader.perf_tracker.track_execution.call_args_list
+    tracked = [call.args[0] for call in calls]
+    assert tracked == ["Load transcription models", "Load fallback Whisper model"]
+
+
+def speech(seconds, value):
+    return np.full(int(seconds * 16000), value, dtype=np.float32)
+
+
+def test_transcribe_batch_uses_vad_chunks_and_per_input_language():
+    pipeline = FakeWhisperXPipeline()
+    loader = make_loader(FakeRegistry(model=pipeline))
+    loader.loaded_models.add("whisperx")
+    english = np.concatenate(
+        [speech(1, 0), speech(2, 0.5), speech(1, 0), speech(1.5, 0.5)]
+    )
+    french = speech(3, -0.5)
+    silent = speech(2, 0)
+
+    def prepare(model, language):
+        model.language = language
+
+    with mock.patch.object(loader, "_prepare_batch_tokenizer", side_effect=prepare):
+        results = loader.transcribe_batch([english, french, silent], batch_size=4)
+
+    assert results == [
+        {
+            "language": "en",
+            "segments": [
+                {"text": "en:32000", "start": 1.0, "end": 3.0},
+                {"text": "en:24000", "start": 4.0, "end": 5.5},
+            ],
+        },
+        {
+            "language": "fr",
+            "segments": [{"text": "fr:48000", "start": 0.0, "end": 3.0}],
+        },
+        {"language": None, "segments": []},
+    ]
@@ -0,0 +1,32 @@
+"""Synthetic audio shared by the audio processing tests."""
+
+import numpy as np
+from pydub import AudioSegment
+
+
+def make_audio(frame_rate, parts, channels=1, seed=0):
+    """
+    Build 16-bit audio from `(duration_ms, amplitude)` parts of Gaussian
+    noise; an amplitude near 0 is silence, a few thousand is "speech".
+    """
+    rng = np.random.default_rng(seed)
+    blocks = [
+        (rng.standard_normal((ms * frame_rate // 1000, channels)) * amplitude)
+        .clip(-32768, 32767)
+        .astype(np.int16)
+        for ms, amplitude in parts
+    ]
+    return AudioSegment(
+        np.concatenate(blocks).tobytes(),
+        frame_rate=frame_rate,
+        sample_width=2,
+        channels=channels,
+    )
+
+
+def stream_frames(audio, frame_samples):
+    """Yield `audio` as consecutive frames of `frame_samples` samples."""
+    total = int(audio.frame_count())
+    for start in range(0, total, frame_samples):
+        yield audio.get_sample_slice(start, min(start + frame_samples, total))
+
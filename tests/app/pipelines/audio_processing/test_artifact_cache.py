@@ -0,0 +1,63 @@
+import logging
+import os
+
+import pytest
+
+from src.app.pipelines.audio_processing.artifact_cache import AudioArtifactCache
+
+PARAMS = {"method": "peak", "target_dbfs": -20.0, "streaming": False}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return AudioArtifactCache(
+        str(tmp_path / "cache"), max_bytes=1024**2, logger=logging.getLogger("tests")
+    )
+
+
+@pytest.fixture
+def make_input(tmp_path):
+    def make(name, content=b"RIFF audio"):
+        path = tmp_path / name
+        path.write_bytes(content)
+        return str(path)
+
+    return make
+
+
+def test_identical_contents_share_a_key_whatever_the_path(cache, make_input):
+    original = make_input("talk.wav")
+    renamed = make_input("talk (1).wav")
+
+    assert cache.make_key(original, "AudioNormalizer", PARAMS) == cache.make_key(
+        renamed, "AudioNormalizer", dict(reversed(PARAMS.items()))
+    )
+
+
+@pytest.mark.parametrize(
+    "processor, params",
+    [
+        ("AudioTrimmer", PARAMS),
+        ("AudioNormalizer", {**PARAMS, "streaming": True}),
+        ("AudioNormalizer", {**PARAMS, "engine": "ffmpeg"}),
+        ("AudioNormalizer", {**PARAMS, "format": "mp3"}),
+    ],
+)
+def test_processor_and_every_param_are_part_of_the_key(
+    cache, make_input, processor, params
+):
+    input_file = make_input("talk.wav")
+
+    assert cache.make_key(input_file, processor, params) != cache.make_key(
+        input_file, "AudioNormalizer", PARAMS
+    )
+
+
+def test_rewritten_input_gets_a_new_key(cache, make_input):
+    input_file = make_input("talk.wav")
+    before = cache.make_key(input_file, "AudioNormalizer", PARAMS)
+
+    make_input("talk.wav", b"RIFF other audio")
+    os.utime(input_file, ns=(0, 0))  # Defeat the memo even on coarse clocks
+
+    assert cache.make_key(input_file, "AudioNormalizer", PARAMS) != before
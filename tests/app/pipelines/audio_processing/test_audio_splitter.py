@@ -0,0 +1,83 @@
+import itertools
+from unittest import mock
+
+import pytest
+from synthetic_audio import make_audio, stream_frames
+
+from src.app.pipelines.audio_processing.audio_splitter import AudioSplitter
+
+SILENCE_MS = 400
+PERIOD_MS = 30_000
+
+
+def speech_with_silences(frame_rate, periods=6):
+    """
+    Speech with a SILENCE_MS silence centred on every PERIOD_MS boundary.
+    The last period is a second short, so no cut is due after the last
+    silence.
+    """
+    half = SILENCE_MS // 2
+    parts = [(PERIOD_MS - half, 3000)]
+    for _ in range(periods - 1):
+        parts += [(SILENCE_MS, 1), (PERIOD_MS - SILENCE_MS, 3000)]
+    parts[-1] = (PERIOD_MS - half - 1000, 3000)
+    return make_audio(frame_rate, parts)
+
+
+def silences(periods=6):
+    return [
+        (k * PERIOD_MS - SILENCE_MS // 2, k * PERIOD_MS + SILENCE_MS // 2)
+        for k in range(1, periods)
+    ]
+
+
+@pytest.fixture
+def splitter(tmp_path):
+    return AudioSplitter(output_directory=str(tmp_path), logger=mock.MagicMock())
+
+
+def stream_cuts(splitter, audio, frame_samples, chunk_ms, tolerance_ms=2000):
+    with mock.patch.object(
+        splitter, "stream_audio", return_value=stream_frames(audio, frame_samples)
+    ):
+        return list(
+            splitter._stream_cut_points("in.wav", chunk_ms, "silence", tolerance_ms)
+        )
+
+
+@pytest.mark.parametrize("frame_rate", [22050, 44100])
+def test_silence_cuts_fall_inside_silences(splitter, frame_rate):
+    audio = speech_with_silences(frame_rate)
+
+    chunks = splitter.apply(audio, PERIOD_MS, split_mode="silence")
+
+    cuts = list(itertools.accumulate(len(chunk) for chunk in chunks))[:-1]
+    assert len(cuts) == len(silences())
+    for cut, (start, end) in zip(cuts, silences(), strict=True):
+        assert start <= cut <= end
+    assert sum(len(chunk) for chunk in chunks) == len(audio)
+
+
+@pytest.mark.parametrize("frame_rate", [22050, 44100])
+@pytest.mark.parametrize("frame_ms", [1000, 37])
+def test_streamed_cuts_match_in_memory_cuts(splitter, frame_rate, frame_ms):
+    audio = speech_with_silences(frame_rate)
+    chunks = splitter.apply(audio, PERIOD_MS, split_mode="silence")
+    expected = list(itertools.accumulate(len(chunk) for chunk in chunks))[:-1]
+
+    cuts = stream_cuts(splitter, audio, frame_rate * frame_ms // 1000, PERIOD_MS)
+
+    assert cuts == expected
+
+
+def test_cuts_stay_inside_the_audio(splitter):
+    # The nominal cut is 20 ms before the end, inside the tolerance, and the
+    # quietest window lies in the trailing silence.
+    audio = make_audio(22050, [(9_900, 3000), (120, 1)])
+
+    chunks = splitter.apply(audio, 9_000, split_mode="silence", tolerance_ms=2000)
+    cuts = stream_cuts(splitter, audio, 22050, 9_000)
+
+    assert all(len(chunk) > 0 for chunk in chunks)
+    assert sum(len(chunk) for chunk in chunks) == len(audio)
+    assert all(0 < cut < len(audio) for cut in cuts)
@@ -0,0 +1,109 @@
+import tracemalloc
+from unittest import mock
+
+import numpy as np
+import pytest
+from pydub import AudioSegment
+from synthetic_audio import make_audio, stream_frames
+
+from src.app.pipelines.audio_processing.audio_analysis import (
+    detect_edge_silence,
+    detect_edge_silence_stream,
+    segment_to_array,
+)
+from src.app.pipelines.audio_processing.audio_trimmer import AudioTrimmer
+
+# (frame rate, channels, [(duration ms, amplitude), ...])
+CASES = {
+    "edges": (
+        16000, 1, [(1500, 5), (2000, 3000), (400, 5), (1800, 3000), (2300, 5)]
+    ),
+    "long interior silence": (
+        16000, 1, [(1200, 2), (900, 3000), (2500, 2), (800, 3000), (1600, 2)]
+    ),
+    "stereo, no leading silence": (44100, 2, [(3000, 8000), (1777, 3)]),
+    "no trailing silence": (22050, 1, [(2200, 4), (2600, 4000)]),
+    "short burst": (8000, 1, [(2500, 1), (700, 6000), (2500, 1)]),
+}  # fmt: skip
+
+FRAME_MS = [1000, 37, 250]
+
+
+@pytest.fixture
+def trimmer(tmp_path):
+    return AudioTrimmer(output_directory=str(tmp_path), logger=mock.MagicMock())
+
+
+def trim_streamed(trimmer, audio, frame_samples):
+    """Run the streaming path over in-memory frames and join its output."""
+    def stream_audio(input_file):
+        return stream_frames(audio, frame_samples)
+
+    with mock.patch.object(
+        trimmer, "stream_audio", side_effect=stream_audio
+    ), mock.patch.object(
+        trimmer, "save_audio_stream", side_effect=lambda frames, _: list(frames)
+    ):
+        pieces = trimmer._trim_stream("in.wav", "out.wav", silence_thresh=-40)
+    return sum(pieces[1:], pieces[0])
+
+
+@pytest.mark.parametrize("case", CASES)
+@pytest.mark.parametrize("frame_ms", FRAME_MS)
+def test_streamed_detection_matches_in_memory(case, frame_ms):
+    frame_rate, channels, parts = CASES[case]
+    audio = make_audio(frame_rate, parts, channels)
+
+    region, frames = detect_edge_silence_stream(
+        stream_frames(audio, frame_rate * frame_ms // 1000), silence_thresh=-40
+    )
+
+    expected = detect_edge_silence(
+        segment_to_array(audio), frame_rate, audio.sample_width, silence_thresh=-40
+    )
+    assert region == expected
+    assert frames == audio.frame_count()
+
+
+@pytest.mark.parametrize("case", CASES)
+@pytest.mark.parametrize("frame_ms", FRAME_MS)
+def test_streamed_trim_matches_in_memory_trim(trimmer, case, frame_ms):
+    frame_rate, channels, parts = CASES[case]
+    audio = make_audio(frame_rate, parts, channels)
+
+    streamed = trim_streamed(trimmer, audio, frame_rate * frame_ms // 1000)
+
+    assert streamed.raw_data == trimmer.apply(audio, -40, engine="numpy").raw_data
+    if case != "long interior silence":
+        # strip_silence also drops interior silences of silence_len or more.
+        assert len(streamed) == len(trimmer.apply(audio, -40, engine="pydub"))
+
+
+def test_silent_input_trims_to_empty_audio_on_both_paths(trimmer):
+    audio = make_audio(16000, [(3000, 1)])
+
+    streamed = trim_streamed(trimmer, audio, 16000)
+
+    assert len(streamed) == 0
+    assert len(trimmer.apply(audio, -40, engine="numpy")) == 0
+    assert len(trimmer.apply(audio, -40, engine="pydub")) == 0
+
+
+def test_streamed_detection_memory_does_not_grow_with_length():
+    frame_rate = 8000
+    second = (np.random.default_rng(0).standard_normal(frame_rate) * 3000).astype(
+        np.int16
+    )
+    frame = AudioSegment(
+        second.tobytes(), frame_rate=frame_rate, sample_width=2, channels=1
+    )
+
+    def peak_bytes(seconds):
+        tracemalloc.start()
+        detect_edge_silence_stream((frame for _ in range(seconds)), -40)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak
+
+    # A per-millisecond array for the whole input would add 8 bytes per ms.
+    assert peak_bytes(1800) < peak_bytes(60) + 1_000_000
@@ -0,0 +1,41 @@
+import logging
+import os
+
+from synthetic_audio import make_audio
+
+from src.app.pipelines.audio_processing import AudioProcessorBase
+from src.app.pipelines.audio_processing.fused_audio_pipeline import (
+    FusedAudioPipeline,
+)
+
+LOGGER = logging.getLogger("tests")
+
+
+class RawEncoder(AudioProcessorBase):
+    """Leaves the audio unchanged and asks for headerless PCM output."""
+
+    def process(self, input_file, output_file):
+        raise NotImplementedError
+
+    def apply(self, audio):
+        return audio
+
+    def output_format(self, **kwargs):
+        return "raw"
+
+
+def test_stage_output_format_does_not_leak_into_the_pipeline(tmp_path):
+    audio = make_audio(16000, [(1000, 3000)])
+    input_file = str(tmp_path / "input.wav")
+    audio.export(input_file, format="wav")
+    pipeline = FusedAudioPipeline(
+        [RawEncoder(str(tmp_path), LOGGER)], str(tmp_path / "out"), LOGGER
+    )
+
+    raw_file = pipeline.process(input_file, "fused.raw")
+
+    assert os.path.getsize(raw_file) == len(audio.raw_data)
+    assert pipeline.format == "wav"
+    # Later saves by the same instance still use its own format.
+    with open(pipeline.save_audio(audio, "plain.wav"), "rb") as f:
+        assert f.read(4) == b"RIFF"
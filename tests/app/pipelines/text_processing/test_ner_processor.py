@@ -0,0 +1,71 @@
+import logging
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+import spacy
+from spacy.language import Language
+
+from src.app.pipelines.text_processing import ner_processor
+from src.app.pipelines.text_processing.ner_processor import NERProcessor, ner_pipes
+
+CALLS = []
+
+
+@Language.component("record_call")
+def record_call(doc):
+    CALLS.append(doc.text)
+    return doc
+
+
+@pytest.fixture
+def nlp(monkeypatch):
+    # Stand-ins for the tagger's tok2vec and the tagger; neither feeds NER.
+    nlp = spacy.blank("en")
+    nlp.add_pipe("record_call", name="tok2vec")
+    nlp.add_pipe("record_call", name="tagger")
+    ruler = nlp.add_pipe("entity_ruler")
+    ruler.add_patterns([{"label": "ORG", "pattern": "Acme"}])
+    monkeypatch.setattr(ner_processor.spacy, "load", lambda name: nlp)
+    ner_processor.load_ner_model.cache_clear()
+    CALLS.clear()
+    yield nlp
+    ner_processor.load_ner_model.cache_clear()
+
+
+def make_processor():
+    return NERProcessor(
+        "stub_model", logger=logging.getLogger("tests"), tracker=mock.MagicMock()
+    )
+
+
+def test_only_entity_components_run_and_the_cached_model_is_untouched(nlp):
+    processor = make_processor()
+
+    assert processor.disabled_pipes == ["tok2vec", "tagger"]
+    assert processor.process("Acme hires.") == [
+        {"text_processing": "Acme", "label": "ORG"}
+    ]
+    assert processor.process_many(["Acme", "", "no entities"]) == [
+        [{"text_processing": "Acme", "label": "ORG"}],
+        [],
+        [],
+    ]
+    assert CALLS == []
+    assert nlp.disabled == []
+
+    # Other users of the shared pipeline still get every component.
+    nlp("Acme")
+    assert CALLS == ["Acme", "Acme"]
+
+
+def test_embedding_layers_entity_components_listen_to_are_kept():
+    pipeline = [
+        ("transformer", SimpleNamespace(listening_components=["tagger", "ner"])),
+        ("tok2vec", SimpleNamespace(listening_components=["tagger", "parser"])),
+        ("tagger", object()),
+        ("parser", object()),
+        ("ner", object()),
+    ]
+
+    assert ner_pipes(SimpleNamespace(pipeline=pipeline)) == ["transformer", "ner"]
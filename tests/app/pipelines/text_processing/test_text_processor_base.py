@@ -0,0 +1,50 @@
+import logging
+from unittest import mock
+
+import pytest
+
+from src.app.pipelines.text_processing.text_processor_base import TextProcessorBase
+
+
+class UpperCaser(TextProcessorBase):
+    def process(self, text: str):
+        return text.upper()
+
+
+class RecordingPool:
+    def __init__(self):
+        self.chunksizes = []
+
+    def map(self, func, items, chunksize):
+        self.chunksizes.append(chunksize)
+        return map(func, items)
+
+
+@pytest.fixture
+def processor():
+    processor = UpperCaser(logger=logging.getLogger("tests"), tracker=mock.Mock())
+    processor.pool = RecordingPool()
+    processor._get_pool = lambda workers, initializer: processor.pool
+    return processor
+
+
+@pytest.mark.parametrize(
+    "texts, workers, expected",
+    [(1000, 4, 63), (16, 4, 1), (3, 8, 1), (10_000, 8, 313)],
+)
+def test_chunksize_is_derived_from_valid_texts_and_workers(
+    processor, texts, workers, expected
+):
+    # Invalid texts are not sent to the pool and do not count.
+    inputs = ["text"] * texts + [""] * 500
+
+    results = processor.map_in_processes(str.upper, inputs, workers=workers)
+
+    assert processor.pool.chunksizes == [expected]
+    assert results == ["TEXT"] * texts + [[]] * 500
+
+
+def test_explicit_chunksize_is_kept(processor):
+    processor.map_in_processes(str.upper, ["text"] * 1000, workers=4, chunksize=7)
+
+    assert processor.pool.chunksizes == [7]
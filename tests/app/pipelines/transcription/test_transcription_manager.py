@@ -0,0 +1,232 @@
+import json
+import logging
+import os
+from unittest import mock
+
+import numpy as np
+import pytest
+from dependency_injector import providers
+
+from src.app.modules.model_size_router import ModelSizeRouter
+from src.app.pipelines.transcription import (
+    basepipeline,
+    transcription_pipeline_manager,
+    windowed_transcription,
+)
+from src.app.pipelines.transcription.transcription_pipeline_manager import (
+    DEFAULT_RESUME_WINDOW_SECONDS,
+    TranscriptionManager,
+)
+from src.app.pipelines.transcription.transcription_saver import TranscriptionSaver
+from src.infrastructure.app.app_container import AppContainer
+
+DURATION = 100.0
+WINDOW = 20.0
+OVERLAP = 2.0
+
+
+class CrashingTranscriber:
+    """Emits one segment per window; raises for windows starting at `crash_at`."""
+
+    def __init__(self, crash_at=None):
+        self.crash_at = crash_at
+        self.window_starts = []
+        self.model_sizes = []
+
+    def transcribe(self, audio, model_size=None):
+        start = float(audio[0])
+        self.model_sizes.append(model_size)
+        if start == self.crash_at:
+            raise RuntimeError("worker lost")
+        self.window_starts.append(start)
+        return {
+            "segments": [{"start": 5.0, "end": 6.0, "text": f"window {start:g}"}],
+            "language": "en",
+        }
+
+
+@pytest.fixture(autouse=True)
+def container():
+    container = AppContainer()
+    container.logger.override(providers.Object(logging.getLogger("tests")))
+    container.performance_tracker.override(providers.Object(mock.MagicMock()))
+    container.wire(modules=[basepipeline])
+    yield container
+    container.unwire()
+
+
+@pytest.fixture(autouse=True)
+def fake_decoder(monkeypatch):
+    """Each decoded window is a one-sample buffer holding its start time."""
+    for module in (windowed_transcription, transcription_pipeline_manager):
+        monkeypatch.setattr(module, "mediainfo", lambda path: {"duration": DURATION})
+    monkeypatch.setattr(
+        windowed_transcription,
+        "decode_to_array",
+        lambda path, start_s, duration_s: np.array([start_s], dtype=np.float32),
+    )
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    input_dir, output_dir = tmp_path / "in", tmp_path / "out"
+    input_dir.mkdir()
+    (input_dir / "long.wav").write_bytes(b"original audio")
+    return str(input_dir), str(output_dir)
+
+
+def make_manager(dirs, transcriber, **kwargs):
+    input_dir, output_dir = dirs
+    kwargs.setdefault("window_seconds", WINDOW)
+    kwargs.setdefault("window_overlap_seconds", OVERLAP)
+    return TranscriptionManager(
+        input_dir, output_dir, transcriber, TranscriptionSaver(output_dir), **kwargs
+    )
+
+
+def window_starts():
+    step = WINDOW - OVERLAP
+    return [index * step for index in range(int(DURATION // step) + 1)]
+
+
+def test_retry_resumes_after_last_committed_window(dirs):
+    starts = window_starts()
+    crashed = CrashingTranscriber(crash_at=starts[3])
+    with pytest.raises(RuntimeError):
+        make_manager(dirs, crashed)._process_file("long.wav")
+    assert crashed.window_starts == starts[:3]
+
+    retried = CrashingTranscriber()
+    make_manager(dirs, retried)._process_file("long.wav")
+
+    assert retried.window_starts == starts[3:]
+    output_dir = dirs[1]
+    with open(os.path.join(output_dir, "long.wav.txt")) as f:
+        lines = f.read().splitlines()
+    assert lines == [f"window {start:g}" for start in starts]
+    assert not os.path.exists(os.path.join(output_dir, "long.wav.segments.jsonl"))
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        {"input": b"re-downloaded audio"},
+        {"window_seconds": WINDOW * 2},
+        {"window_overlap_seconds": OVERLAP * 2},
+    ],
+)
+def test_journal_for_other_input_or_options_is_discarded(dirs, change):
+    starts = window_starts()
+    with pytest.raises(RuntimeError):
+        make_manager(dirs, CrashingTranscriber(crash_at=starts[3]))._process_file(
+            "long.wav"
+        )
+
+    change = dict(change)
+    if "input" in change:
+        with open(os.path.join(dirs[0], "long.wav"), "wb") as f:
+            f.write(change.pop("input"))
+    retried = CrashingTranscriber()
+    make_manager(dirs, retried, **change)._process_file("long.wav")
+
+    assert retried.window_starts[0] == 0.0
+
+
+def test_resume_turns_on_windowing(dirs):
+    manager = make_manager(dirs, CrashingTranscriber(), window_seconds=None)
+    assert manager.windowed_transcriber.window_seconds == DEFAULT_RESUME_WINDOW_SECONDS
+
+    manager = make_manager(
+        dirs, CrashingTranscriber(), window_seconds=None, resume=False
+    )
+    assert manager.windowed_transcriber is None
+
+
+def test_torn_journal_tail_is_dropped(dirs):
+    starts = window_starts()
+    with pytest.raises(RuntimeError):
+        make_manager(dirs, CrashingTranscriber(crash_at=starts[3]))._process_file(
+            "long.wav"
+        )
+    journal = os.path.join(dirs[1], "long.wav.segments.jsonl")
+    with open(journal, "a") as f:
+        f.write('{"committed_until": 9')
+
+    retried = CrashingTranscriber()
+    make_manager(dirs, retried)._process_file("long.wav")
+
+    assert retried.window_starts == starts[3:]
+
+
+class BatchTranscriber:
+    def __init__(self):
+        self.calls = []
+
+    def transcribe_batch(self, paths, batch_size, model_size=None):
+        self.calls.append((len(paths), model_size))
+        return [{"segments": [{"text": os.path.basename(p)}]} for p in paths]
+
+
+def make_router(budget=200.0):
+    # large-v3 takes 80s for one file at depth 0; tiny 3s.
+    return ModelSizeRouter(["tiny", "large-v3"], budget, logging.getLogger("tests"))
+
+
+def read_metadata(dirs, file_name):
+    with open(os.path.join(dirs[1], f"{file_name}.meta.json")) as f:
+        return json.load(f)
+
+
+def test_router_requires_queue_depth(dirs):
+    with pytest.raises(ValueError):
+        make_manager(dirs, CrashingTranscriber(), model_router=make_router())
+
+
+@pytest.mark.parametrize("depth, size", [(0, "large-v3"), (2, "tiny")])
+def test_routing_uses_queue_depth_from_provider(dirs, depth, size):
+    transcriber = CrashingTranscriber()
+    make_manager(
+        dirs, transcriber, model_router=make_router(), queue_depth=lambda: depth
+    )._process_file("long.wav")
+
+    assert set(transcriber.model_sizes) == {size}
+    assert read_metadata(dirs, "long.wav") == {"model_size": size}
+
+
+def test_batch_path_is_routed_and_records_model_size(dirs):
+    for name in ("a.wav", "b.wav"):
+        with open(os.path.join(dirs[0], name), "wb") as f:
+            f.write(name.encode())
+    transcriber = BatchTranscriber()
+    make_manager(
+        dirs,
+        transcriber,
+        model_router=make_router(),
+        queue_depth=lambda: 0,
+        short_clip_seconds=DURATION,
+        min_batch_files=2,
+    ).process_files()
+
+    # Three 100s clips share one batch: 240s on large-v3 is over budget.
+    assert transcriber.calls == [(3, "tiny")]
+    for name in ("a.wav", "b.wav", "long.wav"):
+        assert read_metadata(dirs, name) == {"model_size": "tiny"}
+
+
+def test_resume_keeps_journaled_model_size(dirs):
+    starts = window_starts()
+    crashed = CrashingTranscriber(crash_at=starts[3])
+    with pytest.raises(RuntimeError):
+        make_manager(
+            dirs, crashed, model_router=make_router(), queue_depth=lambda: 0
+        )._process_file("long.wav")
+    assert set(crashed.model_sizes) == {"large-v3"}
+
+    # The backlog grew; a fresh file would now be routed to tiny.
+    retried = CrashingTranscriber()
+    make_manager(
+        dirs, retried, model_router=make_router(), queue_depth=lambda: 5
+    )._process_file("long.wav")
+
+    assert set(retried.model_sizes) == {"large-v3"}
+    assert read_metadata(dirs, "long.wav") == {"model_size": "large-v3"}
@@ -0,0 +1,68 @@
+"""
+Shared test setup.
+
+`src.infrastructure.app.app_container` imports the whole task and CLI
+graph, which only imports inside a configured deployment (Celery app,
+Django settings, model backends). Modules under test only use the
+container's providers as `Provide[...]` markers, so when the real
+container cannot be imported a stand-in with the same provider names is
+registered in its place. Tests pass collaborators explicitly or override
+these providers.
+"""
+
+import logging
+import sys
+import types
+
+from dependency_injector import containers, providers
+
+CONTAINER_MODULE = "src.infrastructure.app.app_container"
+
+PROVIDER_NAMES = (
+    "application_logger",
+    "audio_processing_pipeline",
+    "audio_processing_task",
+    "audio_processor",
+    "batch_processor",
+    "concurrency_controller",
+    "concurrency_utilities",
+    "config_data",
+    "configuration_registry",
+    "download_manager",
+    "download_pipeline",
+    "download_task",
+    "downloader",
+    "file_utility",
+    "generic_registry",
+    "logger_observer",
+    "memory_monitor",
+    "model_registry",
+    "ner_processor",
+    "pipeline_component_registry",
+    "struct_logger",
+    "text_handler",
+    "text_processing_pipeline",
+    "text_processing_task",
+    "text_saver",
+    "text_segmenter",
+    "text_tokenizer",
+    "transcription_pipeline",
+    "transcription_task",
+)
+
+
+def _stand_in_container_module() -> types.ModuleType:
+    attributes = {name: providers.Object(None) for name in PROVIDER_NAMES}
+    attributes["logger"] = providers.Object(logging.getLogger("tests"))
+    attributes["performance_tracker"] = providers.Object(None)
+    module = types.ModuleType(CONTAINER_MODULE)
+    module.AppContainer = type(
+        "AppContainer", (containers.DeclarativeContainer,), attributes
+    )
+    return module
+
+
+try:
+    import src.infrastructure.app.app_container  # noqa: F401
+except ImportError:
+    sys.modules[CONTAINER_MODULE] = _stand_in_container_module()
@@ -0,0 +1,144 @@
+import logging
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from src.infrastructure.registries.model_pool import (
+    ModelKey,
+    ModelPool,
+    estimate_model_memory,
+)
+
+SMALL = ModelKey("whisper", "small")
+MEDIUM = ModelKey("whisper", "medium")
+CUSTOM = ModelKey("diarizer", "v1")
+
+
+class RecordingLoader:
+    """Records the pool's state at each load and how many loads overlap."""
+
+    def __init__(self, pool_stats, seconds=0.0):
+        self.pool_stats = pool_stats
+        self.seconds = seconds
+        self.lock = threading.Lock()
+        self.running = self.max_running = 0
+        self.loads = []
+
+    def __call__(self, key):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            self.loads.append((key, self.pool_stats()))
+        time.sleep(self.seconds)
+        with self.lock:
+            self.running -= 1
+        return f"{key.name}/{key.size}"
+
+
+def make_pool(sizes, max_memory_bytes=None, seconds=0.0):
+    loader = RecordingLoader(lambda: pool.stats(), seconds)
+    pool = ModelPool(
+        loader,
+        logging.getLogger("tests"),
+        mock.Mock(),
+        max_memory_bytes=max_memory_bytes,
+        memory_estimator=sizes.get,
+    )
+    return pool, loader
+
+
+def test_room_is_made_for_the_incoming_model_before_it_loads():
+    pool, loader = make_pool({SMALL: 600, MEDIUM: 600}, max_memory_bytes=1000)
+    with pool.lease(SMALL):
+        pass
+
+    with pool.lease(MEDIUM) as model:
+        assert model == "whisper/medium"
+
+    key, stats = loader.loads[-1]
+    assert key == MEDIUM
+    # The idle small model was evicted first, and medium's size reserved.
+    assert str(SMALL) not in stats["instances"]
+    assert stats["memory_bytes"] == 600
+    assert pool.stats()["memory_bytes"] == 600
+
+
+def test_models_that_fit_are_kept():
+    pool, _ = make_pool({SMALL: 400, MEDIUM: 400}, max_memory_bytes=1000)
+    for key in (SMALL, MEDIUM, SMALL):
+        with pool.lease(key):
+            pass
+
+    assert pool.stats()["memory_bytes"] == 800
+    assert pool.hits == 1
+
+
+def test_failed_load_releases_its_reservation():
+    pool = ModelPool(
+        mock.Mock(side_effect=RuntimeError("corrupt checkpoint")),
+        logging.getLogger("tests"),
+        mock.Mock(),
+        memory_estimator={SMALL: 400}.get,
+    )
+    with pytest.raises(RuntimeError), pool.lease(SMALL):
+        pass
+
+    assert pool.stats()["memory_bytes"] == 0
+    assert pool.stats()["instances"] == {}
+
+
+def lease_concurrently(pool, keys):
+    threads = [
+        threading.Thread(target=lambda k=key: pool.lease(k).__enter__())
+        for key in keys
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_measured_loads_run_alone():
+    pool, loader = make_pool({SMALL: 400}, seconds=0.05)
+
+    lease_concurrently(pool, [CUSTOM, SMALL, ModelKey("diarizer", "v2")])
+
+    assert loader.max_running == 1
+
+
+def test_estimated_loads_run_concurrently():
+    pool, loader = make_pool({SMALL: 400, MEDIUM: 400}, seconds=0.05)
+
+    lease_concurrently(pool, [SMALL, MEDIUM])
+
+    assert loader.max_running == 2
+
+
+def test_measurement_is_reused_for_later_loads():
+    pool, _ = make_pool({}, max_memory_bytes=None)
+    with pool.lease(CUSTOM):
+        pass
+    measured = pool._measured_bytes[CUSTOM]
+    pool.idle_timeout = 0
+    with pool.lease(SMALL):
+        pass  # Releasing evicts the idle CUSTOM instance
+
+    with mock.patch.object(pool, "memory_estimator") as estimator, pool.lease(CUSTOM):
+        pass
+    estimator.assert_not_called()
+    assert pool._expected_bytes(CUSTOM) == measured
+
+
+@pytest.mark.parametrize(
+    "key, expected",
+    [
+        (ModelKey("whisperx", "large-v3", compute_type="int8"), 1_550_000_000),
+        (ModelKey("whisper", "tiny.en"), 39_000_000 * 4),
+        (ModelKey("whisperx", "base", compute_type="float16"), 74_000_000 * 2),
+        (ModelKey("diarizer", "v1"), None),
+    ],
+)
+def test_estimate_model_memory(key, expected):
+    assert estimate_model_memory(key) == expected